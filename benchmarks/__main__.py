@@ -0,0 +1,143 @@
+"""
+Offline benchmarks for the dependency resolver.
+
+Usage:
+
+    python -m benchmarks [-u UNIVERSE ...] [--rounds N] [--output results.json]
+    python -m benchmarks --compare baseline.json
+
+Each benchmark resolves a synthetic dependency universe (see universes.py)
+end to end with the Solver and reports the wall time, the peak memory
+and the counters of the resolution. Since the universes are generated
+deterministically, results of different commits can be compared with --compare.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+from pathlib import Path
+from typing import Any
+
+from cleo.io.null_io import NullIO
+
+from benchmarks.universes import UNIVERSES
+from benchmarks.universes import Universe
+from poetry.__version__ import __version__
+from poetry.puzzle.exceptions import SolverProblemError
+from poetry.puzzle.solver import Solver
+from poetry.repositories import RepositoryPool
+from poetry.utils import profiler
+
+
+def solve(universe: Universe) -> tuple[int, dict[str, int]]:
+    solver = Solver(
+        universe.root, RepositoryPool(universe.repositories), [], [], NullIO()
+    )
+    with profiler.profiling() as p:
+        transaction = solver.solve()
+    return len(transaction.get_solved_packages()), p.as_dict()["counters"]
+
+
+def run(universe_name: str, seed: int, rounds: int) -> dict[str, Any]:
+    durations = []
+    packages = 0
+    counters: dict[str, int] = {}
+    for _ in range(rounds):
+        universe = UNIVERSES[universe_name](seed)
+        gc.collect()
+        start = time.perf_counter()
+        try:
+            packages, counters = solve(universe)
+        except SolverProblemError:
+            return {"error": "resolution failed"}
+        durations.append(time.perf_counter() - start)
+
+    # Memory is measured in a separate run because tracing
+    # distorts the wall time considerably.
+    universe = UNIVERSES[universe_name](seed)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        solve(universe)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "packages": packages,
+        "seconds": {"min": min(durations), "median": statistics.median(durations)},
+        "peak_memory": peak_memory,
+        "counters": counters,
+    }
+
+
+def report(results: dict[str, Any], baseline: dict[str, Any] | None) -> None:
+    out = sys.stdout
+    out.write(
+        f"{'universe':<14} {'packages':>8} {'min':>9} {'median':>9} {'peak memory':>13}"
+    )
+    out.write(f" {'vs. baseline':>12}\n" if baseline else "\n")
+    for name, result in results["universes"].items():
+        if "error" in result:
+            out.write(f"{name:<14} {result['error']}\n")
+            continue
+        seconds = result["seconds"]
+        out.write(
+            f"{name:<14} {result['packages']:>8} {seconds['min']:>8.3f}s"
+            f" {seconds['median']:>8.3f}s {result['peak_memory'] / 2**20:>9.1f} MiB"
+        )
+        if baseline:
+            base = baseline["universes"].get(name, {}).get("seconds")
+            if base:
+                out.write(f" {seconds['min'] / base['min']:>11.2f}x")
+        out.write("\n")
+        for counter, value in result["counters"].items():
+            out.write(f"  {counter:<32} {value:>10}\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Benchmark the resolver."
+    )
+    parser.add_argument(
+        "-u",
+        "--universe",
+        action="append",
+        choices=sorted(UNIVERSES),
+        help="The universes to resolve (default: all).",
+    )
+    parser.add_argument("--rounds", type=int, default=3, help="Rounds per universe.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the universes.")
+    parser.add_argument("--output", type=Path, help="Write the results to a file.")
+    parser.add_argument(
+        "--compare", type=Path, help="Compare with the results of a previous run."
+    )
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    results: dict[str, Any] = {
+        "poetry": __version__,
+        "python": platform.python_version(),
+        "seed": args.seed,
+        "universes": {},
+    }
+    for name in args.universe or UNIVERSES:
+        results["universes"][name] = run(name, args.seed, args.rounds)
+
+    report(results, baseline)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,340 @@
+"""
+Synthetic dependency universes for benchmarking the resolver.
+
+Each universe is generated deterministically from a seed and consists of a root
+package and in-memory repositories so that benchmarks neither require network
+access nor depend on the contents of any real package index.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import time
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from packaging.utils import canonicalize_name
+from poetry.core.packages.package import Package
+from poetry.core.packages.project_package import ProjectPackage
+
+from poetry.config.config import Config
+from poetry.factory import Factory
+from poetry.repositories import Repository
+from poetry.repositories.exceptions import PackageNotFoundError
+from poetry.repositories.legacy_repository import LegacyRepository
+from poetry.repositories.link_sources.html import HTMLPage
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+
+    from packaging.utils import NormalizedName
+    from poetry.core.packages.utils.link import Link
+
+    from poetry.repositories.link_sources.base import LinkSource
+
+
+PLATFORMS = ("linux", "darwin", "win32", "cygwin", "aix", "emscripten")
+PYTHON_VERSIONS = ("3.9", "3.10", "3.11", "3.12", "3.13")
+
+
+@dataclass(frozen=True)
+class Universe:
+    name: str
+    description: str
+    root: ProjectPackage
+    repositories: list[Repository]
+
+
+class StubbedRepository(LegacyRepository):
+    """
+    A legacy repository that serves generated pages and metadata files (PEP 658)
+    with an artificial latency per request instead of accessing the network.
+    """
+
+    LATENCY = 0.01
+
+    def __init__(self, name: str, packages: Iterable[Package]) -> None:
+        super().__init__(
+            name, f"https://{name}.invalid/simple", config=Config(), disable_cache=True
+        )
+        self._stubbed_packages: dict[NormalizedName, list[Package]] = defaultdict(list)
+        self._stubbed_files: dict[str, Package] = {}
+        for package in packages:
+            self._stubbed_packages[package.name].append(package)
+            filename = f"{package.name}-{package.version}-py3-none-any.whl"
+            self._stubbed_files[filename] = package
+
+    def _get_page(self, name: NormalizedName) -> LinkSource:
+        time.sleep(self.LATENCY)
+        if name not in self._stubbed_packages:
+            raise PackageNotFoundError(f"Package [{name}] not found.")
+
+        anchors = []
+        for package in self._stubbed_packages[name]:
+            filename = f"{package.name}-{package.version}-py3-none-any.whl"
+            digest = hashlib.sha256(filename.encode()).hexdigest()
+            anchors.append(
+                f'<a href="{self._url}/files/{filename}#sha256={digest}"'
+                f' data-dist-info-metadata="true">{filename}</a>'
+            )
+        return HTMLPage(f"{self._url}/{name}/", "<br>".join(anchors))
+
+    def _get_metadata_file(self, link: Link) -> bytes | None:
+        time.sleep(self.LATENCY)
+        package = self._stubbed_files[link.filename]
+        lines = [
+            "Metadata-Version: 2.1",
+            f"Name: {package.name}",
+            f"Version: {package.version}",
+            *(f"Requires-Dist: {dep.to_pep_508()}" for dep in package.requires),
+        ]
+        return "\n".join(lines).encode()
+
+
+def _root(python_versions: str = "^3.9") -> ProjectPackage:
+    root = ProjectPackage("root", "1.0.0")
+    root.python_versions = python_versions
+    return root
+
+
+def wide(seed: int) -> Universe:
+    """
+    Many direct dependencies with many versions and a few shared
+    transitive dependencies each.
+    """
+    rng = random.Random(seed)
+    repository = Repository("wide")
+    root = _root()
+    direct, shared, versions = 150, 50, 20
+
+    for i in range(shared):
+        for v in range(versions):
+            repository.add_package(Package(f"shared{i}", f"{v}.0.0"))
+
+    for i in range(direct):
+        for v in range(versions):
+            package = Package(f"direct{i}", f"{v}.0.0")
+            for j in rng.sample(range(shared), 3):
+                lower = rng.randint(0, versions // 2)
+                package.add_dependency(
+                    Factory.create_dependency(f"shared{j}", f">={lower}.0.0")
+                )
+            repository.add_package(package)
+        root.add_dependency(Factory.create_dependency(f"direct{i}", "*"))
+
+    return Universe("wide", "many direct dependencies", root, [repository])
+
+
+def deep(seed: int) -> Universe:
+    """
+    A long chain of dependencies in which each version of a package
+    only allows a few versions of the next one.
+    """
+    rng = random.Random(seed)
+    repository = Repository("deep")
+    root = _root()
+    length, versions = 200, 10
+
+    for i in range(length):
+        for v in range(versions):
+            package = Package(f"chain{i}", f"{v}.0.0")
+            if i + 1 < length:
+                lower = rng.randint(0, versions - 3)
+                package.add_dependency(
+                    Factory.create_dependency(
+                        f"chain{i + 1}", f">={lower}.0.0,<{lower + 3}.0.0"
+                    )
+                )
+            repository.add_package(package)
+    root.add_dependency(Factory.create_dependency("chain0", "*"))
+
+    return Universe("deep", "long dependency chain", root, [repository])
+
+
+def backtracking(seed: int) -> Universe:
+    """
+    Randomly interdependent packages with narrow constraints
+    so that the solver has to backtrack a lot.
+    """
+    rng = random.Random(seed)
+    repository = Repository("backtracking")
+    root = _root()
+    count, versions = 45, 15
+
+    for i in range(count):
+        for v in range(versions):
+            package = Package(f"bt{i}", f"{v}.0")
+            for j in rng.sample(range(count), 4):
+                if j <= i:
+                    continue
+                lower = rng.randint(0, versions - 3)
+                upper = lower + rng.randint(1, 4)
+                package.add_dependency(
+                    Factory.create_dependency(f"bt{j}", f">={lower}.0,<{upper}.0")
+                )
+            repository.add_package(package)
+    for i in range(0, count, 3):
+        root.add_dependency(Factory.create_dependency(f"bt{i}", "*"))
+
+    return Universe("backtracking", "many conflicts", root, [repository])
+
+
+def marker_heavy(seed: int) -> Universe:
+    """
+    Packages that require different versions of a dependency
+    for many overlapping platform and Python version branches.
+    """
+    rng = random.Random(seed)
+    repository = Repository("marker-heavy")
+    root = _root()
+    count, leaves, versions = 20, 15, 12
+
+    for i in range(leaves):
+        for v in range(versions):
+            repository.add_package(Package(f"native{i}", f"{v}.0.0"))
+
+    for i in range(count):
+        for v in range(3):
+            package = Package(f"stack{i}", f"{v}.0.0")
+            for j in rng.sample(range(leaves), 2):
+                for branch, platform in enumerate(rng.sample(PLATFORMS, 4)):
+                    python_version = rng.choice(PYTHON_VERSIONS)
+                    package.add_dependency(
+                        Factory.create_dependency(
+                            f"native{j}",
+                            {
+                                "version": f">={branch}.0.0",
+                                "markers": (
+                                    f'sys_platform == "{platform}"'
+                                    f' or python_version >= "{python_version}"'
+                                ),
+                            },
+                        )
+                    )
+            repository.add_package(package)
+        root.add_dependency(Factory.create_dependency(f"stack{i}", "*"))
+
+    return Universe(
+        "marker-heavy", "overlapping environment markers", root, [repository]
+    )
+
+
+def extras_heavy(seed: int) -> Universe:
+    """
+    Packages with many extras (some of which require extras of other packages)
+    of which the root package requests a random selection.
+    """
+    rng = random.Random(seed)
+    repository = Repository("extras-heavy")
+    root = _root()
+    count, plugins, versions, extras = 40, 60, 5, 6
+
+    for i in range(plugins):
+        for v in range(versions):
+            repository.add_package(Package(f"plugin{i}", f"{v}.0.0"))
+
+    for i in range(count):
+        for v in range(versions):
+            package = Package(f"framework{i}", f"{v}.0.0")
+            package.extras = {}
+            for e in range(extras):
+                extra = canonicalize_name(f"extra{e}")
+                extra_dependencies = []
+                for j in rng.sample(range(plugins), 3):
+                    dependency = Factory.create_dependency(
+                        f"plugin{j}",
+                        {
+                            "version": f">={rng.randint(0, 2)}.0.0",
+                            "optional": True,
+                            "markers": f'extra == "{extra}"',
+                        },
+                    )
+                    dependency._in_extras = [extra]
+                    package.add_dependency(dependency)
+                    extra_dependencies.append(dependency)
+                if e and i + 1 < count:
+                    # extras that require extras of other frameworks
+                    dependency = Factory.create_dependency(
+                        f"framework{i + 1}",
+                        {
+                            "version": "*",
+                            "optional": True,
+                            "extras": [f"extra{e - 1}"],
+                            "markers": f'extra == "{extra}"',
+                        },
+                    )
+                    dependency._in_extras = [extra]
+                    package.add_dependency(dependency)
+                    extra_dependencies.append(dependency)
+                package.extras[extra] = extra_dependencies
+            repository.add_package(package)
+
+    for i in range(0, count, 4):
+        requested = sorted(rng.sample([f"extra{e}" for e in range(extras)], 2))
+        root.add_dependency(
+            Factory.create_dependency(
+                f"framework{i}", {"version": "*", "extras": requested}
+            )
+        )
+
+    return Universe("extras-heavy", "many extras", root, [repository])
+
+
+def remote(seed: int) -> Universe:
+    """
+    Packages from two package indexes that have to be retrieved
+    with latency, i.e. pages and metadata files are fetched concurrently.
+    """
+    rng = random.Random(seed)
+    root = _root()
+    direct, shared, plugins, versions = 30, 15, 15, 5
+
+    packages = [
+        Package(f"shared{i}", f"{v}.0.0")
+        for i in range(shared)
+        for v in range(versions)
+    ]
+    plugin_packages = [
+        Package(f"plugin{i}", f"{v}.0.0")
+        for i in range(plugins)
+        for v in range(versions)
+    ]
+    for i in range(direct):
+        for v in range(versions):
+            package = Package(f"direct{i}", f"{v}.0.0")
+            for j in rng.sample(range(shared), 2):
+                package.add_dependency(
+                    Factory.create_dependency(
+                        f"shared{j}", f">={rng.randint(0, versions // 2)}.0.0"
+                    )
+                )
+            package.add_dependency(
+                Factory.create_dependency(f"plugin{rng.randrange(plugins)}", "*")
+            )
+            packages.append(package)
+        root.add_dependency(Factory.create_dependency(f"direct{i}", "*"))
+
+    return Universe(
+        "remote",
+        "packages from two indexes with latency",
+        root,
+        [
+            StubbedRepository("main", packages),
+            StubbedRepository("extra", plugin_packages),
+        ],
+    )
+
+
+UNIVERSES: dict[str, Callable[[int], Universe]] = {
+    "wide": wide,
+    "deep": deep,
+    "backtracking": backtracking,
+    "marker-heavy": marker_heavy,
+    "extras-heavy": extras_heavy,
+    "remote": remote,
+}
@@ -147,6 +147,9 @@ _default_config: Config | None = None
 class Config:
     default_config: ClassVar[dict[str, Any]] = {
         "cache-dir": str(DEFAULT_CACHE_DIR),
+        "cache-backend": "files",
+        "cache-max-size": None,
+        "cache-max-age": None,
         "data-dir": str(data_dir()),
         "virtualenvs": {
             "create": True,
@@ -174,7 +177,9 @@ class Config:
         "python": {"installation-dir": os.path.join("{data-dir}", "python")},
         "solver": {
             "lazy-wheel": True,
+            "result-cache": True,
         },
+        "offline": False,
         "system-git-client": False,
         "keyring": {
             "enabled": True,
@@ -387,6 +392,8 @@ class Config:
             "installer.re-resolve",
             "installer.parallel",
             "solver.lazy-wheel",
+            "solver.result-cache",
+            "offline",
             "system-git-client",
             "keyring.enabled",
         }:
@@ -396,6 +403,8 @@ class Config:
             return lambda val: str(Path(val))
 
         if name in {
+            "cache-max-size",
+            "cache-max-age",
             "installer.max-workers",
             "requests.max-retries",
         }:
@@ -13,6 +13,8 @@ from cleo._utils import find_similar_names
 from cleo.application import Application as BaseApplication
 from cleo.events.console_command_event import ConsoleCommandEvent
 from cleo.events.console_events import COMMAND
+from cleo.events.console_events import TERMINATE
+from cleo.events.console_terminate_event import ConsoleTerminateEvent
 from cleo.events.event_dispatcher import EventDispatcher
 from cleo.exceptions import CleoCommandNotFoundError
 from cleo.exceptions import CleoError
@@ -72,6 +74,7 @@ COMMANDS = [
     # Cache commands
     "cache clear",
     "cache list",
+    "cache prune",
     # Debug commands
     "debug info",
     "debug resolve",
@@ -129,6 +132,7 @@ class Application(BaseApplication):
         self._io: IO | None = None
         self._disable_plugins = False
         self._disable_cache = False
+        self._offline = False
         self._plugins_loaded = False
         self._working_directory = Path.cwd()
         self._project_directory: Path | None = None
@@ -137,6 +141,7 @@ class Application(BaseApplication):
         dispatcher.add_listener(COMMAND, self.register_command_loggers)
         dispatcher.add_listener(COMMAND, self.configure_env)
         dispatcher.add_listener(COMMAND, self.configure_installer_for_event)
+        dispatcher.add_listener(TERMINATE, self.prune_caches_for_event)
         self.set_event_dispatcher(dispatcher)
 
         command_loader = CommandLoader({name: load_command(name) for name in COMMANDS})
@@ -158,6 +163,14 @@ class Application(BaseApplication):
             )
         )
 
+        definition.add_option(
+            Option(
+                "--offline",
+                flag=True,
+                description="Answer requests to package sources only from the caches.",
+            )
+        )
+
         definition.add_option(
             Option(
                 "--project",
@@ -202,6 +215,8 @@ class Application(BaseApplication):
             disable_plugins=self._disable_plugins,
             disable_cache=self._disable_cache,
         )
+        if self._offline:
+            self._poetry.config.merge({"offline": True})
 
         return self._poetry
 
@@ -324,8 +339,8 @@ class Application(BaseApplication):
     def _configure_global_options(self, io: IO) -> None:
         """
         Configures global options for the application by setting up the relevant
-        directories, disabling plugins or cache, and managing the working and
-        project directories. This method ensures that all directories are valid
+        directories, disabling plugins or cache, enabling the offline mode, and
+        managing the working and project directories. This method ensures that all directories are valid
         paths and handles the resolution of the project directory relative to the
         working directory if necessary.
 
@@ -334,6 +349,7 @@ class Application(BaseApplication):
         """
         self._disable_plugins = io.input.option("no-plugins")
         self._disable_cache = io.input.option("no-cache")
+        self._offline = io.input.option("offline")
 
         # we use ensure_path for the directories to make sure these are valid paths
         # this will raise an exception if the path is invalid
@@ -620,6 +636,61 @@ class Application(BaseApplication):
         )
         command.set_installer(installer)
 
+    @staticmethod
+    def prune_caches_for_event(
+        event: Event, event_name: str, _: EventDispatcher
+    ) -> None:
+        import sqlite3
+        import time
+
+        from cleo.io.outputs.output import Verbosity
+
+        from poetry.console.commands.installer_command import InstallerCommand
+        from poetry.utils.cache import CacheIndex
+        from poetry.utils.cache import get_cache_index
+        from poetry.utils.cache import prune_caches
+
+        assert isinstance(event, ConsoleTerminateEvent)
+        command = event.command
+        if event.exit_code != 0 or not isinstance(command, InstallerCommand):
+            return
+
+        poetry = command.poetry
+        max_size = poetry.config.get("cache-max-size")
+        max_age = poetry.config.get("cache-max-age")
+        if max_size is None and max_age is None:
+            return
+
+        try:
+            last_pruned = get_cache_index(poetry.config, required=True).last_pruned()
+            if (
+                last_pruned is not None
+                and time.time() - last_pruned < CacheIndex.AUTO_PRUNE_INTERVAL
+            ):
+                return
+
+            locked = (
+                poetry.locker.locked_repository().packages
+                if poetry.locker.is_locked()
+                else []
+            )
+            result = prune_caches(
+                poetry.config, locked, max_size=max_size, max_age=max_age
+            )
+        except (OSError, sqlite3.Error) as e:
+            # Pruning must never fail a command that has succeeded.
+            event.io.write_error_line(
+                f"<warning>Failed to prune the caches: {e}</>", Verbosity.VERBOSE
+            )
+            return
+
+        if result.entries:
+            event.io.write_line(
+                f"Evicted <info>{result.entries}</> entries"
+                f" (<info>{result.size / 2**20:.1f} MiB</>) from the caches",
+                Verbosity.VERBOSE,
+            )
+
     def _load_plugins(self, io: IO) -> None:
         if self._plugins_loaded:
             return
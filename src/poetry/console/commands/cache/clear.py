@@ -11,7 +11,9 @@ from packaging.utils import canonicalize_name
 
 from poetry.config.config import Config
 from poetry.console.commands.command import Command
-from poetry.utils.cache import FileCache
+from poetry.utils.cache import SQLiteCache
+from poetry.utils.cache import get_cache
+from poetry.utils.cache import get_cache_index
 
 
 if TYPE_CHECKING:
@@ -48,7 +50,7 @@ class CacheClearCommand(Command):
         except ValueError:
             raise ValueError(f"{root} is not a valid repository cache")
 
-        cache = FileCache(cache_dir)
+        cache = get_cache(cache_dir, config.get("cache-backend"))
 
         if len(parts) < 2:
             if not self.option("all"):
@@ -63,15 +65,21 @@ class CacheClearCommand(Command):
                 return 0
 
             # Calculate number of entries
-            entries_count = sum(
-                len(files) for _path, _dirs, files in os.walk(str(cache_dir))
-            )
+            if isinstance(cache, SQLiteCache) and cache.database.exists():
+                entries_count = cache.count()
+            else:
+                entries_count = sum(
+                    len(files) for _path, _dirs, files in os.walk(str(cache_dir))
+                )
 
             delete = self.confirm(f"<question>Delete {entries_count} entries?</>", True)
             if not delete:
                 return 0
 
             cache.flush()
+            index = get_cache_index(config, required=True)
+            if index.database.exists():
+                index.forget(cache_dir)
         elif len(parts) == 2:
             raise RuntimeError(
                 "Only specifying the package name is not yet supported. "
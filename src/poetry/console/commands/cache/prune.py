@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import ClassVar
+
+from cleo.helpers import option
+
+from poetry.config.config import Config
+from poetry.console.commands.command import Command
+
+
+if TYPE_CHECKING:
+    from cleo.io.inputs.option import Option
+    from poetry.core.packages.package import Package
+
+
+class CachePruneCommand(Command):
+    name = "cache prune"
+    description = (
+        "Evict the least recently used entries of the artifact and repository caches."
+    )
+
+    options: ClassVar[list[Option]] = [
+        option(
+            "max-size",
+            description=(
+                "The maximum size of the caches in MiB (default: cache-max-size)."
+            ),
+            flag=False,
+        ),
+        option(
+            "max-age",
+            description=(
+                "The maximum number of days since an entry has been used"
+                " (default: cache-max-age)."
+            ),
+            flag=False,
+        ),
+        option("dry-run", description="Only output what would be evicted."),
+    ]
+
+    help = """\
+The <c1>cache prune</> command evicts the least recently used entries of the artifact
+and repository caches until the limits are met.
+
+Entries that are referenced by the lock file of the current project are never evicted.
+"""
+
+    def handle(self) -> int:
+        from poetry.core.pyproject.exceptions import PyProjectError
+
+        from poetry.utils.cache import prune_caches
+
+        config = Config.create()
+        limits: dict[str, int | None] = {}
+        for name in ("max-size", "max-age"):
+            value = self.option(name) or config.get(f"cache-{name}")
+            if value is None:
+                limits[name] = None
+            elif str(value).isdecimal() and int(value) > 0:
+                limits[name] = int(value)
+            else:
+                self.line_error(
+                    f"<error>Invalid value for --{name}: {value}."
+                    " Expected a positive integer.</error>"
+                )
+                return 1
+
+        if limits["max-size"] is None and limits["max-age"] is None:
+            self.line_error(
+                "<error>Specify --max-size or --max-age"
+                " or configure cache-max-size or cache-max-age.</error>"
+            )
+            return 1
+
+        locked: list[Package] = []
+        try:
+            locker = self.poetry.locker
+        except (RuntimeError, PyProjectError):
+            pass
+        else:
+            if locker.is_locked():
+                locked = locker.locked_repository().packages
+
+        result = prune_caches(
+            config,
+            locked,
+            max_size=limits["max-size"],
+            max_age=limits["max-age"],
+            dry_run=self.option("dry-run"),
+        )
+
+        verb = "Would evict" if self.option("dry-run") else "Evicted"
+        self.line(
+            f"{verb} <info>{result.entries}</> entries"
+            f" (<info>{result.size / 2**20:.1f} MiB</>)"
+        )
+
+        return 0
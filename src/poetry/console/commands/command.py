@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import json
+
+from contextlib import contextmanager
+from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import ClassVar
@@ -9,6 +13,8 @@ from cleo.exceptions import CleoValueError
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from poetry.console.application import Application
     from poetry.poetry import Poetry
 
@@ -48,3 +54,26 @@ class Command(BaseCommand):
             return super().option(name)
         except CleoValueError:
             return default
+
+    @contextmanager
+    def profile(self, path: str | None) -> Iterator[None]:
+        """
+        Profile dependency resolution within the context if a path is given.
+        The data is written as JSON to the path and a summary is printed.
+        """
+        if not path:
+            yield
+            return
+
+        from poetry.utils.profiler import profiling
+
+        with profiling() as profiler:
+            yield
+
+        Path(path).write_text(
+            json.dumps(profiler.as_dict(), indent=2) + "\n", encoding="utf-8"
+        )
+        self.line("")
+        self.line(f"<b>Profile</b> (written to <c1>{path}</>):")
+        for line in profiler.summary():
+            self.line(line)
@@ -76,6 +76,9 @@ To remove a repository (repo is a short alias for repositories):
     def unique_config_values(self) -> dict[str, tuple[Any, Any]]:
         unique_config_values = {
             "cache-dir": (str, lambda val: str(Path(val))),
+            "cache-backend": (lambda val: val in {"files", "sqlite"}, str),
+            "cache-max-size": (lambda val: int(val) > 0, int_normalizer),
+            "cache-max-age": (lambda val: int(val) > 0, int_normalizer),
             "data-dir": (str, lambda val: str(Path(val))),
             "virtualenvs.create": (boolean_validator, boolean_normalizer),
             "virtualenvs.in-project": (boolean_validator, boolean_normalizer),
@@ -88,6 +91,7 @@ To remove a repository (repo is a short alias for repositories):
             "virtualenvs.path": (str, lambda val: str(Path(val))),
             "virtualenvs.use-poetry-python": (boolean_validator, boolean_normalizer),
             "virtualenvs.prompt": (str, str),
+            "offline": (boolean_validator, boolean_normalizer),
             "system-git-client": (boolean_validator, boolean_normalizer),
             "requests.max-retries": (lambda val: int(val) >= 0, int_normalizer),
             "installer.re-resolve": (boolean_validator, boolean_normalizer),
@@ -102,6 +106,7 @@ To remove a repository (repo is a short alias for repositories):
                 PackageFilterPolicy.normalize,
             ),
             "solver.lazy-wheel": (boolean_validator, boolean_normalizer),
+            "solver.result-cache": (boolean_validator, boolean_normalizer),
             "keyring.enabled": (boolean_validator, boolean_normalizer),
             "python.installation-dir": (str, lambda val: str(Path(val))),
         }
@@ -35,6 +35,13 @@ class DebugResolveCommand(InitCommand):
         option("python", None, "Python version(s) to use for resolution.", flag=False),
         option("tree", None, "Display the dependency tree."),
         option("install", None, "Show what would be installed for the current system."),
+        option(
+            "profile",
+            None,
+            "Write profiling data of the dependency resolution"
+            " as JSON to the given file and print a summary.",
+            flag=False,
+        ),
     ]
 
     loggers: ClassVar[list[str]] = [
@@ -89,9 +96,10 @@ class DebugResolveCommand(InitCommand):
 
         pool = self.poetry.pool
 
-        solver = Solver(package, pool, [], [], self.io)
+        solver = Solver(package, pool, [], [], self.io, config=self.poetry.config)
 
-        ops = solver.solve().calculate_operations()
+        with self.profile(self.option("profile")):
+            ops = solver.solve().calculate_operations()
 
         self.line("")
         self.line("Resolution results:")
@@ -126,7 +134,7 @@ class DebugResolveCommand(InitCommand):
 
             pool.add_repository(locked_repository)
 
-            solver = Solver(package, pool, [], [], NullIO())
+            solver = Solver(package, pool, [], [], NullIO(), config=self.poetry.config)
             with solver.use_environment(env):
                 ops = solver.solve().calculate_operations()
 
@@ -23,6 +23,19 @@ class LockCommand(InstallerCommand):
             "Ignore existing lock file"
             " and overwrite it with a new lock file created from scratch.",
         ),
+        option(
+            "incremental",
+            None,
+            "Reuse the metadata recorded in the existing lock file"
+            " for packages that are not affected by changed dependencies.",
+        ),
+        option(
+            "profile",
+            None,
+            "Write profiling data of the dependency resolution"
+            " as JSON to the given file and print a summary.",
+            flag=False,
+        ),
     ]
 
     help = """
@@ -34,11 +47,25 @@ By default, packages that have already been added to the lock file before
 will not be updated.
 
 <info>poetry lock</info>
+
+With <comment>--incremental</>, the metadata of locked packages that are not affected
+by changes of the dependencies in the <comment>pyproject.toml</> file is taken from
+the lock file instead of being retrieved from the package sources again.
 """
 
     loggers: ClassVar[list[str]] = ["poetry.repositories.pypi_repository"]
 
     def handle(self) -> int:
+        if self.option("regenerate") and self.option("incremental"):
+            self.line_error(
+                "<error>You cannot use --regenerate and --incremental together.</>"
+            )
+            return 1
+
         self.installer.lock(update=self.option("regenerate"))
+        self.installer.incremental(self.option("incremental"))
+
+        with self.profile(self.option("profile")):
+            result = self.installer.run()
 
-        return self.installer.run()
+        return result
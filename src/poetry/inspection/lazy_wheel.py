@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import atexit
+import dataclasses
+import hashlib
 import io
+import json
 import logging
+import os
 import re
+import threading
+import time
 
 from bisect import bisect_left
 from bisect import bisect_right
@@ -28,6 +35,7 @@ from requests.status_codes import codes
 if TYPE_CHECKING:
     from collections.abc import Iterable
     from collections.abc import Iterator
+    from pathlib import Path
     from types import TracebackType
 
     from packaging.metadata import RawMetadata
@@ -35,6 +43,7 @@ if TYPE_CHECKING:
     from typing_extensions import Self
 
     from poetry.utils.authenticator import Authenticator
+    from poetry.utils.cache import CacheIndex
 
 
 logger = logging.getLogger(__name__)
@@ -69,12 +78,19 @@ class InvalidWheelError(LazyWheelUnsupportedError):
 
 
 def metadata_from_wheel_url(
-    name: str, url: str, session: Session | Authenticator
+    name: str,
+    url: str,
+    session: Session | Authenticator,
+    range_cache: RangeCache | None = None,
+    host_profiles: HostProfiles | None = None,
 ) -> RawMetadata:
     """Fetch metadata from the given wheel URL.
 
     This uses HTTP range requests to only fetch the portion of the wheel
     containing metadata, just enough for the object to be constructed.
+    If a ``range_cache`` is given, ranges that have been fetched before
+    are read from it instead. If ``host_profiles`` are given, the requests
+    are adapted to what has been learned about the host of the wheel.
 
     :raises HTTPRangeRequestUnsupportedError: if range requests are unsupported for ``url``.
     :raises InvalidWheelError: if the zip file contents could not be parsed.
@@ -82,7 +98,9 @@ def metadata_from_wheel_url(
     try:
         # After context manager exit, wheel.name will point to a deleted file path.
         # Add `delete_backing_file=False` to disable this for debugging.
-        with LazyWheelOverHTTP(url, session) as lazy_file:
+        with LazyWheelOverHTTP(
+            url, session, range_cache=range_cache, host_profiles=host_profiles
+        ) as lazy_file:
             metadata_bytes = lazy_file.read_metadata(name)
 
         metadata, _ = parse_email(metadata_bytes)
@@ -148,6 +166,10 @@ class MergeIntervals:
             yield i, end
         self._left[left:right], self._right[left:right] = [start], [end]
 
+    def intervals(self) -> list[tuple[int, int]]:
+        """Return the intervals covered so far (with inclusive boundaries)."""
+        return list(zip(self._left, self._right))
+
     def minimal_intervals_covering(
         self, start: int, end: int
     ) -> Iterator[tuple[int, int]]:
@@ -167,6 +189,230 @@ class MergeIntervals:
         yield from self._merge(start, end, left, right)
 
 
+class RangeCache:
+    """Persistent storage of the byte ranges of remote files that have been fetched.
+
+    Each file is stored as one JSON header line, which contains the URL,
+    a validator of the remote file (its length and ETag) and the offsets
+    and lengths of the stored ranges, followed by the data of these ranges.
+    Ranges are only returned if the validator of the remote file did not change.
+    """
+
+    def __init__(self, cache_dir: Path, index: CacheIndex | None = None) -> None:
+        self.cache_dir = cache_dir
+        self.index = index
+
+    def get(self, url: str, validator: str) -> list[tuple[int, bytes]]:
+        """Return the stored ranges of a remote file as (offset, data) pairs."""
+        path = self._path(url)
+        try:
+            with path.open("rb") as f:
+                header = json.loads(f.readline())
+                if header["url"] != url or header["validator"] != validator:
+                    return []
+                ranges = [(start, f.read(length)) for start, length in header["ranges"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return []
+
+        if any(
+            len(data) != length
+            for (_, data), (_, length) in zip(ranges, header["ranges"])
+        ):
+            logger.debug("Ignoring truncated range cache entry %s", path)
+            return []
+
+        if self.index is not None:
+            self.index.touch(path, path.stat().st_size)
+        return ranges
+
+    def put(self, url: str, validator: str, ranges: list[tuple[int, bytes]]) -> None:
+        """Store the ranges of a remote file, replacing the ranges stored before."""
+        path = self._path(url)
+        header = {
+            "url": url,
+            "validator": validator,
+            "ranges": [(start, len(data)) for start, data in ranges],
+        }
+        content = b"".join(
+            [json.dumps(header).encode() + b"\n", *(data for _, data in ranges)]
+        )
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Replace the entry atomically so that concurrent readers
+            # never see a partially written entry.
+            with NamedTemporaryFile(dir=path.parent, delete=False) as f:
+                f.write(content)
+            os.replace(f.name, path)
+        except OSError as e:
+            logger.debug("Failed to store ranges of %s: %s", url, e)
+            return
+
+        if self.index is not None:
+            self.index.touch(path, len(content))
+
+    def _path(self, url: str) -> Path:
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return self.cache_dir / key[:2] / key[2:4] / key
+
+
+@dataclasses.dataclass(frozen=True)
+class HostProfile:
+    """What has been learned about how a host handles the requests for lazy wheels."""
+
+    # Whether the host supports range requests (for at least some files).
+    range_requests: bool | None = None
+    # Whether the host supports negative offsets. If not, a HEAD request
+    # is required to determine the length of a wheel.
+    negative_offsets: bool | None = None
+    # The number of bytes at the end of recent wheels that contain
+    # the METADATA file and the central directory.
+    tail_length: int | None = None
+    # The time when a request type has last been found to be unsupported.
+    checked: float | None = None
+
+
+# Status codes that do not tell anything about the support of a request type,
+# but indicate a transient or unrelated (e.g. authentication) issue.
+_INCONCLUSIVE_CLIENT_ERRORS = {401, 403, 407, 408, 429}
+
+
+def _is_definite_rejection(code: int | None) -> bool:
+    """Whether an error response to a request means that the server does not
+    support this type of request, so that it is not worth trying again.
+    """
+    if code is None:
+        return False
+    return (400 <= code < 500 and code not in _INCONCLUSIVE_CLIENT_ERRORS) or (
+        code == codes.not_implemented
+    )
+
+
+class HostProfiles:
+    """Persistent memory of the host profiles, which is shared by all repositories.
+
+    Updates are written when ``flush()`` is called. Profiles of other hosts that
+    have been updated by other processes in the meantime are preserved.
+
+    Request types that have been found to be unsupported are tried again
+    after ``UNSUPPORTED_MAX_AGE`` seconds in case the server has changed.
+    """
+
+    FILENAME = "lazy-wheel-hosts.json"
+    UNSUPPORTED_MAX_AGE = 7 * 24 * 60 * 60
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        self.path = cache_dir / self.FILENAME if cache_dir is not None else None
+        self._profiles: dict[str, HostProfile] | None = None
+        self._changed: set[str] = set()
+        self._lock = threading.Lock()
+
+    def get(self, netloc: str) -> HostProfile:
+        with self._lock:
+            return self._get(netloc)
+
+    def update(self, netloc: str, **changes: Any) -> HostProfile:
+        """Update the profile of a host and return the updated profile."""
+        with self._lock:
+            profiles = self._load()
+            profile = self._get(netloc)
+            if any(
+                value is False and getattr(profile, key) is not False
+                for key, value in changes.items()
+            ):
+                changes["checked"] = time.time()
+            updated = dataclasses.replace(profile, **changes)
+            if updated != profiles.get(netloc, HostProfile()):
+                profiles[netloc] = updated
+                self._changed.add(netloc)
+            return updated
+
+    def flush(self) -> None:
+        with self._lock:
+            if self.path is None or not self._changed:
+                return
+            assert self._profiles is not None
+            profiles = self._read()
+            profiles.update(
+                {netloc: self._profiles[netloc] for netloc in self._changed}
+            )
+            content = json.dumps(
+                {
+                    netloc: dataclasses.asdict(profile)
+                    for netloc, profile in profiles.items()
+                },
+                indent=2,
+                sort_keys=True,
+            )
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with NamedTemporaryFile(
+                    "w", dir=self.path.parent, delete=False, encoding="utf-8"
+                ) as f:
+                    f.write(content)
+                os.replace(f.name, self.path)
+            except OSError as e:
+                logger.debug("Failed to write lazy wheel host profiles: %s", e)
+                return
+            self._changed.clear()
+
+    def _get(self, netloc: str) -> HostProfile:
+        profile = self._load().get(netloc, HostProfile())
+        if (
+            profile.checked is not None
+            and time.time() - profile.checked > self.UNSUPPORTED_MAX_AGE
+        ):
+            # Forget which request types are unsupported to probe them again.
+            profile = dataclasses.replace(
+                profile,
+                **{
+                    field.name: None
+                    for field in dataclasses.fields(profile)
+                    if getattr(profile, field.name) is False
+                },
+                checked=None,
+            )
+        return profile
+
+    def _load(self) -> dict[str, HostProfile]:
+        if self._profiles is None:
+            self._profiles = self._read()
+        return self._profiles
+
+    def _read(self) -> dict[str, HostProfile]:
+        if self.path is None:
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            fields = {field.name for field in dataclasses.fields(HostProfile)}
+            return {
+                netloc: HostProfile(
+                    **{key: value for key, value in profile.items() if key in fields}
+                )
+                for netloc, profile in data.items()
+            }
+        except (OSError, ValueError, TypeError, AttributeError):
+            return {}
+
+
+_host_profiles: dict[Path | None, HostProfiles] = {}
+_host_profiles_lock = threading.Lock()
+
+
+def get_host_profiles(cache_dir: Path | None) -> HostProfiles:
+    """
+    Return the host profiles stored in the given cache directory,
+    which are written when the interpreter exits.
+
+    If no cache directory is given, the profiles are only kept in memory.
+    """
+    with _host_profiles_lock:
+        profiles = _host_profiles.get(cache_dir)
+        if profiles is None:
+            profiles = _host_profiles[cache_dir] = HostProfiles(cache_dir)
+            atexit.register(profiles.flush)
+        return profiles
+
+
 class ReadOnlyIOWrapper(IO[bytes]):
     """Implement read-side ``IO[bytes]`` methods wrapping an inner ``IO[bytes]``.
 
@@ -287,23 +533,39 @@ class LazyFileOverHTTP(ReadOnlyIOWrapper):
 
     This uses HTTP range requests to lazily fetch the file's content into a temporary
     file. If such requests are not supported by the server, raises
-    ``HTTPRangeRequestUnsupportedError`` in the ``__enter__`` method."""
+    ``HTTPRangeRequestUnsupportedError`` in the ``__enter__`` method.
+
+    If a ``range_cache`` is given, the fetched ranges are stored in it on exit
+    so that they can be reused as long as the remote file does not change.
+    If ``host_profiles`` are given, what has been learned about the host
+    is remembered for other files of the host."""
 
     def __init__(
         self,
         url: str,
         session: Session | Authenticator,
         delete_backing_file: bool = True,
+        range_cache: RangeCache | None = None,
+        host_profiles: HostProfiles | None = None,
     ) -> None:
         inner = NamedTemporaryFile(delete=delete_backing_file)  # noqa: SIM115
         super().__init__(inner)
 
         self._merge_intervals: MergeIntervals | None = None
         self._length: int | None = None
+        self._etag: str | None = None
+        self._range_cache = range_cache
+        # The intervals that have been read from the range cache
+        self._cached_intervals: list[tuple[int, int]] = []
 
         self._request_count = 0
         self._session = session
         self._url = url
+        self._netloc = urlparse(url).netloc
+        self._host_profiles = host_profiles
+        self._host_profile = (
+            host_profiles.get(self._netloc) if host_profiles else HostProfile()
+        )
 
     def __enter__(self) -> Self:
         super().__enter__()
@@ -316,6 +578,8 @@ class LazyFileOverHTTP(ReadOnlyIOWrapper):
         exc_value: BaseException | None,
         traceback: TracebackType | None,
     ) -> None:
+        if exc_type is None:
+            self._store_cached_ranges()
         self._reset_content()
         super().__exit__(exc_type, exc_value, traceback)
 
@@ -398,6 +662,62 @@ class LazyFileOverHTTP(ReadOnlyIOWrapper):
             logger.debug("unsetting content length (was: %d)", self._length)
             self._length = None
 
+        self._etag = None
+        self._cached_intervals = []
+
+    def _learn(self, **changes: Any) -> None:
+        """Update the profile of the host of the file."""
+        if self._host_profiles is None:
+            self._host_profile = dataclasses.replace(self._host_profile, **changes)
+        else:
+            self._host_profile = self._host_profiles.update(self._netloc, **changes)
+
+    def _validator(self, length: int) -> str:
+        """Return a string that changes whenever the remote file changes."""
+        return f"{length}:{self._etag or ''}"
+
+    def _load_cached_ranges(self, length: int) -> None:
+        """Write the ranges stored in the range cache to the backing file.
+
+        Only ranges that have not been downloaded yet are written, and they
+        are recorded in ``self._merge_intervals`` so that they are not downloaded.
+        """
+        if self._range_cache is None:
+            return
+        assert self._merge_intervals is not None
+        with self._stay():
+            for start, data in self._range_cache.get(
+                self._url, self._validator(length)
+            ):
+                self._cached_intervals.append((start, start + len(data) - 1))
+                for (
+                    range_start,
+                    range_end,
+                ) in self._merge_intervals.minimal_intervals_covering(
+                    start, start + len(data) - 1
+                ):
+                    logger.debug(
+                        "read bytes %d-%d from range cache", range_start, range_end
+                    )
+                    self.seek(range_start)
+                    self._file.write(data[range_start - start : range_end - start + 1])
+
+    def _store_cached_ranges(self) -> None:
+        """Store all ranges that have been downloaded in the range cache."""
+        if (
+            self._range_cache is None
+            or self._merge_intervals is None
+            or self._length is None
+            or self._merge_intervals.intervals() == self._cached_intervals
+        ):
+            return
+        ranges = []
+        with self._stay():
+            for start, end in self._merge_intervals.intervals():
+                self.seek(start)
+                ranges.append((start, self._file.read(end - start + 1)))
+        self._range_cache.put(self._url, self._validator(self._length), ranges)
+
     def _content_length_from_head(self) -> int:
         """Performs a HEAD request to extract the Content-Length.
 
@@ -409,6 +729,7 @@ class LazyFileOverHTTP(ReadOnlyIOWrapper):
         )
         head.raise_for_status()
         assert head.status_code == codes.ok
+        self._etag = head.headers.get("ETag")
         accepted_range = head.headers.get("Accept-Ranges", None)
         if accepted_range != "bytes":
             raise HTTPRangeRequestUnsupportedError(
@@ -480,7 +801,7 @@ class LazyFileOverHTTP(ReadOnlyIOWrapper):
                 range_start,
                 range_end,
             ) in self._merge_intervals.minimal_intervals_covering(start, end):
-                self.seek(start)
+                self.seek(range_start)
                 for chunk in self._fetch_content_range(range_start, range_end):
                     self._file.write(chunk)
 
@@ -496,6 +817,9 @@ class LazyWheelOverHTTP(LazyFileOverHTTP):
     # multiple times in the same invocation against an index without this support.
     _domains_without_negative_range: ClassVar[set[str]] = set()
 
+    DEFAULT_INITIAL_CHUNK_LENGTH = 10_000
+    MAX_INITIAL_CHUNK_LENGTH = 1_000_000
+
     _metadata_regex = re.compile(r"^[^/]*\.dist-info/METADATA$")
 
     def read_metadata(self, name: str) -> bytes:
@@ -505,8 +829,7 @@ class LazyWheelOverHTTP(LazyFileOverHTTP):
             filename = self._prefetch_metadata(name)
             return zf.read(filename)
 
-    @classmethod
-    def _initial_chunk_length(cls) -> int:
+    def _initial_chunk_length(self) -> int:
         """Return the size of the chunk (in bytes) to download from the end of the file.
 
         This method is called in ``self._fetch_content_length()``. As noted in that
@@ -518,8 +841,18 @@ class LazyWheelOverHTTP(LazyFileOverHTTP):
         If the chunk size from this method is larger than the size of an entire wheel,
         that may raise an HTTP error, but this is gracefully handled in
         ``self._fetch_content_length()`` with a small performance penalty.
+
+        If the tail lengths of recent wheels of the host are known, the chunk
+        is chosen large enough to contain the METADATA file as well,
+        so that all metadata can be read with a single request.
         """
-        return 10_000
+        tail_length = self._host_profile.tail_length
+        if tail_length is None:
+            return self.DEFAULT_INITIAL_CHUNK_LENGTH
+        return min(
+            max(tail_length, self.DEFAULT_INITIAL_CHUNK_LENGTH),
+            self.MAX_INITIAL_CHUNK_LENGTH,
+        )
 
     def _fetch_content_length(self) -> int:
         """Get the total remote file length, but also download a chunk from the end.
@@ -549,7 +882,8 @@ class LazyWheelOverHTTP(LazyFileOverHTTP):
             # If we could not download any file contents yet (e.g. if negative byte
             # ranges were not supported, or the requested range was larger than the file
             # size), then download all of this at once, hopefully pulling in the entire
-            # central directory.
+            # central directory, unless it has been stored in the range cache.
+            self._load_cached_ranges(ret_length)
             initial_start = max(0, ret_length - initial_chunk_size)
             self._ensure_downloaded(initial_start, ret_length)
         else:
@@ -579,6 +913,7 @@ class LazyWheelOverHTTP(LazyFileOverHTTP):
                         init_chunk_start, init_chunk_end
                     )
                 )
+            self._load_cached_ranges(ret_length)
         return ret_length
 
     @staticmethod
@@ -624,6 +959,7 @@ class LazyWheelOverHTTP(LazyFileOverHTTP):
                         accept_ranges == "bytes"
                         and content_length <= initial_chunk_size
                     ):
+                        self._etag = tail.headers.get("ETag")
                         return content_length, tail
 
                 raise HTTPRangeRequestUnsupportedError(
@@ -639,6 +975,7 @@ class LazyWheelOverHTTP(LazyFileOverHTTP):
             file_length = self._parse_full_length_from_content_range(
                 tail.headers["Content-Range"]
             )
+            self._etag = tail.headers.get("ETag")
             return (file_length, tail)
         except BaseException:
             tail.close()
@@ -648,8 +985,11 @@ class LazyWheelOverHTTP(LazyFileOverHTTP):
         self, initial_chunk_size: int
     ) -> tuple[int, Response | None]:
         """Get the Content-Length of the remote file, and possibly a chunk of it."""
-        domain = urlparse(self._url).netloc
-        if domain in self._domains_without_negative_range:
+        domain = self._netloc
+        if (
+            domain in self._domains_without_negative_range
+            or self._host_profile.negative_offsets is False
+        ):
             return (self._content_length_from_head(), None)
 
         tail: Response | None
@@ -673,6 +1013,7 @@ class LazyWheelOverHTTP(LazyFileOverHTTP):
                 file_length = self._parse_full_length_from_content_range(
                     resp.headers["Content-Range"]
                 )
+                self._etag = resp.headers.get("ETag")
                 return file_length, None
 
             # pypi notably does not support negative byte ranges: see
@@ -686,6 +1027,10 @@ class LazyWheelOverHTTP(LazyFileOverHTTP):
             # Avoid trying a negative byte range request against this domain for the
             # rest of the resolve.
             self._domains_without_negative_range.add(domain)
+            # Only remember it for later runs if it is not a transient error.
+            # (GAR notably responds with an internal server error.)
+            if _is_definite_rejection(code):
+                self._learn(negative_offsets=False)
             # Apply a HEAD request to get the real size, and nothing else for now.
             return self._content_length_from_head(), None
 
@@ -699,8 +1044,22 @@ class LazyWheelOverHTTP(LazyFileOverHTTP):
             tail.close()
             tail = None
             self._domains_without_negative_range.add(domain)
+            self._learn(negative_offsets=False)
+        elif tail.status_code == codes.partial_content:
+            self._learn(negative_offsets=True)
         return file_length, tail
 
+    def _learn_tail_length(self, metadata_offset: int) -> None:
+        """Remember how many bytes at the end of the wheel contain the METADATA file.
+
+        The learned length adapts immediately to larger wheels and decays slowly
+        for smaller wheels so that the initial chunk covers most wheels of the host.
+        """
+        assert self._length is not None
+        tail_length = self._length - metadata_offset
+        previous = self._host_profile.tail_length or 0
+        self._learn(tail_length=max(tail_length, previous * 3 // 4))
+
     def _prefetch_metadata(self, name: str) -> str:
         """Locate the *.dist-info/METADATA entry from a temporary ``ZipFile`` wrapper,
         and download it.
@@ -739,6 +1098,7 @@ class LazyWheelOverHTTP(LazyFileOverHTTP):
         # until the start of the central directory.
         if end is None:
             end = zf.start_dir
+        self._learn_tail_length(start)
         logger.debug(f"fetch {filename}")
         self._ensure_downloaded(start, end)
         logger.debug("done prefetching METADATA for %s", name)
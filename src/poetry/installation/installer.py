@@ -62,6 +62,7 @@ class Installer:
         self._groups: Iterable[NormalizedName] | None = None
         self._skip_directory = False
         self._lock = False
+        self._incremental = False
 
         self._whitelist: list[NormalizedName] = []
 
@@ -165,6 +166,15 @@ class Installer:
     def is_updating(self) -> bool:
         return self._update
 
+    def incremental(self, incremental: bool = True) -> Installer:
+        """
+        Trust the metadata of packages in the lock file when refreshing it
+        so that only packages affected by changed requirements are retrieved again.
+        """
+        self._incremental = incremental
+
+        return self
+
     def execute_operations(self, execute: bool = True) -> Installer:
         if not execute:
             self._executor.disable()
@@ -182,6 +192,7 @@ class Installer:
         return self
 
     def _do_refresh(self) -> int:
+        from poetry.puzzle.result_cache import SolverResultCache
         from poetry.puzzle.solver import Solver
 
         # Checking extras
@@ -196,6 +207,8 @@ class Installer:
             locked_repository.packages,
             locked_repository.packages,
             self._io,
+            config=self._config,
+            result_cache=SolverResultCache.create(self._config),
         )
 
         # Always re-solve directory dependencies, otherwise we can't determine
@@ -203,6 +216,7 @@ class Installer:
         use_latest = [
             p.name for p in locked_repository.packages if p.source_type == "directory"
         ]
+        solver.provider.trust_locked(self._incremental)
 
         with solver.provider.use_source_root(
             source_root=self._env.path.joinpath("src")
@@ -214,6 +228,7 @@ class Installer:
         return 0
 
     def _do_install(self) -> int:
+        from poetry.puzzle.result_cache import SolverResultCache
         from poetry.puzzle.solver import Solver
 
         locked_repository = Repository("poetry-locked")
@@ -243,6 +258,8 @@ class Installer:
                 self._installed_repository.packages,
                 locked_repository.packages,
                 self._io,
+                config=self._config,
+                result_cache=SolverResultCache.create(self._config),
             )
 
             with solver.provider.use_source_root(
@@ -316,6 +333,7 @@ class Installer:
                 locked_repository.packages,
                 NullIO(),
                 active_root_extras=self._extras,
+                config=self._config,
             )
             # Everything is resolved at this point, so we no longer need
             # to load deferred dependencies (i.e. VCS, URL and path dependencies)
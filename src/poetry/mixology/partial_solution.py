@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import heapq
+import itertools
+
+from bisect import bisect_left
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
 from poetry.mixology.assignment import Assignment
@@ -29,6 +34,16 @@ class PartialSolution:
         # assigned.
         self._assignments: list[Assignment] = []
 
+        # The assignments for each package, in the order they were assigned.
+        self._assignments_by_package: dict[str, list[Assignment]] = defaultdict(list)
+
+        # The cumulative intersections of the assignments for each package,
+        # i.e. the term at index i is the intersection of the first i + 1
+        # assignments of the package. This allows finding a satisfier via binary
+        # search. It only covers the leading assignments that refer to
+        # the same package (same source) as the first assignment.
+        self._cumulative_terms: dict[str, list[Term]] = defaultdict(list)
+
         # The decisions made for each package.
         self._decisions: dict[str, Package] = {}
 
@@ -38,6 +53,16 @@ class PartialSolution:
         # This is derived from self._assignments.
         self._positive: dict[str, Term] = {}
 
+        # The position of each package in _positive. Since a dict keeps
+        # insertion order, a package gets a new position whenever it is
+        # (re-)inserted into _positive.
+        self._positive_order: dict[str, int] = {}
+        self._positive_counter = itertools.count()
+
+        # The packages whose positive term has changed since the last call
+        # of updated_unsatisfied(). A dict is used as an ordered set.
+        self._updated_positive: dict[str, None] = {}
+
         # The union of all negative Assignments for each package.
         #
         # If a package has any positive Assignments, it doesn't appear in this
@@ -72,6 +97,33 @@ class PartialSolution:
             if term.dependency.complete_name not in self._decisions
         ]
 
+    def updated_unsatisfied(self) -> list[tuple[int, Dependency]]:
+        """
+        Returns the unsatisfied dependencies that have changed since the last call
+        together with their position in unsatisfied (i.e. in _positive).
+        """
+        updated = sorted(
+            (self._positive_order[name], self._positive[name].dependency)
+            for name in self._updated_positive
+            if name in self._positive and name not in self._decisions
+        )
+        self._updated_positive.clear()
+        return updated
+
+    def is_unsatisfied(self, position: int, dependency: Dependency) -> bool:
+        """
+        Returns whether dependency (as returned by updated_unsatisfied())
+        is still unsatisfied and has not changed in the meantime.
+        """
+        name = dependency.complete_name
+        term = self._positive.get(name)
+        return (
+            term is not None
+            and term.dependency is dependency
+            and self._positive_order[name] == position
+            and name not in self._decisions
+        )
+
     def decide(self, package: Package) -> None:
         """
         Adds an assignment of package as a decision
@@ -112,6 +164,18 @@ class PartialSolution:
         Adds an Assignment to _assignments and _positive or _negative.
         """
         self._assignments.append(assignment)
+        name = assignment.dependency.complete_name
+        assignments = self._assignments_by_package[name]
+        assignments.append(assignment)
+        cumulative_terms = self._cumulative_terms[name]
+        if len(cumulative_terms) == len(assignments) - 1:
+            if not cumulative_terms:
+                cumulative_terms.append(assignment)
+            elif self._is_relevant(assignment, assignments[0].dependency):
+                term = cumulative_terms[-1].intersect(assignment)
+                if term is not None:
+                    cumulative_terms.append(term)
+
         self._register(assignment)
 
     def backtrack(self, decision_level: int) -> None:
@@ -124,9 +188,11 @@ class PartialSolution:
         packages = set()
         while self._assignments[-1].decision_level > decision_level:
             removed = self._assignments.pop(-1)
-            packages.add(removed.dependency.complete_name)
+            name = removed.dependency.complete_name
+            packages.add(name)
+            self._assignments_by_package[name].pop()
             if removed.is_decision():
-                del self._decisions[removed.dependency.complete_name]
+                del self._decisions[name]
 
         # Re-compute _positive and _negative for the packages that were removed.
         for package in packages:
@@ -136,9 +202,18 @@ class PartialSolution:
             if package in self._negative:
                 del self._negative[package]
 
-        for assignment in self._assignments:
-            if assignment.dependency.complete_name in packages:
-                self._register(assignment)
+            del self._cumulative_terms[package][
+                len(self._assignments_by_package[package]) :
+            ]
+
+        # Register the remaining assignments in the order they were assigned
+        # so that the order of _positive (and thus of unsatisfied) is the same
+        # as without backtracking.
+        for assignment in heapq.merge(
+            *(self._assignments_by_package[package] for package in packages),
+            key=lambda a: a.index,
+        ):
+            self._register(assignment)
 
     def _register(self, assignment: Assignment) -> None:
         """
@@ -150,6 +225,7 @@ class PartialSolution:
             value = old_positive.intersect(assignment)
             assert value is not None
             self._positive[name] = value
+            self._updated_positive[name] = None
 
             return
 
@@ -164,6 +240,8 @@ class PartialSolution:
                 del self._negative[name]
 
             self._positive[name] = term
+            self._positive_order[name] = next(self._positive_counter)
+            self._updated_positive[name] = None
         else:
             self._negative[name] = term
 
@@ -172,16 +250,28 @@ class PartialSolution:
         Returns the first Assignment in this solution such that the sublist of
         assignments up to and including that entry collectively satisfies term.
         """
-        assigned_term: Term | None = None
+        assignments = self._assignments_by_package[term.dependency.complete_name]
+        cumulative_terms = self._cumulative_terms[term.dependency.complete_name]
+
+        # Fast path: If the first assignments refer to the same package as term,
+        # we can search for the first of their cumulative intersections
+        # that satisfies term.
+        if (
+            cumulative_terms
+            and self._is_relevant(assignments[0], term.dependency)
+            and cumulative_terms[-1].satisfies(term)
+        ):
+            index = bisect_left(
+                range(len(cumulative_terms)),
+                True,
+                key=lambda i: cumulative_terms[i].satisfies(term),
+            )
+            return assignments[index]
 
-        for assignment in self._assignments:
-            if assignment.dependency.complete_name != term.dependency.complete_name:
-                continue
+        assigned_term: Term | None = None
 
-            if (
-                not assignment.dependency.is_root
-                and not assignment.dependency.is_same_package_as(term.dependency)
-            ):
+        for assignment in assignments:
+            if not self._is_relevant(assignment, term.dependency):
                 if not assignment.is_positive():
                     continue
 
@@ -201,6 +291,13 @@ class PartialSolution:
 
         raise RuntimeError(f"[BUG] {term} is not satisfied.")
 
+    @staticmethod
+    def _is_relevant(assignment: Assignment, dependency: Dependency) -> bool:
+        return (
+            assignment.dependency.is_root
+            or assignment.dependency.is_same_package_as(dependency)
+        )
+
     def satisfies(self, term: Term) -> bool:
         return self.relation(term) == SetRelation.SUBSET
 
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import collections
 import functools
+import heapq
+import itertools
 import time
 
 from enum import IntEnum
 from typing import TYPE_CHECKING
+from typing import NamedTuple
 
 from poetry.core.packages.dependency import Dependency
 
@@ -19,6 +22,7 @@ from poetry.mixology.result import SolverResult
 from poetry.mixology.set_relation import SetRelation
 from poetry.mixology.term import Term
 from poetry.packages import PackageCollection
+from poetry.utils import profiler
 
 
 if TYPE_CHECKING:
@@ -30,6 +34,10 @@ if TYPE_CHECKING:
 
 _conflict = object()
 
+# The number of next best versions of a package whose metadata is fetched
+# speculatively when the current best version of that package caused a conflict.
+PREFETCH_BACKTRACKING_DEPTH = 3
+
 
 class Preference(IntEnum):
     """
@@ -50,6 +58,14 @@ CompKey = tuple[Preference, int, bool, int]
 DependencyCacheKey = tuple[str, str | None, str | None, str | None, str | None]
 
 
+class DependencyCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
 class DependencyCache:
     """
     A cache of the valid dependencies.
@@ -59,8 +75,9 @@ class DependencyCache:
     again.
     """
 
-    def __init__(self, provider: Provider) -> None:
+    def __init__(self, provider: Provider, maxsize: int = 1024) -> None:
         self._provider = provider
+        self._maxsize = maxsize
 
         # self._cache maps a package name to a stack of cached package lists,
         # ordered by the decision level which added them to the cache. This is
@@ -71,25 +88,54 @@ class DependencyCache:
         # In order to maintain the integrity of the cache, `clear_level()`
         # needs to be called in descending order as decision levels are
         # backtracked so that the correct items can be popped from the stack.
-        self._cache: dict[DependencyCacheKey, list[list[DependencyPackage]]] = (
-            collections.defaultdict(list)
-        )
+        self._cache: dict[
+            DependencyCacheKey, list[tuple[int, list[DependencyPackage]]]
+        ] = collections.defaultdict(list)
         self._cached_dependencies_by_level: dict[int, list[DependencyCacheKey]] = (
             collections.defaultdict(list)
         )
 
-        self._search_for_cached = functools.lru_cache(maxsize=128)(self._search_for)
+        # self._search_results memoizes the results of _search_for() in LRU order.
+        # Each result is tagged with the decision level of the package list it
+        # has been derived from so that backtracking only has to evict results
+        # of the rolled back levels.
+        self._search_results: collections.OrderedDict[
+            tuple[Dependency, DependencyCacheKey],
+            tuple[int, list[DependencyPackage]],
+        ] = collections.OrderedDict()
+        self._search_results_by_level: dict[
+            int, set[tuple[Dependency, DependencyCacheKey]]
+        ] = collections.defaultdict(set)
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def cache_info(self) -> DependencyCacheInfo:
+        return DependencyCacheInfo(
+            self._hits,
+            self._misses,
+            self._evictions,
+            self._maxsize,
+            len(self._search_results),
+        )
 
     def _search_for(
         self,
         dependency: Dependency,
         key: DependencyCacheKey,
-    ) -> list[DependencyPackage]:
+        decision_level: int,
+    ) -> tuple[int, list[DependencyPackage]]:
+        """
+        Returns the packages matching the dependency and the decision level
+        the result depends on.
+        """
         cache_entries = self._cache[key]
         if cache_entries:
+            level, cached_packages = cache_entries[-1]
             packages = [
                 p
-                for p in cache_entries[-1]
+                for p in cached_packages
                 if dependency.constraint.allows(p.package.version)
             ]
         else:
@@ -103,8 +149,33 @@ class DependencyCache:
         # nothing, we need to call provider.search_for() again as it may return
         # additional results this time.
         if not packages:
+            level = decision_level
             packages = self._provider.search_for(dependency)
 
+        return level, packages
+
+    def _search_for_cached(
+        self,
+        dependency: Dependency,
+        key: DependencyCacheKey,
+        decision_level: int,
+    ) -> list[DependencyPackage]:
+        memo_key = (dependency, key)
+        result = self._search_results.get(memo_key)
+        if result is not None:
+            self._hits += 1
+            self._search_results.move_to_end(memo_key)
+            return result[1]
+
+        self._misses += 1
+        level, packages = self._search_for(dependency, key, decision_level)
+        self._search_results[memo_key] = (level, packages)
+        self._search_results_by_level[level].add(memo_key)
+
+        if len(self._search_results) > self._maxsize:
+            old_key, (old_level, _) = self._search_results.popitem(last=False)
+            self._search_results_by_level[old_level].discard(old_key)
+
         return packages
 
     def search_for(
@@ -123,10 +194,12 @@ class DependencyCache:
         # We could always use dependency.without_features() here,
         # but for performance reasons we only do it if necessary.
         packages = self._search_for_cached(
-            dependency.without_features() if dependency.features else dependency, key
+            dependency.without_features() if dependency.features else dependency,
+            key,
+            decision_level,
         )
-        if not self._cache[key] or self._cache[key][-1] is not packages:
-            self._cache[key].append(packages)
+        if not self._cache[key] or self._cache[key][-1][1] is not packages:
+            self._cache[key].append((decision_level, packages))
             self._cached_dependencies_by_level[decision_level].append(key)
 
         if dependency.features and packages:
@@ -138,8 +211,11 @@ class DependencyCache:
         return packages
 
     def clear_level(self, level: int) -> None:
+        for memo_key in self._search_results_by_level.pop(level, ()):
+            del self._search_results[memo_key]
+            self._evictions += 1
+
         if level in self._cached_dependencies_by_level:
-            self._search_for_cached.cache_clear()
             for key in self._cached_dependencies_by_level.pop(level):
                 self._cache[key].pop()
 
@@ -157,13 +233,33 @@ class VersionSolver:
         self._root = root
         self._provider = provider
         self._dependency_cache = DependencyCache(provider)
-        self._incompatibilities: dict[str, list[Incompatibility]] = {}
+        self._incompatibilities: set[Incompatibility] = set()
+        # Each incompatibility watches (up to) two of its terms, which are chosen
+        # so that the incompatibility can only become almost satisfied or
+        # satisfied if one of its watched terms becomes satisfied
+        # (see _watch_incompatibility()). Therefore, when the assignments for a package
+        # change, only the incompatibilities watching a term about this package
+        # have to be revisited. (This is the "two watched literals" scheme
+        # of CDCL SAT solvers.)
+        #
+        # _watchers maps a package name to the incompatibilities watching a term
+        # about this package. A dict is used as an ordered set.
+        self._watchers: dict[str, dict[Incompatibility, None]] = (
+            collections.defaultdict(dict)
+        )
+        self._watched_terms: dict[Incompatibility, list[Term]] = {}
         self._contradicted_incompatibilities: set[Incompatibility] = set()
         self._contradicted_incompatibilities_by_level: dict[
             int, set[Incompatibility]
         ] = collections.defaultdict(set)
         self._solution = PartialSolution()
         self._get_comp_key_cached = functools.cache(self._get_comp_key)
+        # A heap of (comp key, position in unsatisfied, tie breaker, dependency).
+        # Entries are not removed when the dependency is satisfied or changes
+        # but only when they reach the top of the heap.
+        self._unsatisfied_queue: list[tuple[CompKey, int, int, Dependency]] = []
+        self._unsatisfied_counter = itertools.count()
+        self._prefetched_dependencies: set[Dependency] = set()
 
     @property
     def solution(self) -> PartialSolution:
@@ -192,11 +288,15 @@ class VersionSolver:
         except Exception:
             raise
         finally:
+            cache_info = self._dependency_cache.cache_info()
             self._log(
                 f"Version solving took {time.time() - start:.3f} seconds.\n"
-                f"Tried {self._solution.attempted_solutions} solutions."
+                f"Tried {self._solution.attempted_solutions} solutions.\n"
+                f"Dependency cache: {cache_info.hits} hits, {cache_info.misses}"
+                f" misses, {cache_info.evictions} evicted by backtracking."
             )
 
+    @profiler.profiled("mixology.propagate")
     def _propagate(self, package: str) -> None:
         """
         Performs unit propagation on incompatibilities transitively
@@ -210,11 +310,13 @@ class VersionSolver:
             # general incompatibilities as time goes on. If we look at those first,
             # we can derive stronger assignments sooner and more eagerly find
             # conflicts.
-            for incompatibility in reversed(self._incompatibilities[package]):
+            for incompatibility in reversed(list(self._watchers[package])):
                 if incompatibility in self._contradicted_incompatibilities:
                     continue
 
-                result = self._propagate_incompatibility(incompatibility)
+                result = self._propagate_watched_incompatibility(
+                    incompatibility, package
+                )
 
                 if result is _conflict:
                     # If the incompatibility is satisfied by the solution, we use
@@ -241,6 +343,62 @@ class VersionSolver:
                     assert isinstance(result, str)
                     changed.add(result)
 
+    def _propagate_watched_incompatibility(
+        self, incompatibility: Incompatibility, package: str
+    ) -> str | object | None:
+        """
+        Same as _propagate_incompatibility() for an incompatibility
+        with a watched term about package.
+
+        As long as two watched terms are not satisfied by _solution, nothing
+        can be deduced from the incompatibility and the other terms do not
+        have to be looked at. If a watched term is satisfied, the incompatibility
+        watches another unsatisfied term (if there is one) from now on.
+        """
+        watched_terms = self._watched_terms[incompatibility]
+
+        unsatisfied: list[Term] = []
+        satisfied: list[Term] = []
+        for term in watched_terms:
+            relation = self._solution.relation(term)
+            if relation == SetRelation.DISJOINT:
+                self._contradict(incompatibility)
+                return None
+            if relation == SetRelation.OVERLAPPING:
+                unsatisfied.append(term)
+            else:
+                satisfied.append(term)
+
+        if satisfied and len(incompatibility.terms) > len(watched_terms):
+            for term in incompatibility.terms:
+                if term in watched_terms:
+                    continue
+
+                relation = self._solution.relation(term)
+                if relation == SetRelation.SUBSET:
+                    continue
+
+                self._move_watch(incompatibility, satisfied.pop(), term)
+                if relation == SetRelation.DISJOINT:
+                    self._contradict(incompatibility)
+                    return None
+
+                unsatisfied.append(term)
+                if not satisfied:
+                    break
+
+        if len(unsatisfied) > 1:
+            return None
+
+        # If *all* terms in incompatibility are satisfied by _solution, then
+        # incompatibility is satisfied and we have a conflict.
+        if not unsatisfied:
+            return _conflict
+
+        # If exactly one term in incompatibility is inconclusive, then it's
+        # almost satisfied and we can add the inverse of the term to _solution.
+        return self._derive(incompatibility, unsatisfied[0])
+
     def _propagate_incompatibility(
         self, incompatibility: Incompatibility
     ) -> str | object | None:
@@ -266,10 +424,7 @@ class VersionSolver:
                 # If term is already contradicted by _solution, then
                 # incompatibility is contradicted as well and there's nothing new we
                 # can deduce from it.
-                self._contradicted_incompatibilities.add(incompatibility)
-                self._contradicted_incompatibilities_by_level[
-                    self._solution.decision_level
-                ].add(incompatibility)
+                self._contradict(incompatibility)
                 return None
             elif relation == SetRelation.OVERLAPPING:
                 # If more than one term is inconclusive, we can't deduce anything about
@@ -287,10 +442,14 @@ class VersionSolver:
         if unsatisfied is None:
             return _conflict
 
-        self._contradicted_incompatibilities.add(incompatibility)
-        self._contradicted_incompatibilities_by_level[
-            self._solution.decision_level
-        ].add(incompatibility)
+        return self._derive(incompatibility, unsatisfied)
+
+    def _derive(self, incompatibility: Incompatibility, unsatisfied: Term) -> str:
+        """
+        Adds the negation of the unsatisfied term of an almost satisfied
+        incompatibility to _solution and returns the term's package name.
+        """
+        self._contradict(incompatibility)
 
         adverb = "not " if unsatisfied.is_positive() else ""
         self._log(f"derived: {adverb}{unsatisfied.dependency}")
@@ -302,6 +461,13 @@ class VersionSolver:
         complete_name: str = unsatisfied.dependency.complete_name
         return complete_name
 
+    def _contradict(self, incompatibility: Incompatibility) -> None:
+        self._contradicted_incompatibilities.add(incompatibility)
+        self._contradicted_incompatibilities_by_level[
+            self._solution.decision_level
+        ].add(incompatibility)
+
+    @profiler.profiled("mixology.resolve_conflict")
     def _resolve_conflict(self, incompatibility: Incompatibility) -> Incompatibility:
         """
         Given an incompatibility that's satisfied by _solution,
@@ -394,8 +560,13 @@ class VersionSolver:
                     self._dependency_cache.clear_level(level)
 
                 self._solution.backtrack(previous_satisfier_level)
+                profiler.count("mixology.backtracks")
                 if new_incompatibility:
                     self._add_incompatibility(incompatibility)
+                else:
+                    # The watched terms have been chosen for another state
+                    # of _solution, so we have to choose them again.
+                    self._watch_incompatibility(incompatibility)
 
                 return incompatibility
 
@@ -552,12 +723,71 @@ class VersionSolver:
                 preference = Preference.USE_LATEST
         return preference, -num_deps_upper_bound, not has_deps, -num_packages
 
-    def _choose_next(self, unsatisfied: list[Dependency]) -> Dependency:
+    def _prefetch_candidates(self, unsatisfied: list[Dependency]) -> None:
+        """
+        Lets the provider fetch the metadata of the best candidate
+        for each unsatisfied dependency concurrently
+        so that _get_comp_key() and complete_package() do not have to wait
+        for one package after the other.
+        """
+        if not self._provider.is_prefetching():
+            return
+
+        candidates: list[DependencyPackage] = []
+        for dependency in unsatisfied:
+            if dependency in self._prefetched_dependencies:
+                continue
+            self._prefetched_dependencies.add(dependency)
+
+            if dependency.is_direct_origin():
+                continue
+
+            locked = self._provider.get_locked(dependency)
+            if locked is not None:
+                candidates.append(locked)
+                continue
+
+            packages = self._dependency_cache.search_for(
+                dependency, self._solution.decision_level
+            )
+            if packages:
+                candidates.append(packages[0])
+
+        self._provider.prefetch_packages(candidates)
+
+    def _choose_next(self) -> Dependency | None:
         """
-        Chooses the next package to resolve.
+        Chooses the next package to resolve
+        or returns None if all dependencies are satisfied.
+
+        The unsatisfied dependency with the lowest comp key is chosen. If there are
+        several such dependencies, the first one in unsatisfied wins.
+        Instead of computing the minimum of all unsatisfied dependencies
+        for each decision, only changed dependencies are added to a priority queue.
         """
-        return min(unsatisfied, key=self._get_comp_key_cached)
+        updated = self._solution.updated_unsatisfied()
+        self._prefetch_candidates([dependency for _, dependency in updated])
+        for position, dependency in updated:
+            heapq.heappush(
+                self._unsatisfied_queue,
+                (
+                    self._get_comp_key_cached(dependency),
+                    position,
+                    next(self._unsatisfied_counter),
+                    dependency,
+                ),
+            )
+
+        queue = self._unsatisfied_queue
+        while queue:
+            _, position, _, dependency = queue[0]
+            if self._solution.is_unsatisfied(position, dependency):
+                return dependency
+            heapq.heappop(queue)
+
+        return None
 
+    @profiler.profiled("mixology.choose_package_version")
     def _choose_package_version(self) -> str | None:
         """
         Tries to select a version of a required package.
@@ -566,12 +796,11 @@ class VersionSolver:
         propagated by _propagate(), or None indicating that version solving is
         complete and a solution has been found.
         """
-        unsatisfied = self._solution.unsatisfied
-        if not unsatisfied:
+        dependency = self._choose_next()
+        if dependency is None:
             return None
 
-        dependency = self._choose_next(unsatisfied)
-
+        packages: list[DependencyPackage] = []
         locked = self._provider.get_locked(dependency)
         if locked is None:
             packages = self._dependency_cache.search_for(
@@ -612,10 +841,16 @@ class VersionSolver:
 
         if not conflict:
             self._solution.decide(package.package)
+            profiler.count("mixology.decisions")
             self._log(
                 f"selecting {package.package.complete_name}"
                 f" ({package.package.full_pretty_version})"
             )
+        else:
+            # The next best versions are likely to be tried soon.
+            self._provider.prefetch_packages(
+                packages[1 : PREFETCH_BACKTRACKING_DEPTH + 1]
+            )
 
         complete_name = dependency.complete_name
         return complete_name
@@ -635,19 +870,49 @@ class VersionSolver:
     def _add_incompatibility(self, incompatibility: Incompatibility) -> None:
         self._log(f"fact: {incompatibility}")
 
-        for term in incompatibility.terms:
-            if term.dependency.complete_name not in self._incompatibilities:
-                self._incompatibilities[term.dependency.complete_name] = []
+        if incompatibility in self._incompatibilities:
+            return
 
-            if (
-                incompatibility
-                in self._incompatibilities[term.dependency.complete_name]
-            ):
-                continue
+        self._incompatibilities.add(incompatibility)
+        self._watch_incompatibility(incompatibility)
+        profiler.count("mixology.incompatibilities")
 
-            self._incompatibilities[term.dependency.complete_name].append(
-                incompatibility
-            )
+    def _watch_incompatibility(self, incompatibility: Incompatibility) -> None:
+        """
+        Chooses the terms of incompatibility to watch.
+
+        Terms that are not satisfied by _solution are preferred. If there are
+        less than two such terms, the most recently satisfied terms are watched
+        because they will be the first ones to become unsatisfied again
+        when backtracking.
+        """
+        for term in self._watched_terms.pop(incompatibility, []):
+            del self._watchers[term.dependency.complete_name][incompatibility]
+
+        terms = incompatibility.terms
+        if len(terms) > 2:
+            unsatisfied = [t for t in terms if not self._solution.satisfies(t)]
+            if len(unsatisfied) >= 2:
+                terms = unsatisfied[:2]
+            else:
+                satisfied = sorted(
+                    (t for t in terms if t not in unsatisfied),
+                    key=lambda t: self._solution.satisfier(t).index,
+                    reverse=True,
+                )
+                terms = [*unsatisfied, *satisfied][:2]
+
+        self._watched_terms[incompatibility] = list(terms)
+        for term in terms:
+            self._watchers[term.dependency.complete_name][incompatibility] = None
+
+    def _move_watch(
+        self, incompatibility: Incompatibility, old: Term, new: Term
+    ) -> None:
+        watched_terms = self._watched_terms[incompatibility]
+        watched_terms[watched_terms.index(old)] = new
+        del self._watchers[old.dependency.complete_name][incompatibility]
+        self._watchers[new.dependency.complete_name][incompatibility] = None
 
     def _log(self, text: str) -> None:
         self._provider.debug(text, self._solution.attempted_solutions)
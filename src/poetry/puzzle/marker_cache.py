@@ -0,0 +1,130 @@
+"""
+Cached marker operations for dependency resolution.
+
+Resolving packages with many environment specific dependencies (e.g. wheels
+for different platforms) combines the same markers over and over again.
+The functions of this module memoize the results of these operations
+in bounded caches. Further, all markers passing through this module
+are interned so that equal markers are represented by the same object,
+which saves memory and allows cheap identity comparisons on cache hits.
+"""
+
+from __future__ import annotations
+
+import functools
+
+from collections.abc import Collection
+from typing import TYPE_CHECKING
+from typing import Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from functools import _CacheInfo
+
+    from poetry.core.version.markers import BaseMarker
+
+
+CACHE_SIZE = 2**14
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def intern(marker: BaseMarker) -> BaseMarker:
+    """
+    Return the canonical object of all markers that are equal to the given marker.
+    """
+    return marker
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def intersect(marker: BaseMarker, other: BaseMarker) -> BaseMarker:
+    return intern(marker.intersect(other))
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def union(marker: BaseMarker, other: BaseMarker) -> BaseMarker:
+    return intern(marker.union(other))
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def invert(marker: BaseMarker) -> BaseMarker:
+    return intern(marker.invert())
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def is_empty(marker: BaseMarker) -> bool:
+    return marker.is_empty()
+
+
+class FrozenEnvironment:
+    """
+    An immutable snapshot of an environment to validate markers against.
+
+    Equal environments are represented by the same object so that
+    the results of validating markers can be memoized by identity.
+    Use :func:`freeze` to create instances.
+    """
+
+    __slots__ = ("_environment",)
+
+    def __init__(self, environment: Mapping[str, Any]) -> None:
+        self._environment = environment
+
+    def __repr__(self) -> str:
+        return f"FrozenEnvironment({self._environment!r})"
+
+
+def freeze(environment: Mapping[str, Any]) -> FrozenEnvironment:
+    """
+    Return the frozen representation of an environment.
+
+    Sets of values (e.g. extras) are frozen into frozensets, other collections
+    into tuples so that their order is kept. Freezing an environment is not free,
+    so it should be done once per environment and not per validated marker.
+    """
+    return _intern_environment(
+        tuple(
+            (name, _freeze_value(value)) for name, value in sorted(environment.items())
+        )
+    )
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _intern_environment(items: tuple[tuple[str, Any], ...]) -> FrozenEnvironment:
+    return FrozenEnvironment(dict(items))
+
+
+def _freeze_value(value: Any) -> Any:
+    if isinstance(value, str) or not isinstance(value, Collection):
+        return value
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    return tuple(value)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def validate(marker: BaseMarker, environment: FrozenEnvironment) -> bool:
+    return marker.validate(environment._environment)
+
+
+_CACHED_FUNCTIONS = {
+    "intern": intern,
+    "intersect": intersect,
+    "union": union,
+    "invert": invert,
+    "is_empty": is_empty,
+    "validate": validate,
+    "freeze": _intern_environment,
+}
+
+
+def cache_info() -> dict[str, _CacheInfo]:
+    """
+    Return the statistics of all caches of this module.
+    """
+    return {name: func.cache_info() for name, func in _CACHED_FUNCTIONS.items()}
+
+
+def cache_clear() -> None:
+    for func in _CACHED_FUNCTIONS.values():
+        func.cache_clear()
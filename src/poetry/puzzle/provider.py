@@ -4,9 +4,12 @@ import functools
 import itertools
 import logging
 import re
+import threading
 import time
 
 from collections import defaultdict
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from typing import TYPE_CHECKING
 from typing import Any
@@ -29,8 +32,12 @@ from poetry.mixology.term import Term
 from poetry.packages import DependencyPackage
 from poetry.packages.direct_origin import DirectOrigin
 from poetry.packages.package_collection import PackageCollection
+from poetry.puzzle import marker_cache
 from poetry.puzzle.exceptions import OverrideNeededError
+from poetry.repositories.cached_repository import CachedRepository
 from poetry.repositories.repository_pool import Priority
+from poetry.utils import profiler
+from poetry.version import version_cache
 
 
 if TYPE_CHECKING:
@@ -127,6 +134,7 @@ class Provider:
         self._direct_origin = DirectOrigin(self._pool.artifact_cache)
         self._io = io
         self._env: Env | None = None
+        self._marker_env: marker_cache.FrozenEnvironment | None = None
         self._package_python_constraint = package.python_constraint
         self._is_debugging: bool = self._io.is_debug() or self._io.is_very_verbose()
         self._overrides: dict[Package, dict[str, Dependency]] = {}
@@ -147,12 +155,22 @@ class Provider:
             )
         for dependency_packages in self._locked.values():
             dependency_packages.sort(
-                key=lambda p: p.package.version,
+                key=lambda p: version_cache.sort_key(p.package.version),
                 reverse=True,
             )
 
-        self.get_package_from_pool = functools.cache(self._pool.package)
+        # Maps (name, version, repository name) to the (possibly still running)
+        # retrieval of the corresponding package from the pool. Sharing futures
+        # ensures that a package is never fetched twice, even if it has been
+        # requested speculatively by the metadata prefetcher.
+        self._pool_packages: dict[tuple[str, Version, str | None], Future[Package]] = {}
+        self._pool_packages_lock = threading.Lock()
+        self._prefetcher: ThreadPoolExecutor | None = None
         self._refreshed: set[tuple[str, Version, str | None]] = set()
+        # (name, source name) of all packages that have been searched in the pool
+        self._searched: set[tuple[NormalizedName, str | None]] = set()
+        # Locked packages whose metadata is used as is (identified by id)
+        self._trusted: set[int] = set()
 
     @property
     def pool(self) -> RepositoryPool:
@@ -162,6 +180,18 @@ class Provider:
     def use_latest(self) -> Collection[NormalizedName]:
         return self._use_latest
 
+    @property
+    def searched(self) -> Collection[tuple[NormalizedName, str | None]]:
+        return self._searched
+
+    @property
+    def env(self) -> Env | None:
+        return self._env
+
+    @property
+    def active_root_extras(self) -> Collection[NormalizedName] | None:
+        return self._active_root_extras
+
     @functools.cached_property
     def _overrides_marker_intersection(self) -> BaseMarker:
         overrides_marker_intersection: BaseMarker = AnyMarker()
@@ -181,6 +211,37 @@ class Provider:
     def is_debugging(self) -> bool:
         return self._is_debugging
 
+    def clone(self) -> Provider:
+        """
+        Return a provider with the same configuration
+        that does not share any state of a resolution with this provider.
+        """
+        provider = Provider(
+            self._package,
+            self._pool,
+            self._io,
+            active_root_extras=self._active_root_extras,
+        )
+        provider._locked = self._locked
+        provider._env = self._env
+        provider._marker_env = self._marker_env
+        provider._package_python_constraint = self._package_python_constraint
+        provider._source_root = self._source_root
+        provider._use_latest = self._use_latest
+        provider._load_deferred = self._load_deferred
+        provider._prefetcher = self._prefetcher
+        # A copy, so that falling back to a full resolution
+        # does not affect this provider.
+        provider._trusted = set(self._trusted)
+        return provider
+
+    def merge_searched(self, other: Provider) -> None:
+        """
+        Record the packages searched by another provider (e.g. a clone)
+        as searched by this provider.
+        """
+        self._searched.update(other.searched)
+
     def set_overrides(self, overrides: dict[Package, dict[str, Dependency]]) -> None:
         self._overrides = overrides
         self.__dict__.pop("_python_constraint", None)
@@ -189,6 +250,45 @@ class Provider:
     def load_deferred(self, load_deferred: bool) -> None:
         self._load_deferred = load_deferred
 
+    def trust_locked(self, trust_locked: bool) -> None:
+        """
+        Use the metadata of locked packages (as recorded in the lock file)
+        instead of retrieving it from the pool again.
+
+        Locked packages that are reachable from a requirement of the root package
+        that is not satisfied by any locked package anymore (i.e. a requirement
+        that has been added or changed) are not trusted.
+        """
+        self._trusted.clear()
+        if not trust_locked:
+            return
+
+        affected = {
+            dependency.name
+            for dependency in self._package.all_requires
+            if not any(
+                locked.package.satisfies(dependency)
+                for locked in self._locked.get(dependency.name, [])
+            )
+        }
+        stack = list(affected)
+        while stack:
+            for locked in self._locked.get(stack.pop(), []):
+                for requirement in locked.package.requires:
+                    if requirement.name not in affected:
+                        affected.add(requirement.name)
+                        stack.append(requirement.name)
+
+        for name, locked_packages in self._locked.items():
+            if name in affected:
+                continue
+            for locked in locked_packages:
+                if not locked.package.is_direct_origin():
+                    self._trusted.add(id(locked.package))
+
+    def is_trusting_locked(self) -> bool:
+        return bool(self._trusted)
+
     @contextmanager
     def use_source_root(self, source_root: Path) -> Iterator[Provider]:
         original_source_root = self._source_root
@@ -204,6 +304,7 @@ class Provider:
         original_python_constraint = self._package_python_constraint
 
         self._env = env
+        self._marker_env = marker_cache.freeze(env.marker_env)
         # We use the stable version here to improve support of environments of Python pre-release
         # versions, e.g. Python 3.14rc2. Without using the stable version here, a dependency with
         # a marker like `python_version >= "3.14"` would not be installed.
@@ -215,8 +316,122 @@ class Provider:
             yield self
         finally:
             self._env = None
+            self._marker_env = None
             self._package_python_constraint = original_python_constraint
 
+    @contextmanager
+    def use_metadata_prefetch(self, max_workers: int) -> Iterator[Provider]:
+        """
+        Speculatively retrieve release information of likely candidates
+        in background threads while solving.
+
+        Without this context, prefetch_packages() is a no-op.
+        """
+        self._prefetcher = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="poetry-prefetch"
+        )
+
+        try:
+            yield self
+        finally:
+            prefetcher, self._prefetcher = self._prefetcher, None
+            prefetcher.shutdown(wait=True, cancel_futures=True)
+            with self._pool_packages_lock:
+                for key, future in list(self._pool_packages.items()):
+                    if future.cancelled():
+                        del self._pool_packages[key]
+
+    def is_prefetching(self) -> bool:
+        return self._prefetcher is not None
+
+    def prefetch_packages(self, packages: Iterable[DependencyPackage]) -> None:
+        """
+        Schedule the retrieval of the given packages from the pool so that
+        a later call to complete_package() will most likely not have to wait
+        for the network.
+        """
+        if self._prefetcher is None:
+            return
+
+        scheduled: list[tuple[Package, str | None]] = []
+        for dependency_package in packages:
+            package = dependency_package.package
+            source_name = dependency_package.dependency.source_name
+            if (
+                package.is_root()
+                or package.is_direct_origin()
+                or id(package) in self._trusted
+                or (package.pretty_name, package.version, source_name)
+                in self._pool_packages
+            ):
+                continue
+            scheduled.append((package, source_name))
+
+        self._preload_release_info(scheduled)
+        for package, source_name in scheduled:
+            self._get_pool_package_future(
+                package.pretty_name, package.version, source_name
+            )
+
+    def _preload_release_info(self, packages: list[tuple[Package, str | None]]) -> None:
+        # Reading the cached release information of all versions of a package
+        # at once is considerably faster than reading them one by one.
+        versions: defaultdict[tuple[NormalizedName, str | None], list[Version]] = (
+            defaultdict(list)
+        )
+        for package, source_name in packages:
+            versions[package.name, source_name].append(package.version)
+
+        for (name, source_name), package_versions in versions.items():
+            repositories = (
+                [self._pool.repository(source_name)]
+                if source_name
+                else self._pool.repositories
+            )
+            for repository in repositories:
+                if isinstance(repository, CachedRepository):
+                    repository.preload_release_info(name, package_versions)
+
+    def get_package_from_pool(
+        self, name: str, version: Version, repository_name: str | None = None
+    ) -> Package:
+        future = self._get_pool_package_future(name, version, repository_name)
+        try:
+            return future.result()
+        except BaseException:
+            # Do not remember failures (which might be temporary) so that
+            # the next request will try again.
+            with self._pool_packages_lock:
+                if self._pool_packages.get((name, version, repository_name)) is future:
+                    del self._pool_packages[(name, version, repository_name)]
+            raise
+
+    def _get_pool_package_future(
+        self, name: str, version: Version, repository_name: str | None
+    ) -> Future[Package]:
+        key = (name, version, repository_name)
+        with self._pool_packages_lock:
+            future = self._pool_packages.get(key)
+            if future is not None:
+                return future
+
+            if self._prefetcher is not None:
+                future = self._prefetcher.submit(
+                    self._pool.package, name, version, repository_name
+                )
+                self._pool_packages[key] = future
+                return future
+
+            future = Future()
+            self._pool_packages[key] = future
+
+        try:
+            future.set_result(self._pool.package(name, version, repository_name))
+        except BaseException as e:
+            future.set_exception(e)
+
+        return future
+
     @contextmanager
     def use_latest_for(self, names: Collection[NormalizedName]) -> Iterator[Provider]:
         self._use_latest = names
@@ -275,6 +490,7 @@ class Provider:
 
         return package
 
+    @profiler.profiled("provider.search_for")
     def search_for(self, dependency: Dependency) -> list[DependencyPackage]:
         """
         Search for the specifications that match the given dependency.
@@ -299,13 +515,14 @@ class Provider:
             packages = [direct_origin_package]
             return PackageCollection(dependency, packages)
 
+        self._searched.add((dependency.name, dependency.source_name))
         packages = self._pool.find_packages(dependency)
 
         packages.sort(
             key=lambda p: (
                 not p.yanked,
                 not p.is_prerelease() and not dependency.allows_prereleases(),
-                p.version,
+                version_cache.sort_key(p.version),
             ),
             reverse=True,
         )
@@ -462,6 +679,7 @@ class Provider:
         """
         return sorted(f["file"] + f["hash"] for f in files)
 
+    @profiler.profiled("provider.complete_package")
     def complete_package(
         self, dependency_package: DependencyPackage
     ) -> DependencyPackage:
@@ -473,7 +691,7 @@ class Provider:
             package = dependency_package.package
             dependency = dependency_package.dependency
             requires = package.all_requires
-        elif package.is_direct_origin():
+        elif package.is_direct_origin() or id(package) in self._trusted:
             requires = package.requires
         else:
             if (
@@ -481,7 +699,7 @@ class Provider:
                 package.version,
                 dependency.source_name,
             ) in self._refreshed:
-                # circumvent lru_cache to avoid unnecessary refresh
+                # circumvent cache to avoid unnecessary refresh
                 pool_package = self.pool.package(
                     package.pretty_name,
                     package.version,
@@ -547,6 +765,11 @@ class Provider:
 
             _dependencies.append(new_dependency)
 
+        marker_env = (
+            marker_cache.freeze(self._marker_values(self._active_root_extras))
+            if self._env is not None and package.is_root()
+            else self._marker_env
+        )
         for dep in requires:
             if not self._python_constraint.allows_any(dep.python_constraint):
                 continue
@@ -554,14 +777,10 @@ class Provider:
             if dep.name in self.UNSAFE_PACKAGES:
                 continue
 
-            if self._env:
-                marker_values = (
-                    self._marker_values(self._active_root_extras)
-                    if package.is_root()
-                    else self._env.marker_env
-                )
-                if not dep.marker.validate(marker_values):
-                    continue
+            if marker_env is not None and not marker_cache.validate(
+                dep.marker, marker_env
+            ):
+                continue
 
             if not package.is_root() and (
                 (dep.is_optional() and dep.name not in optional_dependencies)
@@ -655,7 +874,9 @@ class Provider:
                             )
                         )
                 if all(len(d) == 1 for d in duplicates_by_extras.values()) and all(
-                    d1[0].marker.intersect(d2[0].marker).is_empty()
+                    marker_cache.is_empty(
+                        marker_cache.intersect(d1[0].marker, d2[0].marker)
+                    )
                     for d1, d2 in itertools.combinations(
                         duplicates_by_extras.values(), 2
                     )
@@ -679,9 +900,11 @@ class Provider:
             deps = [
                 dep
                 for dep in deps
-                if not self._overrides_marker_intersection.intersect(
-                    dep.marker
-                ).is_empty()
+                if not marker_cache.is_empty(
+                    marker_cache.intersect(
+                        self._overrides_marker_intersection, dep.marker
+                    )
+                )
             ]
             if len(deps) < 2:
                 if not deps or (len(deps) == 1 and deps[0].constraint.is_empty()):
@@ -928,7 +1151,9 @@ class Provider:
         return merged_dependencies
 
     def _is_relevant_marker(
-        self, marker: BaseMarker, active_extras: Collection[NormalizedName] | None
+        self,
+        marker: BaseMarker,
+        extras_env: marker_cache.FrozenEnvironment | None,
     ) -> bool:
         """
         A marker is relevant if
@@ -938,14 +1163,18 @@ class Provider:
         - allowed by the environment (only during installation)
         """
         return (
-            not marker.is_empty()
+            not marker_cache.is_empty(marker)
             and self._python_constraint.allows_any(
                 get_python_constraint_from_marker(marker)
             )
-            and (active_extras is None or marker.validate({"extra": active_extras}))
-            and (not self._env or marker.validate(self._env.marker_env))
+            and (extras_env is None or marker_cache.validate(marker, extras_env))
+            and (
+                self._marker_env is None
+                or marker_cache.validate(marker, self._marker_env)
+            )
         )
 
+    @profiler.profiled("provider.resolve_overlapping_markers")
     def _resolve_overlapping_markers(
         self,
         package: Package,
@@ -967,23 +1196,14 @@ class Provider:
         # we merge duplicate dependencies by constraint.
         dependencies = self._merge_dependencies_by_constraint(dependencies)
 
+        extras_env = (
+            marker_cache.freeze({"extra": active_extras})
+            if active_extras is not None
+            else None
+        )
         new_dependencies = []
-        for uses in itertools.product([True, False], repeat=len(dependencies)):
-            # intersection of markers
-            # For performance optimization, we don't just intersect all markers at once,
-            # but intersect them one after the other to get empty markers early.
-            # Further, we intersect the inverted markers at last because
-            # they are more likely to overlap than the non-inverted ones.
-            markers = (
-                dep.marker if use else dep.marker.invert()
-                for use, dep in sorted(
-                    zip(uses, dependencies), key=lambda ud: ud[0], reverse=True
-                )
-            )
-            used_marker_intersection: BaseMarker = AnyMarker()
-            for m in markers:
-                used_marker_intersection = used_marker_intersection.intersect(m)
-            if not self._is_relevant_marker(used_marker_intersection, active_extras):
+        for uses, used_marker_intersection in self._marker_combinations(dependencies):
+            if not self._is_relevant_marker(used_marker_intersection, extras_env):
                 continue
 
             # intersection of constraints
@@ -1037,6 +1257,57 @@ class Provider:
         # resolved, there might be new dependencies with the same constraint.
         return self._merge_dependencies_by_constraint(new_dependencies)
 
+    @staticmethod
+    def _marker_combinations(
+        dependencies: Sequence[Dependency],
+    ) -> Iterator[tuple[tuple[bool, ...], BaseMarker]]:
+        """
+        Yield the combinations of used and inverted markers of the dependencies
+        in the order of ``itertools.product([True, False], repeat=n)``
+        together with the intersection of the respective markers.
+        Combinations whose intersection is empty are skipped.
+
+        Instead of intersecting all markers for each combination, the combinations
+        are traversed as a tree so that the intersection of the used markers is
+        shared by all combinations with the same prefix. If this intersection
+        is empty, the whole subtree is skipped. That is the common case for
+        dependencies with mutually exclusive markers (e.g. different platforms),
+        so that only a small part of the 2^n combinations has to be evaluated.
+
+        For performance optimization, the inverted markers are intersected at last
+        because they are more likely to overlap than the non-inverted ones.
+        """
+        inverted_markers = [marker_cache.invert(dep.marker) for dep in dependencies]
+
+        def visit(
+            uses: tuple[bool, ...], used_marker_intersection: BaseMarker
+        ) -> Iterator[tuple[tuple[bool, ...], BaseMarker]]:
+            if marker_cache.is_empty(used_marker_intersection):
+                return
+
+            index = len(uses)
+            if index < len(dependencies):
+                yield from visit(
+                    (*uses, True),
+                    marker_cache.intersect(
+                        used_marker_intersection, dependencies[index].marker
+                    ),
+                )
+                yield from visit((*uses, False), used_marker_intersection)
+                return
+
+            marker_intersection = used_marker_intersection
+            for use, inverted_marker in zip(uses, inverted_markers):
+                if not use:
+                    marker_intersection = marker_cache.intersect(
+                        marker_intersection, inverted_marker
+                    )
+                    if marker_cache.is_empty(marker_intersection):
+                        return
+            yield uses, marker_intersection
+
+        yield from visit((), AnyMarker())
+
     def _marker_values(
         self, extras: Collection[NormalizedName] | None = None
     ) -> dict[str, Any]:
@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from poetry.packages.locker import Locker
+from poetry.repositories.exceptions import PackageNotFoundError
+from poetry.repositories.http_repository import HTTPRepository
+from poetry.utils.cache import SOLVER_RESULT_CACHE_DIRECTORY
+from poetry.utils.cache import get_cache
+from poetry.utils.cache import get_cache_index
+
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from packaging.utils import NormalizedName
+    from poetry.core.packages.package import Package
+    from poetry.core.packages.project_package import ProjectPackage
+
+    from poetry.config.config import Config
+    from poetry.packages.transitive_package_info import TransitivePackageInfo
+    from poetry.repositories import RepositoryPool
+    from poetry.utils.cache import CacheIndex
+    from poetry.utils.cache import FileCache
+    from poetry.utils.cache import SQLiteCache
+
+
+logger = logging.getLogger(__name__)
+
+
+class SolverResultCache:
+    """
+    On-disk cache for the results of dependency resolution.
+
+    Results are stored under a key that is derived from all inputs of the solver
+    (root package, repository pool, locked packages and packages to update).
+    However, the same inputs may lead to a different result as soon as a release
+    is added to (or removed from) a repository. Therefore, each entry records
+    a fingerprint of every repository page that was consulted during resolution
+    and is only returned if none of these pages has changed since.
+
+    The resolved packages themselves are stored in the lock file format.
+    """
+
+    VERSION = "1.0.0"
+
+    def __init__(
+        self, cache_dir: Path, backend: str = "files", index: CacheIndex | None = None
+    ) -> None:
+        self._cache_dir = cache_dir
+        self._index = index
+        self._cache: FileCache[dict[str, Any]] | SQLiteCache[dict[str, Any]] = (
+            get_cache(cache_dir / "entries", backend, index)
+        )
+
+    @classmethod
+    def create(cls, config: Config) -> SolverResultCache | None:
+        """
+        Return the result cache in the configured cache directory
+        or None if caching results is disabled.
+        """
+        if not config.get("solver.result-cache", True):
+            return None
+
+        return cls(
+            config.repository_cache_directory / SOLVER_RESULT_CACHE_DIRECTORY,
+            config.get("cache-backend"),
+            get_cache_index(config),
+        )
+
+    @classmethod
+    def key(
+        cls,
+        root: ProjectPackage,
+        pool: RepositoryPool,
+        locked: Iterable[Package],
+        use_latest: Collection[NormalizedName],
+        active_root_extras: Collection[NormalizedName] | None,
+        trust_locked: bool = False,
+    ) -> str | None:
+        """
+        Returns the key for the given solver inputs
+        or None if the result of such a resolution must not be cached.
+        """
+        if not cls._is_cacheable(pool):
+            return None
+
+        dependencies = []
+        for dependency in root.all_requires:
+            if dependency.is_direct_origin():
+                # The contents of path, VCS and URL dependencies might change
+                # without any change of the dependency itself.
+                return None
+            dependencies.append(
+                (
+                    sorted(dependency.groups),
+                    dependency.to_pep_508(),
+                    dependency.source_name,
+                    dependency.allows_prereleases(),
+                    dependency.is_optional(),
+                )
+            )
+
+        content = {
+            "version": cls.VERSION,
+            "root": [
+                root.name,
+                root.python_versions,
+                sorted(dependencies),
+                {
+                    extra: sorted(dep.name for dep in deps)
+                    for extra, deps in sorted(root.extras.items())
+                },
+                sorted(active_root_extras) if active_root_extras is not None else None,
+            ],
+            "sources": [
+                [repo.name, pool.get_priority(repo.name).name, repo.url]
+                for repo in pool.all_repositories
+                if isinstance(repo, HTTPRepository)
+            ],
+            "locked": sorted(
+                [
+                    package.name,
+                    package.version.text,
+                    package.source_type or "",
+                    package.source_url or "",
+                    package.source_reference or "",
+                    package.source_resolved_reference or "",
+                ]
+                for package in locked
+            ),
+            "use-latest": sorted(use_latest),
+            "trust-locked": trust_locked,
+        }
+
+        return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+
+    def get(
+        self, key: str, pool: RepositoryPool
+    ) -> dict[Package, TransitivePackageInfo] | None:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        pages = entry["pages"]
+        if self._fingerprints(pool, self._parse_page_keys(pages)) != pages:
+            logger.debug("Cached resolution result is outdated.")
+            return None
+
+        lock_path = self._lock_path(key)
+        locker = Locker(lock_path, {})
+        if not locker.is_locked():
+            return None
+        self._touch(lock_path)
+
+        try:
+            repository = locker.locked_repository()
+            transitive_infos = locker.locked_packages()
+        except RuntimeError as e:
+            logger.debug("Unable to read cached resolution result: %s", e)
+            return None
+
+        depths = entry["depths"]
+        packages: dict[Package, TransitivePackageInfo] = {}
+        for package in repository.packages:
+            transitive_info = transitive_infos[package]
+            transitive_info.depth = depths.get(self._package_key(package), 0)
+            packages[package] = transitive_info
+
+        return packages
+
+    def put(
+        self,
+        key: str,
+        pool: RepositoryPool,
+        root: ProjectPackage,
+        packages: dict[Package, TransitivePackageInfo],
+        searched: Iterable[tuple[NormalizedName, str | None]],
+    ) -> None:
+        consulted = set(searched)
+        for package in packages:
+            if package.is_direct_origin():
+                return
+            consulted.add(
+                (
+                    package.name,
+                    package.source_reference
+                    if package.source_type == "legacy"
+                    else None,
+                )
+            )
+
+        pages = self._fingerprints(pool, consulted)
+
+        lock_path = self._lock_path(key)
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        Locker(lock_path, {}).set_lock_data(root, packages)
+        self._touch(lock_path)
+        self._cache.put(
+            key,
+            {
+                "pages": pages,
+                "depths": {
+                    self._package_key(package): info.depth
+                    for package, info in packages.items()
+                },
+            },
+        )
+
+    @staticmethod
+    def _is_cacheable(pool: RepositoryPool) -> bool:
+        # Only the pages of HTTP repositories can be fingerprinted.
+        return bool(pool.all_repositories) and all(
+            isinstance(repo, HTTPRepository) and not repo.disable_cache
+            for repo in pool.all_repositories
+        )
+
+    @staticmethod
+    def _fingerprints(
+        pool: RepositoryPool, consulted: Iterable[tuple[NormalizedName, str | None]]
+    ) -> dict[str, str | None]:
+        pages: dict[str, tuple[HTTPRepository, NormalizedName]] = {}
+        for name, source_name in consulted:
+            if source_name:
+                repositories = [pool.repository(source_name)]
+            else:
+                # Supplemental repositories are only consulted if no other
+                # repository provides a package. However, to be on the safe side,
+                # we just take them into account anyway.
+                repositories = pool.repositories
+
+            for repo in repositories:
+                assert isinstance(repo, HTTPRepository)
+                pages.setdefault(f"{repo.name}/{name}", (repo, name))
+
+        # Pages that have not been retrieved during resolution
+        # (e.g. when checking a cached result) are fetched in parallel.
+        pool.fetch_pages(pages.values())
+
+        fingerprints: dict[str, str | None] = {}
+        for page_key, (repo, name) in pages.items():
+            try:
+                fingerprints[page_key] = repo.get_page(name).fingerprint
+            except PackageNotFoundError:
+                fingerprints[page_key] = None
+
+        return fingerprints
+
+    @staticmethod
+    def _parse_page_keys(
+        pages: dict[str, str | None],
+    ) -> set[tuple[NormalizedName, str | None]]:
+        consulted: set[tuple[NormalizedName, str | None]] = set()
+        for page_key in pages:
+            source_name, name = page_key.rsplit("/", 1)
+            consulted.add((name, source_name))  # type: ignore[arg-type]
+        return consulted
+
+    @staticmethod
+    def _package_key(package: Package) -> str:
+        return f"{package.unique_name} {package.source_url or ''}"
+
+    def _lock_path(self, key: str) -> Path:
+        # Named after the hash of the key (like the entry itself)
+        # so that it can be evicted together with the entry.
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self._cache_dir / "locks" / f"{name}.lock"
+
+    def _touch(self, lock_path: Path) -> None:
+        if self._index is not None:
+            self._index.touch(lock_path, lock_path.stat().st_size)
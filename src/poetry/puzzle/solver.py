@@ -4,6 +4,7 @@ import functools
 import time
 
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
@@ -13,13 +14,18 @@ from poetry.core.version.markers import MultiMarker
 from poetry.core.version.markers import SingleMarker
 from poetry.core.version.markers import parse_marker
 
+from poetry.config.config import Config
 from poetry.mixology import resolve_version
 from poetry.mixology.failure import SolveFailureError
 from poetry.packages.transitive_package_info import TransitivePackageInfo
+from poetry.puzzle import marker_cache
 from poetry.puzzle.exceptions import OverrideNeededError
 from poetry.puzzle.exceptions import SolverProblemError
 from poetry.puzzle.provider import Indicator
 from poetry.puzzle.provider import Provider
+from poetry.puzzle.result_cache import SolverResultCache
+from poetry.repositories.cached_repository import CachedRepository
+from poetry.utils import profiler
 
 
 if TYPE_CHECKING:
@@ -29,6 +35,7 @@ if TYPE_CHECKING:
 
     from cleo.io.io import IO
     from packaging.utils import NormalizedName
+    from poetry.core.constraints.version import Version
     from poetry.core.constraints.version import VersionConstraint
     from poetry.core.packages.dependency import Dependency
     from poetry.core.packages.package import Package
@@ -36,6 +43,7 @@ if TYPE_CHECKING:
     from poetry.core.version.markers import BaseMarker
     from typing_extensions import Self
 
+    from poetry.mixology.result import SolverResult
     from poetry.puzzle.transaction import Transaction
     from poetry.repositories import RepositoryPool
     from poetry.utils.env import Env
@@ -56,14 +64,19 @@ class Solver:
         locked: list[Package],
         io: IO,
         active_root_extras: Collection[NormalizedName] | None = None,
+        config: Config | None = None,
+        result_cache: SolverResultCache | None = None,
+        provider: Provider | None = None,
     ) -> None:
         self._package = package
         self._pool = pool
         self._installed_packages = installed
         self._locked_packages = locked
         self._io = io
+        self._config = config or Config.create()
+        self._result_cache = result_cache
 
-        self._provider = Provider(
+        self._provider = provider or Provider(
             self._package,
             self._pool,
             self._io,
@@ -71,6 +84,7 @@ class Solver:
             active_root_extras=active_root_extras,
         )
         self._overrides: list[dict[Package, dict[str, Dependency]]] = []
+        self._concurrent_overrides = True
 
     @property
     def provider(self) -> Provider:
@@ -86,14 +100,39 @@ class Solver:
     ) -> Transaction:
         from poetry.puzzle.transaction import Transaction
 
-        with self._progress(), self._provider.use_latest_for(use_latest or []):
+        use_latest = use_latest or []
+        cache_key = self._result_cache_key(use_latest)
+
+        with (
+            self._progress(),
+            self._provider.use_latest_for(use_latest),
+            self._metadata_prefetch(),
+        ):
             start = time.time()
-            packages = self._solve()
-            # simplify markers by removing redundant information
-            for transitive_info in packages.values():
-                for group, marker in transitive_info.markers.items():
-                    transitive_info.markers[group] = simplify_marker(
-                        marker, self._package.python_constraint
+            cached_packages = (
+                self._result_cache.get(cache_key, self._pool)
+                if self._result_cache is not None and cache_key is not None
+                else None
+            )
+            if cached_packages is not None:
+                self._provider.debug("Using cached resolution result.")
+                profiler.count("solver.result_cache_hits")
+                packages = cached_packages
+            else:
+                packages = self._solve()
+                # simplify markers by removing redundant information
+                for transitive_info in packages.values():
+                    for group, marker in transitive_info.markers.items():
+                        transitive_info.markers[group] = simplify_marker(
+                            marker, self._package.python_constraint
+                        )
+                if self._result_cache is not None and cache_key is not None:
+                    self._result_cache.put(
+                        cache_key,
+                        self._pool,
+                        self._package,
+                        packages,
+                        self._provider.searched,
                     )
             end = time.time()
 
@@ -142,6 +181,33 @@ class Solver:
             ):
                 yield
 
+    def _result_cache_key(self, use_latest: Collection[NormalizedName]) -> str | None:
+        # Results that depend on the environment are not cached.
+        if self._result_cache is None or self._provider.env is not None:
+            return None
+
+        return SolverResultCache.key(
+            self._package,
+            self._pool,
+            self._locked_packages,
+            use_latest,
+            self._provider.active_root_extras,
+            self._provider.is_trusting_locked(),
+        )
+
+    @contextmanager
+    def _metadata_prefetch(self) -> Iterator[None]:
+        # Prefetching only pays off if metadata has to be retrieved
+        # from (potentially) remote repositories.
+        if not self._config.get("installer.parallel", True) or not any(
+            isinstance(repo, CachedRepository) for repo in self._pool.all_repositories
+        ):
+            yield
+            return
+
+        with self._provider.use_metadata_prefetch(self._max_workers()):
+            yield
+
     def _solve_in_compatibility_mode(
         self,
         overrides: tuple[dict[Package, dict[str, Dependency]], ...],
@@ -152,26 +218,108 @@ class Solver:
                 dict[Package, TransitivePackageInfo],
             ]
         ] = []
-        for override in overrides:
-            self._provider.debug(
-                # ignore the warning as provider does not do interpolation
-                "<comment>Retrying dependency resolution "
-                f"with the following overrides ({override}).</comment>"
+        max_workers = self._max_override_workers(overrides)
+        if max_workers > 1:
+            override_packages = self._solve_overrides_concurrently(
+                overrides, max_workers
             )
-            self._provider.set_overrides(override)
-            new_packages = self._solve()
-            override_packages.append((override, new_packages))
+        else:
+            for override in overrides:
+                self._provider.debug(
+                    # ignore the warning as provider does not do interpolation
+                    "<comment>Retrying dependency resolution "
+                    f"with the following overrides ({override}).</comment>"
+                )
+                self._provider.set_overrides(override)
+                new_packages = self._solve()
+                override_packages.append((override, new_packages))
 
         return merge_override_packages(
             override_packages, self._package.python_constraint
         )
 
+    def _max_override_workers(
+        self, overrides: tuple[dict[Package, dict[str, Dependency]], ...]
+    ) -> int:
+        # Solving with different overrides in parallel is only safe if
+        # the solves do not share any mutable packages. Packages from
+        # remote repositories are created anew each time they are retrieved,
+        # but in-memory repositories, locked packages whose metadata is trusted
+        # and direct origin dependencies are shared. Further, solving in parallel
+        # only pays off if there might be metadata to retrieve from remote.
+        if (
+            len(overrides) < 2
+            or not self._concurrent_overrides
+            or self._provider.is_debugging()
+            or self._provider.is_trusting_locked()
+            or not all(
+                isinstance(repo, CachedRepository)
+                for repo in self._pool.all_repositories
+            )
+            or any(dep.is_direct_origin() for dep in self._package.all_requires)
+        ):
+            return 1
+
+        return min(len(overrides), self._max_workers())
+
+    def _max_workers(self) -> int:
+        if not self._config.get("installer.parallel", True):
+            return 1
+        return self._config.installer_max_workers
+
+    def _solve_overrides_concurrently(
+        self,
+        overrides: tuple[dict[Package, dict[str, Dependency]], ...],
+        max_workers: int,
+    ) -> list[
+        tuple[
+            dict[Package, dict[str, Dependency]], dict[Package, TransitivePackageInfo]
+        ]
+    ]:
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="poetry-solver"
+        )
+        try:
+            futures = [
+                executor.submit(self._solve_override, override)
+                for override in overrides
+            ]
+            override_packages = []
+            for override, future in zip(overrides, futures):
+                solver, new_packages = future.result()
+                override_packages.append((override, new_packages))
+                self._overrides.extend(solver._overrides)
+                self._provider.merge_searched(solver.provider)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return override_packages
+
+    def _solve_override(
+        self, override: dict[Package, dict[str, Dependency]]
+    ) -> tuple[Solver, dict[Package, TransitivePackageInfo]]:
+        provider = self._provider.clone()
+        provider.set_overrides(override)
+        solver = Solver(
+            self._package,
+            self._pool,
+            self._installed_packages,
+            self._locked_packages,
+            self._io,
+            config=self._config,
+            provider=provider,
+        )
+        # Nested overrides are solved sequentially
+        # in order to not exceed the maximum number of workers.
+        solver._concurrent_overrides = False
+        return solver, solver._solve()
+
     def _solve(self) -> dict[Package, TransitivePackageInfo]:
         if self._provider._overrides:
             self._overrides.append(self._provider._overrides)
 
         try:
-            result = resolve_version(self._package, self._provider)
+            result = self._resolve_version()
 
             packages = result.packages
         except OverrideNeededError as e:
@@ -181,6 +329,22 @@ class Solver:
 
         return self._aggregate_solved_packages(packages)
 
+    def _resolve_version(self) -> SolverResult:
+        try:
+            return resolve_version(self._package, self._provider)
+        except SolveFailureError:
+            if not self._provider.is_trusting_locked():
+                raise
+
+        # The metadata from the lock file might be outdated or incomplete,
+        # so we have to fall back to a full resolution.
+        self._provider.debug(
+            "<comment>Retrying dependency resolution"
+            " without trusting the lock file.</comment>"
+        )
+        self._provider.trust_locked(False)
+        return resolve_version(self._package, self._provider)
+
     def _aggregate_solved_packages(
         self, packages: list[Package]
     ) -> dict[Package, TransitivePackageInfo]:
@@ -192,30 +356,36 @@ class Solver:
 
         # Merging feature packages with base packages
         solved_packages = {}
+        base_packages: dict[tuple[NormalizedName, Version], list[Package]] = (
+            defaultdict(list)
+        )
         for package in packages:
-            if package.features:
-                for _package in packages:
-                    if (
-                        not _package.features
-                        and _package.name == package.name
-                        and _package.version == package.version
-                    ):
-                        for dep in package.requires:
-                            # Prevent adding base package as a dependency to itself
-                            if _package.name == dep.name:
-                                continue
-
-                            # Avoid duplication.
-                            if any(
-                                _dep == dep and _dep.marker == dep.marker
-                                for _dep in _package.requires
-                            ):
-                                continue
-
-                            _package.add_dependency(dep)
-            else:
+            if not package.features:
+                base_packages[package.name, package.version].append(package)
                 solved_packages[package] = results[package]
 
+        base_requires: dict[int, set[tuple[Dependency, BaseMarker]]] = {}
+        for package in packages:
+            if not package.features:
+                continue
+            for _package in base_packages.get((package.name, package.version), []):
+                if id(_package) not in base_requires:
+                    base_requires[id(_package)] = {
+                        (dep, dep.marker) for dep in _package.requires
+                    }
+                requires = base_requires[id(_package)]
+                for dep in package.requires:
+                    # Prevent adding base package as a dependency to itself
+                    if _package.name == dep.name:
+                        continue
+
+                    # Avoid duplication.
+                    if (dep, dep.marker) in requires:
+                        continue
+
+                    _package.add_dependency(dep)
+                    requires.add((dep, dep.marker))
+
         return solved_packages
 
 
@@ -245,10 +415,37 @@ def depth_first_search(
     markers: MarkerOriginDict = defaultdict(
         lambda: defaultdict(lambda: defaultdict(EmptyMarker))
     )
-    visited: set[DFSNodeID] = set()
-    topo_sorted_nodes: list[PackageNode] = []
+    visited: set[DFSNodeID] = {source.id}
+    finished_nodes: list[PackageNode] = []
+
+    # Iterative instead of recursive so that deep dependency trees
+    # cannot exceed the recursion limit.
+    stack: list[tuple[PackageNode, Iterator[PackageNode]]] = [
+        (source, iter(source.reachable()))
+    ]
+    while stack:
+        node, out_neighbors = stack[-1]
+        for out_neighbor in out_neighbors:
+            back_edges[out_neighbor.id].append(node)
+            groups = out_neighbor.groups
+            prev_marker = markers[out_neighbor.package][node.package][groups]
+            new_marker = (
+                out_neighbor.marker
+                if node.package.is_root()
+                else out_neighbor.marker.without_extras()
+            )
+            markers[out_neighbor.package][node.package][groups] = prev_marker.union(
+                new_marker
+            )
+            if out_neighbor.id not in visited:
+                visited.add(out_neighbor.id)
+                stack.append((out_neighbor, iter(out_neighbor.reachable())))
+                break
+        else:
+            stack.pop()
+            finished_nodes.append(node)
 
-    dfs_visit(source, back_edges, visited, topo_sorted_nodes, markers)
+    topo_sorted_nodes = finished_nodes[::-1]
 
     # Combine the nodes by name
     combined_nodes: dict[str, list[PackageNode]] = defaultdict(list)
@@ -265,33 +462,6 @@ def depth_first_search(
     return combined_topo_sorted_nodes, markers
 
 
-def dfs_visit(
-    node: PackageNode,
-    back_edges: dict[DFSNodeID, list[PackageNode]],
-    visited: set[DFSNodeID],
-    sorted_nodes: list[PackageNode],
-    markers: MarkerOriginDict,
-) -> None:
-    if node.id in visited:
-        return
-    visited.add(node.id)
-
-    for out_neighbor in node.reachable():
-        back_edges[out_neighbor.id].append(node)
-        groups = out_neighbor.groups
-        prev_marker = markers[out_neighbor.package][node.package][groups]
-        new_marker = (
-            out_neighbor.marker
-            if node.package.is_root()
-            else out_neighbor.marker.without_extras()
-        )
-        markers[out_neighbor.package][node.package][groups] = prev_marker.union(
-            new_marker
-        )
-        dfs_visit(out_neighbor, back_edges, visited, sorted_nodes, markers)
-    sorted_nodes.insert(0, node)
-
-
 class PackageNode(DFSNode):
     def __init__(
         self,
@@ -303,6 +473,14 @@ class PackageNode(DFSNode):
     ) -> None:
         self.package = package
         self.packages = packages
+        # index of packages by complete name shared by all nodes of a graph
+        self._packages_by_name: dict[str, list[Package]]
+        if previous:
+            self._packages_by_name = previous._packages_by_name
+        else:
+            self._packages_by_name = defaultdict(list)
+            for pkg in packages:
+                self._packages_by_name[pkg.complete_name].append(pkg)
 
         self.dep = dep
         self.marker = marker or AnyMarker()
@@ -328,10 +506,8 @@ class PackageNode(DFSNode):
         children: list[PackageNode] = []
 
         for dependency in self.package.all_requires:
-            for pkg in self.packages:
-                if pkg.complete_name == dependency.complete_name and pkg.satisfies(
-                    dependency
-                ):
+            for pkg in self._packages_by_name.get(dependency.complete_name, []):
+                if pkg.satisfies(dependency):
                     marker = dependency.marker
                     if self.package.is_root() and dependency.in_extras:
                         marker = marker.intersect(
@@ -387,58 +563,161 @@ def aggregate_package_nodes(
     return package, TransitivePackageInfo(depth, groups, {})
 
 
+@profiler.profiled("solver.calculate_markers")
 def calculate_markers(
     packages: dict[Package, TransitivePackageInfo], markers: MarkerOriginDict
 ) -> None:
-    # group packages by depth
-    packages_by_depth: dict[int, list[Package]] = defaultdict(list)
-    max_depth = -1
-    for package, info in packages.items():
-        max_depth = max(max_depth, info.depth)
-        packages_by_depth[info.depth].append(package)
-
-    # calculate markers from lowest to highest depth
-    # (start with depth 0 because the root package has depth -1)
-    has_incomplete_markers = True
-    while has_incomplete_markers:
-        has_incomplete_markers = False
-        for depth in range(max_depth + 1):
-            for package in packages_by_depth[depth]:
-                transitive_info = packages[package]
-                transitive_marker: dict[NormalizedName, BaseMarker] = {
-                    group: EmptyMarker() for group in transitive_info.groups
-                }
-                for parent, group_markers in markers[package].items():
-                    parent_info = packages[parent]
-                    if parent_info.groups:
-                        # If parent has groups, we need to intersect its per-group
-                        # markers with each edge marker and union into child's groups.
-                        if parent_info.groups != set(parent_info.markers):
-                            # there is a cycle -> we need one more iteration
-                            has_incomplete_markers = True
-                            continue
-                        for group in parent_info.groups:
-                            for edge_marker in group_markers.values():
-                                transitive_marker[group] = transitive_marker[
-                                    group
-                                ].union(
-                                    parent_info.markers[group].intersect(edge_marker)
-                                )
-                    else:
-                        # Parent is the root (no groups). Edge markers specify which
-                        # dependency groups the edge belongs to. We should only add
-                        # the edge marker to the corresponding child groups.
-                        for groups, edge_marker in group_markers.items():
-                            assert groups, (
-                                f"Package {package.name} at depth {depth} has no groups."
-                                f" All dependencies except for the root package at depth -1 must have groups"
-                            )
-                            for group in transitive_info.groups:
-                                if group in groups:
-                                    transitive_marker[group] = transitive_marker[
-                                        group
-                                    ].union(edge_marker)
-                transitive_info.markers = transitive_marker
+    """
+    Calculate the transitive markers of all packages from the markers
+    of their parents.
+
+    The dependency graph is collapsed into its strongly connected components,
+    which are processed in topological order so that the markers of all parents
+    outside of a component are final when the component is processed.
+    Within a component (i.e. a dependency cycle), a package is recalculated
+    whenever the markers of one of its parents have changed.
+    """
+    # the root package has depth -1 and is skipped
+    sorted_packages = sorted(
+        (package for package, info in packages.items() if info.depth >= 0),
+        key=lambda package: packages[package].depth,
+    )
+    children: dict[Package, list[Package]] = {
+        package: [] for package in sorted_packages
+    }
+    for package in sorted_packages:
+        for parent in markers[package]:
+            if parent in children:
+                children[parent].append(package)
+
+    for component in _strongly_connected_components(sorted_packages, children):
+        if len(component) == 1 and component[0] not in children[component[0]]:
+            _calculate_transitive_markers(component[0], packages, markers)
+            continue
+
+        # Markers are only extended by unions, and the marker of a path that
+        # visits a package twice is covered by the marker of the shorter path
+        # without the loop. Thus, after as many rounds as there are packages
+        # in the cycle, all simple paths have been considered, even if markers
+        # have not been simplified enough to detect that nothing changes anymore.
+        members = set(component)
+        outdated = set(component)
+        for _ in range(len(component)):
+            if not outdated:
+                break
+            for package in component:
+                if package not in outdated:
+                    continue
+                outdated.discard(package)
+                previous_markers = packages[package].markers
+                _calculate_transitive_markers(package, packages, markers)
+                if packages[package].markers != previous_markers:
+                    outdated.update(
+                        child for child in children[package] if child in members
+                    )
+
+
+def _strongly_connected_components(
+    packages: list[Package], children: dict[Package, list[Package]]
+) -> list[list[Package]]:
+    """
+    Return the strongly connected components of the dependency graph
+    (Tarjan's algorithm) in topological order, i.e. parents before children.
+
+    The packages of each component keep the order of the given packages.
+    """
+    order = {package: i for i, package in enumerate(packages)}
+    index: dict[Package, int] = {}
+    lowlink: dict[Package, int] = {}
+    stack: list[Package] = []
+    on_stack: set[Package] = set()
+    components: list[list[Package]] = []
+
+    # iterative to support deep dependency chains
+    for start in packages:
+        if start in index:
+            continue
+        index[start] = lowlink[start] = len(index)
+        stack.append(start)
+        on_stack.add(start)
+        work = [(start, iter(children[start]))]
+        while work:
+            package, remaining = work[-1]
+            for child in remaining:
+                if child not in index:
+                    index[child] = lowlink[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(children[child])))
+                    break
+                if child in on_stack:
+                    lowlink[package] = min(lowlink[package], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[package])
+                if lowlink[package] == index[package]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member is package:
+                            break
+                    components.append(sorted(component, key=order.__getitem__))
+
+    # Tarjan's algorithm finds components in reverse topological order.
+    components.reverse()
+    return components
+
+
+def _calculate_transitive_markers(
+    package: Package,
+    packages: dict[Package, TransitivePackageInfo],
+    markers: MarkerOriginDict,
+) -> None:
+    """
+    Calculates the markers of package from the markers of its parents.
+
+    Parents whose markers have not been calculated yet (because they
+    are part of the same dependency cycle) are skipped.
+    """
+    transitive_info = packages[package]
+    transitive_marker: dict[NormalizedName, BaseMarker] = {
+        group: EmptyMarker() for group in transitive_info.groups
+    }
+    for parent, group_markers in markers[package].items():
+        parent_info = packages[parent]
+        if parent_info.groups:
+            # If parent has groups, we need to intersect its per-group
+            # markers with each edge marker and union into child's groups.
+            if parent_info.groups != set(parent_info.markers):
+                # there is a cycle -> the package will be recalculated
+                continue
+            for group in parent_info.groups:
+                parent_marker = parent_info.markers[group]
+                for edge_marker in group_markers.values():
+                    transitive_marker[group] = marker_cache.union(
+                        transitive_marker[group],
+                        marker_cache.intersect(parent_marker, edge_marker),
+                    )
+        else:
+            # Parent is the root (no groups). Edge markers specify which
+            # dependency groups the edge belongs to. We should only add
+            # the edge marker to the corresponding child groups.
+            for groups, edge_marker in group_markers.items():
+                assert groups, (
+                    f"Package {package.name} at depth {transitive_info.depth}"
+                    " has no groups. All dependencies except for the root package"
+                    " at depth -1 must have groups"
+                )
+                for group in transitive_info.groups:
+                    if group in groups:
+                        transitive_marker[group] = marker_cache.union(
+                            transitive_marker[group], edge_marker
+                        )
+    transitive_info.markers = transitive_marker
 
 
 def merge_override_packages(
@@ -457,7 +736,9 @@ def merge_override_packages(
         override_marker: BaseMarker = AnyMarker()
         for deps in override.values():
             for dep in deps.values():
-                override_marker = override_marker.intersect(dep.marker.without_extras())
+                override_marker = marker_cache.intersect(
+                    override_marker, dep.marker.without_extras()
+                )
         override_marker = simplify_marker(override_marker, python_constraint)
         for package, info in o_packages.items():
             for group, marker in info.markers.items():
@@ -488,20 +769,23 @@ def merge_override_packages(
             # we can use less expensive marker operations
             override_marker = EmptyMarker()
             for _, _, marker in package_duplicates:
-                override_marker = override_marker.union(marker)
+                override_marker = marker_cache.union(override_marker, marker)
             package_info.markers = {
-                group: override_marker.intersect(marker)
+                group: marker_cache.intersect(override_marker, marker)
                 for group, marker in package_info.markers.items()
             }
         else:
             # fallback / general algorithm with performance issues
             for group, marker in package_info.markers.items():
-                package_info.markers[group] = first_override_marker.intersect(marker)
+                package_info.markers[group] = marker_cache.intersect(
+                    first_override_marker, marker
+                )
             for _, info, override_marker in remaining:
                 for group, marker in info.markers.items():
-                    package_info.markers[group] = package_info.markers.get(
-                        group, EmptyMarker()
-                    ).union(override_marker.intersect(marker))
+                    package_info.markers[group] = marker_cache.union(
+                        package_info.markers.get(group, EmptyMarker()),
+                        marker_cache.intersect(override_marker, marker),
+                    )
         for duplicate_package, _, _ in remaining:
             for dep in duplicate_package.requires:
                 if dep not in package.requires:
@@ -509,6 +793,7 @@ def merge_override_packages(
     return result
 
 
+@functools.lru_cache(maxsize=marker_cache.CACHE_SIZE)
 def remove_other_from_marker(marker: BaseMarker, other: BaseMarker) -> BaseMarker:
     if isinstance(other, SingleMarker):
         other_markers: set[BaseMarker] = {other}
@@ -530,4 +815,4 @@ def simplify_marker(
 
     Use cache because we call this function often for the same markers.
     """
-    return marker.reduce_by_python_constraint(python_constraint)
+    return marker_cache.intern(marker.reduce_by_python_constraint(python_constraint))
@@ -12,6 +12,7 @@ if TYPE_CHECKING:
 
     from packaging.utils import NormalizedName
     from poetry.core.packages.package import Package
+    from poetry.core.version.markers import BaseMarker
 
     from poetry.installation.operations.operation import Operation
     from poetry.packages.transitive_package_info import TransitivePackageInfo
@@ -73,6 +74,10 @@ class Transaction:
                 extras,
             )
 
+        # Many packages share the same marker,
+        # so each distinct marker is only evaluated once.
+        marker_validity: dict[BaseMarker, bool] = {}
+
         if isinstance(self._result_packages, dict):
             priorities = {
                 pkg: info.depth for pkg, info in self._result_packages.items()
@@ -87,9 +92,16 @@ class Transaction:
                 assert isinstance(self._result_packages, dict)
                 info = self._result_packages[result_package]
 
-                if info.groups & self._groups and info.get_marker(
-                    self._groups
-                ).validate(marker_env_with_extras):
+                is_relevant = False
+                if info.groups & self._groups:
+                    marker = info.get_marker(self._groups)
+                    if marker not in marker_validity:
+                        marker_validity[marker] = marker.validate(
+                            marker_env_with_extras
+                        )
+                    is_relevant = marker_validity[marker]
+
+                if is_relevant:
                     relevant_result_packages.add(result_package.name)
                 elif result_package.optional:
                     is_unsolicited_extra = True
@@ -147,7 +159,10 @@ class Transaction:
 
             result_packages = {package.name for package in self._result_packages}
             for current_package in self._current_packages:
-                if current_package.name not in (result_packages | uninstalls) and (
+                if (
+                    current_package.name not in result_packages
+                    and current_package.name not in uninstalls
+                ) and (
                     installed_package := self._installed_packages.get(
                         current_package.name
                     )
@@ -10,15 +10,20 @@ from poetry.core.constraints.version import parse_constraint
 
 from poetry.config.config import Config
 from poetry.repositories.repository import Repository
-from poetry.utils.cache import FileCache
+from poetry.utils.cache import get_cache
+from poetry.utils.cache import get_cache_index
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from packaging.utils import NormalizedName
     from poetry.core.constraints.version import Version
     from poetry.core.packages.package import Package
 
     from poetry.inspection.info import PackageInfo
+    from poetry.utils.cache import FileCache
+    from poetry.utils.cache import SQLiteCache
 
 
 class CachedRepository(Repository, ABC):
@@ -29,8 +34,21 @@ class CachedRepository(Repository, ABC):
     ) -> None:
         super().__init__(name)
         self._disable_cache = disable_cache
-        self._cache_dir = (config or Config.create()).repository_cache_directory / name
-        self._release_cache: FileCache[dict[str, Any]] = FileCache(path=self._cache_dir)
+        config = config or Config.create()
+        self._cache_dir = config.repository_cache_directory / name
+        self._release_cache: FileCache[dict[str, Any]] | SQLiteCache[dict[str, Any]] = (
+            get_cache(
+                self._cache_dir,
+                config.get("cache-backend"),
+                index=get_cache_index(config),
+            )
+        )
+        # release information read in advance by preload_release_info()
+        self._preloaded_release_info: dict[str, dict[str, Any]] = {}
+
+    @property
+    def disable_cache(self) -> bool:
+        return self._disable_cache
 
     @abstractmethod
     def _get_release_info(
@@ -49,9 +67,11 @@ class CachedRepository(Repository, ABC):
         if self._disable_cache:
             return PackageInfo.load(self._get_release_info(name, version))
 
-        cached = self._release_cache.remember(
-            f"{name}:{version}", lambda: self._get_release_info(name, version)
-        )
+        cached = self._preloaded_release_info.pop(f"{name}:{version}", None)
+        if cached is None:
+            cached = self._release_cache.remember(
+                f"{name}:{version}", lambda: self._get_release_info(name, version)
+            )
 
         cache_version = cached.get("_cache_version", "0.0.0")
         if parse_constraint(cache_version) != self.CACHE_VERSION:
@@ -66,10 +86,26 @@ class CachedRepository(Repository, ABC):
 
         return PackageInfo.load(cached)
 
+    def preload_release_info(
+        self, name: NormalizedName, versions: Iterable[Version]
+    ) -> None:
+        """
+        Read the cached release information of several versions of a package
+        at once so that the next call of get_release_info() for each of these
+        versions does not have to access the cache.
+        """
+        if self._disable_cache:
+            return
+
+        keys = [f"{name}:{version}" for version in versions]
+        self._preloaded_release_info.update(self._release_cache.get_many(keys))
+
     def package(self, name: str, version: Version) -> Package:
         return self.get_release_info(canonicalize_name(name), version).to_package(
             name=name
         )
 
     def forget(self, name: str, version: Version) -> None:
-        self._release_cache.forget(f"{canonicalize_name(name)}:{version}")
+        key = f"{canonicalize_name(name)}:{version}"
+        self._preloaded_release_info.pop(key, None)
+        self._release_cache.forget(key)
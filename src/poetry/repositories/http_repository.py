@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import functools
 import hashlib
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from contextlib import suppress
 from pathlib import Path
@@ -14,13 +14,18 @@ import requests
 import requests.adapters
 
 from packaging.metadata import parse_email
+from packaging.utils import canonicalize_name
 from poetry.core.constraints.version import parse_constraint
 from poetry.core.packages.dependency import Dependency
 from poetry.core.version.markers import parse_marker
 
 from poetry.config.config import Config
 from poetry.inspection.info import PackageInfo
+from poetry.inspection.lazy_wheel import HTTPRangeRequestNotRespectedError
+from poetry.inspection.lazy_wheel import HTTPRangeRequestUnsupportedError
 from poetry.inspection.lazy_wheel import LazyWheelUnsupportedError
+from poetry.inspection.lazy_wheel import RangeCache
+from poetry.inspection.lazy_wheel import get_host_profiles
 from poetry.inspection.lazy_wheel import metadata_from_wheel_url
 from poetry.repositories.cached_repository import CachedRepository
 from poetry.repositories.exceptions import PackageNotFoundError
@@ -28,11 +33,14 @@ from poetry.repositories.exceptions import RepositoryError
 from poetry.repositories.link_sources.html import HTMLPage
 from poetry.repositories.link_sources.json import SimpleJsonPage
 from poetry.utils.authenticator import Authenticator
+from poetry.utils.cache import get_cache_index
+from poetry.utils.cache import get_metadata_cache_key
 from poetry.utils.constants import REQUESTS_TIMEOUT
 from poetry.utils.helpers import HTTPRangeRequestSupportedError
 from poetry.utils.helpers import download_file
 from poetry.utils.helpers import get_highest_priority_hash_type
 from poetry.utils.patterns import wheel_file_re
+from poetry.utils.threading import SingleFlightCache
 
 
 if TYPE_CHECKING:
@@ -67,9 +75,17 @@ class HTTPRepository(CachedRepository):
             pool_size=pool_size,
         )
         self._authenticator.add_repository(name, url)
-        self.get_page = functools.lru_cache(maxsize=None)(self._get_page)
+        self._page_cache = SingleFlightCache(
+            self._get_page, cache_exceptions=(PackageNotFoundError,)
+        )
 
         self._lazy_wheel = config.get("solver.lazy-wheel", True)
+        # Byte ranges of wheels that have been fetched for lazy wheel inspection
+        self._range_cache = (
+            None
+            if disable_cache
+            else RangeCache(self._cache_dir / "_ranges", get_cache_index(config))
+        )
         self._max_retries = config.get("requests.max-retries", 0)
         # We are tracking if a domain supports range requests or not to avoid
         # unnecessary requests.
@@ -79,6 +95,11 @@ class HTTPRepository(CachedRepository):
         # - True: The domain supports range requests for at least some files.
         # - False: The domain does not support range requests for the files we tried.
         self._supports_range_requests: dict[str, bool] = {}
+        # What has been learned about hosts in previous runs,
+        # which is used if nothing is known about a domain yet.
+        self._host_profiles = get_host_profiles(
+            None if disable_cache else config.repository_cache_directory
+        )
 
     @property
     def session(self) -> Authenticator:
@@ -123,6 +144,10 @@ class HTTPRepository(CachedRepository):
         from poetry.inspection.info import PackageInfo
 
         netloc = link.netloc
+        if netloc not in self._supports_range_requests:
+            range_requests = self._host_profiles.get(netloc).range_requests
+            if range_requests is not None:
+                self._supports_range_requests[netloc] = range_requests
 
         # If "lazy-wheel" is enabled and the domain supports range requests
         # or we don't know yet, we try range requests.
@@ -130,7 +155,13 @@ class HTTPRepository(CachedRepository):
         if self._lazy_wheel and self._supports_range_requests.get(netloc, True):
             try:
                 package_info = PackageInfo.from_metadata(
-                    metadata_from_wheel_url(link.filename, link.url, self.session)
+                    metadata_from_wheel_url(
+                        link.filename,
+                        link.url,
+                        self.session,
+                        self._range_cache,
+                        self._host_profiles,
+                    )
                 )
             except LazyWheelUnsupportedError as e:
                 # Do not set to False if we already know that the domain supports
@@ -140,9 +171,22 @@ class HTTPRepository(CachedRepository):
                     level="debug",
                 )
                 raise_accepts_ranges = False
-                self._supports_range_requests.setdefault(netloc, False)
+                self._set_supports_range_requests(
+                    netloc,
+                    self._supports_range_requests.get(netloc, False),
+                    # Only remember it for later runs if the server definitely
+                    # does not support range requests (and it was not,
+                    # for example, a network error or an invalid wheel).
+                    persist=isinstance(
+                        e,
+                        (
+                            HTTPRangeRequestUnsupportedError,
+                            HTTPRangeRequestNotRespectedError,
+                        ),
+                    ),
+                )
             else:
-                self._supports_range_requests[netloc] = True
+                self._set_supports_range_requests(netloc, True)
                 return package_info
 
         try:
@@ -159,9 +203,16 @@ class HTTPRepository(CachedRepository):
                 f"Abort downloading {link.url} because server supports range requests",
                 level="debug",
             )
-            self._supports_range_requests[netloc] = True
+            self._set_supports_range_requests(netloc, True)
             return self._get_info_from_wheel(link)
 
+    def _set_supports_range_requests(
+        self, netloc: str, supported: bool, *, persist: bool = True
+    ) -> None:
+        self._supports_range_requests[netloc] = supported
+        if persist:
+            self._host_profiles.update(netloc, range_requests=supported)
+
     def _get_info_from_sdist(self, link: Link) -> PackageInfo:
         from poetry.inspection.info import PackageInfo
 
@@ -171,36 +222,73 @@ class HTTPRepository(CachedRepository):
     def _get_info_from_metadata(self, link: Link) -> PackageInfo | None:
         if link.has_metadata:
             try:
-                assert link.metadata_url is not None
-                response = self.session.get(link.metadata_url)
-                if link.metadata_hashes and (
-                    hash_name := get_highest_priority_hash_type(
-                        link.metadata_hashes, f"{link.filename}.metadata"
-                    )
-                ):
-                    metadata_hash = getattr(hashlib, hash_name)(
-                        response.content
-                    ).hexdigest()
-                    if metadata_hash != link.metadata_hashes[hash_name]:
-                        self._log(
-                            f"Metadata file hash ({metadata_hash}) does not match"
-                            f" expected hash ({link.metadata_hashes[hash_name]})."
-                            f" Metadata file for {link.filename} will be ignored.",
-                            level="warning",
-                        )
-                        return None
-
-                metadata, _ = parse_email(response.content)
-                return PackageInfo.from_metadata(metadata)
-
+                content = self._get_metadata_file(link)
             except requests.HTTPError:
                 self._log(
                     f"Failed to retrieve metadata at {link.metadata_url}",
                     level="warning",
                 )
+            else:
+                if content is not None:
+                    metadata, _ = parse_email(content)
+                    return PackageInfo.from_metadata(metadata)
 
         return None
 
+    def _get_info_from_metadata_concurrently(
+        self, links: list[Link]
+    ) -> list[PackageInfo | None]:
+        """
+        Retrieve the metadata files of several links in parallel so that
+        combining the metadata of several wheels requires only one round trip.
+        """
+        with ThreadPoolExecutor(max_workers=len(links)) as executor:
+            return list(executor.map(self._get_info_from_metadata, links))
+
+    def _get_metadata_file(self, link: Link) -> bytes | None:
+        """
+        Return the content of the metadata file (PEP 658) of a link
+        or None if it does not match the expected hash.
+
+        Verified metadata files are stored in the release cache under the hash
+        of their distribution so that they do not have to be downloaded again
+        and are kept as long as the distribution is locked. Metadata files
+        without a hash might change, so that they are only cached by the
+        HTTP cache, which revalidates them.
+        """
+        assert link.metadata_url is not None
+        hash_name = get_highest_priority_hash_type(
+            link.metadata_hashes, f"{link.filename}.metadata"
+        )
+        file_hash = self._get_known_file_hash(link)
+        cache_key = None
+        if hash_name and file_hash and not self._disable_cache:
+            cache_key = get_metadata_cache_key(link.filename, file_hash)
+            if cached := self._release_cache.get(cache_key):
+                # The metadata is stored as text, which is only possible
+                # for arbitrary bytes with "surrogateescape".
+                content: bytes = cached["metadata"].encode("utf-8", "surrogateescape")
+                return content
+
+        content = self.session.get(link.metadata_url).content
+        if hash_name:
+            metadata_hash = getattr(hashlib, hash_name)(content).hexdigest()
+            if metadata_hash != link.metadata_hashes[hash_name]:
+                self._log(
+                    f"Metadata file hash ({metadata_hash}) does not match"
+                    f" expected hash ({link.metadata_hashes[hash_name]})."
+                    f" Metadata file for {link.filename} will be ignored.",
+                    level="warning",
+                )
+                return None
+
+        if cache_key is not None:
+            self._release_cache.put(
+                cache_key, {"metadata": content.decode("utf-8", "surrogateescape")}
+            )
+
+        return content
+
     def _get_info_from_links(
         self, links: list[Link], *, ignore_yanked: bool
     ) -> PackageInfo:
@@ -260,13 +348,15 @@ class HTTPRepository(CachedRepository):
 
             info = None
             if universal_python2_wheel and universal_python3_wheel:
-                info = self._get_info_from_metadata(
+                py2_metadata, py3_metadata = self._get_info_from_metadata_concurrently(
+                    [universal_python2_wheel, universal_python3_wheel]
+                )
+                info = py2_metadata or self._get_info_from_wheel(
                     universal_python2_wheel
-                ) or self._get_info_from_wheel(universal_python2_wheel)
-
-                py3_info = self._get_info_from_metadata(
+                )
+                py3_info = py3_metadata or self._get_info_from_wheel(
                     universal_python3_wheel
-                ) or self._get_info_from_wheel(universal_python3_wheel)
+                )
 
                 if info.requires_python or py3_info.requires_python:
                     info.requires_python = str(
@@ -348,13 +438,7 @@ class HTTPRepository(CachedRepository):
                 # drop yanked files unless the entire release is yanked
                 continue
 
-            file_hash: str | None
-            for hash_name in ("sha512", "sha384", "sha256"):
-                if hash_name in link.hashes:
-                    file_hash = f"{hash_name}:{link.hashes[hash_name]}"
-                    break
-            else:
-                file_hash = self.calculate_sha256(link)
+            file_hash = self._get_known_file_hash(link) or self.calculate_sha256(link)
 
             if file_hash is None and (
                 hash_type := get_highest_priority_hash_type(link.hashes, link.filename)
@@ -400,6 +484,17 @@ class HTTPRepository(CachedRepository):
 
         return data.asdict()
 
+    @staticmethod
+    def _get_known_file_hash(link: Link) -> str | None:
+        """
+        Return the hash of a distribution as it is recorded in the lock file
+        if it is known without downloading the distribution.
+        """
+        for hash_name in ("sha512", "sha384", "sha256"):
+            if hash_name in link.hashes:
+                return f"{hash_name}:{link.hashes[hash_name]}"
+        return None
+
     def calculate_sha256(self, link: Link) -> str | None:
         with self._cached_or_downloaded_file(link) as filepath:
             hash_name = get_highest_priority_hash_type(link.hashes, link.filename)
@@ -468,6 +563,13 @@ class HTTPRepository(CachedRepository):
             == "application/vnd.pypi.simple.v1+json"
         )
 
+    def get_page(self, name: str) -> LinkSource:
+        """
+        Return the page of a package. Concurrent calls for the same package
+        share one request and the page is only fetched once.
+        """
+        return self._page_cache(canonicalize_name(name))
+
     def _get_page(self, name: NormalizedName) -> LinkSource:
         response = self._get_response(
             f"/{name}/", headers=self._get_prefer_json_header()
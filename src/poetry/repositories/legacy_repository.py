@@ -91,11 +91,7 @@ class LegacyRepository(HTTPRepository):
             self._log(f"No packages found for {name}", level="debug")
             return []
 
-        versions = [
-            (version, page.yanked(name, version))
-            for version in page.versions(name)
-            if constraint.allows(version)
-        ]
+        versions = page.find_versions(name, constraint)
 
         return [
             Package(
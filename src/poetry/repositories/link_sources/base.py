@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import bisect
+import hashlib
 import logging
 import re
 
@@ -8,18 +10,23 @@ from typing import TYPE_CHECKING
 from typing import ClassVar
 
 from poetry.core.constraints.version import Version
+from poetry.core.constraints.version import VersionRangeConstraint
+from poetry.core.constraints.version import VersionUnion
 from poetry.core.packages.package import Package
 from poetry.core.version.exceptions import InvalidVersionError
 
 from poetry.utils.patterns import sdist_file_re
 from poetry.utils.patterns import wheel_file_re
+from poetry.version import version_cache
 
 
 if TYPE_CHECKING:
     from collections import defaultdict
+    from collections.abc import Iterable
     from collections.abc import Iterator
 
     from packaging.utils import NormalizedName
+    from poetry.core.constraints.version import VersionConstraint
     from poetry.core.packages.utils.link import Link
 
     LinkCache = defaultdict[NormalizedName, defaultdict[Version, list[Link]]]
@@ -43,6 +50,7 @@ class LinkSource:
 
     def __init__(self, url: str) -> None:
         self._url = url
+        self._version_indexes: dict[NormalizedName, VersionIndex] = {}
 
     @property
     def url(self) -> str:
@@ -51,6 +59,16 @@ class LinkSource:
     def versions(self, name: NormalizedName) -> Iterator[Version]:
         yield from self._link_cache[name]
 
+    def find_versions(
+        self, name: NormalizedName, constraint: VersionConstraint
+    ) -> list[tuple[Version, str | bool]]:
+        """
+        Return the versions of a package that are allowed by the given constraint
+        (in ascending order) together with their yanked status.
+        """
+        index = self._version_index(name)
+        return [(version, index.yanked[version]) for version in index.find(constraint)]
+
     @property
     def packages(self) -> Iterator[Package]:
         for link in self.links:
@@ -84,7 +102,7 @@ class LinkSource:
 
         if version_string:
             try:
-                version = Version.parse(version_string)
+                version = version_cache.parse(version_string)
             except InvalidVersionError:
                 logger.debug(
                     "Skipping url (%s) due to invalid version (%s)", link.url, version
@@ -108,8 +126,15 @@ class LinkSource:
         return self.CLEAN_REGEX.sub(lambda match: f"%{ord(match.group(0)):02x}", url)
 
     def yanked(self, name: NormalizedName, version: Version) -> str | bool:
+        yanked = self._version_index(name).yanked.get(version)
+        if yanked is None:
+            # there are no files for the version
+            return True
+        return yanked
+
+    def _calculate_yanked(self, links: Iterable[Link]) -> str | bool:
         reasons = set()
-        for link in self.links_for_version(name, version):
+        for link in links:
             if link.yanked:
                 if link.yanked_reason:
                     reasons.add(link.yanked_reason)
@@ -121,11 +146,110 @@ class LinkSource:
             return "\n".join(sorted(reasons))
         return True
 
+    @cached_property
+    def fingerprint(self) -> str:
+        """
+        A digest of all links of the page including their hashes, yanked
+        status and Python requirement. It changes whenever a release or a
+        distribution is added, removed or modified.
+        """
+        digest = hashlib.sha256()
+        for link in sorted(self.links, key=lambda link: link.url):
+            digest.update(
+                repr(
+                    (
+                        link.url,
+                        sorted(link.hashes.items()),
+                        link.requires_python,
+                        link.yanked_reason if link.yanked else None,
+                        link.has_metadata,
+                    )
+                ).encode()
+            )
+        return digest.hexdigest()
+
+    def _version_index(self, name: NormalizedName) -> VersionIndex:
+        # Building the index twice in concurrent threads is harmless.
+        index = self._version_indexes.get(name)
+        if index is None:
+            links_per_version = self._link_cache[name]
+            index = self._version_indexes[name] = VersionIndex(
+                sorted(links_per_version, key=version_cache.sort_key),
+                {
+                    version: self._calculate_yanked(links)
+                    for version, links in links_per_version.items()
+                },
+            )
+        return index
+
     @cached_property
     def _link_cache(self) -> LinkCache:
         raise NotImplementedError()
 
 
+class VersionIndex:
+    """
+    The sorted versions of a package on a page, which allows
+    to find the versions allowed by a constraint by bisection.
+    """
+
+    def __init__(
+        self, versions: list[Version], yanked: dict[Version, str | bool]
+    ) -> None:
+        self.versions = versions
+        self.yanked = yanked
+        # Stripping the local version segment preserves the order, but lets
+        # bounds compare equal to local versions they might allow.
+        self._public_keys = [
+            version_cache.sort_key(version.without_local()) for version in versions
+        ]
+
+    def find(self, constraint: VersionConstraint) -> list[Version]:
+        if constraint.is_empty():
+            return []
+        if constraint.is_any():
+            return list(self.versions)
+
+        if isinstance(constraint, VersionUnion):
+            ranges: list[VersionConstraint] = list(constraint.ranges)
+        elif isinstance(constraint, VersionRangeConstraint):
+            ranges = [constraint]
+        else:
+            return [version for version in self.versions if constraint.allows(version)]
+
+        intervals = []
+        for constraint_range in ranges:
+            assert isinstance(constraint_range, VersionRangeConstraint)
+            # The raw bounds are used instead of allowed_min and allowed_max,
+            # which are not accurate for bounds with a local version segment,
+            # e.g. "<1+local" allows "1a1" but its allowed_max is "1.dev0".
+            start = 0
+            if constraint_range.min is not None:
+                start = bisect.bisect_left(
+                    self._public_keys,
+                    version_cache.sort_key(constraint_range.min.without_local()),
+                )
+            stop = len(self.versions)
+            if constraint_range.max is not None:
+                stop = bisect.bisect_right(
+                    self._public_keys,
+                    version_cache.sort_key(constraint_range.max.without_local()),
+                )
+            intervals.append((start, stop))
+
+        # The intervals only narrow down the candidates, e.g. ">1" allows neither
+        # "1" nor "1.post1", so that each candidate must still be checked.
+        found: list[Version] = []
+        end = 0
+        for start, stop in sorted(intervals):
+            for version in self.versions[max(start, end) : stop]:
+                if constraint.allows(version):
+                    found.append(version)
+            end = max(end, stop)
+
+        return found
+
+
 class SimpleRepositoryRootPage:
     """
     This class represents the parsed content of a "simple" repository's root page.
@@ -114,11 +114,7 @@ class PyPiRepository(HTTPRepository):
             self._log(f"No packages found for {name}", level="debug")
             return []
 
-        versions = [
-            (version, json_page.yanked(name, version))
-            for version in json_page.versions(name)
-            if constraint.allows(version)
-        ]
+        versions = json_page.find_versions(name, constraint)
 
         return [Package(name, version, yanked=yanked) for version, yanked in versions]
 
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import enum
+import logging
+import threading
+import urllib.parse
 
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from dataclasses import dataclass
 from enum import IntEnum
 from typing import TYPE_CHECKING
@@ -11,16 +16,24 @@ from poetry.config.config import Config
 from poetry.repositories.abstract_repository import AbstractRepository
 from poetry.repositories.cached_repository import CachedRepository
 from poetry.repositories.exceptions import PackageNotFoundError
+from poetry.repositories.http_repository import HTTPRepository
 from poetry.repositories.repository import Repository
 from poetry.utils.cache import ArtifactCache
+from poetry.utils.cache import get_cache_index
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from packaging.utils import NormalizedName
     from poetry.core.constraints.version import Version
     from poetry.core.packages.dependency import Dependency
     from poetry.core.packages.package import Package
 
 
+logger = logging.getLogger(__name__)
+
+
 class Priority(IntEnum):
     # The order of the members below dictates the actual priority. The first member has
     # top priority.
@@ -36,6 +49,9 @@ class PrioritizedRepository:
 
 
 class RepositoryPool(AbstractRepository):
+    # The maximum number of pages that are fetched concurrently from the same host.
+    MAX_CONCURRENT_REQUESTS_PER_HOST = 4
+
     def __init__(
         self,
         repositories: list[Repository] | None = None,
@@ -50,8 +66,17 @@ class RepositoryPool(AbstractRepository):
         for repository in repositories:
             self.add_repository(repository)
 
+        config = config or Config.create()
+
+        # (repository name, package name) of pages that have been fetched
+        self._fetched_pages: set[tuple[str, NormalizedName]] = set()
+        self._lock = threading.Lock()
+        self._host_semaphores: dict[str, threading.BoundedSemaphore] = {}
+        # Shared by all page fetches and only created if required.
+        self._page_fetcher: ThreadPoolExecutor | None = None
+        self._page_fetcher_max_workers = config.installer_max_workers
         self._artifact_cache = ArtifactCache(
-            cache_dir=(config or Config.create()).artifacts_cache_directory
+            cache_dir=config.artifacts_cache_directory, index=get_cache_index(config)
         )
 
     @staticmethod
@@ -170,13 +195,62 @@ class RepositoryPool(AbstractRepository):
         if repository_name:
             return self.repository(repository_name).find_packages(dependency)
 
+        repositories = self.repositories
+        self.fetch_pages((repo, dependency.name) for repo in repositories)
+
         packages: list[Package] = []
-        for repo in self.repositories:
+        for repo in repositories:
             if packages and self.get_priority(repo.name) is Priority.SUPPLEMENTAL:
                 break
             packages += repo.find_packages(dependency)
         return packages
 
+    def fetch_pages(self, pages: Iterable[tuple[Repository, NormalizedName]]) -> None:
+        """
+        Fetch the given pages of packages from HTTP repositories in parallel
+        so that retrieving them one after the other afterwards
+        does not require a round trip per page.
+        Pages are cached by the repositories and only fetched once.
+        """
+        with self._lock:
+            pending = [
+                (repo, name)
+                for repo, name in dict.fromkeys(pages)
+                if isinstance(repo, HTTPRepository)
+                and (repo.name, name) not in self._fetched_pages
+            ]
+            if len(pending) < 2:
+                return
+
+            self._fetched_pages.update((repo.name, name) for repo, name in pending)
+            if self._page_fetcher is None:
+                self._page_fetcher = ThreadPoolExecutor(
+                    max_workers=self._page_fetcher_max_workers,
+                    thread_name_prefix="poetry-pages",
+                )
+            futures = [
+                self._page_fetcher.submit(self._fetch_page, repo, name)
+                for repo, name in pending
+            ]
+
+        wait(futures)
+
+    def _fetch_page(self, repository: HTTPRepository, name: NormalizedName) -> None:
+        host = urllib.parse.urlsplit(repository.url).netloc
+        with self._lock:
+            semaphore = self._host_semaphores.setdefault(
+                host, threading.BoundedSemaphore(self.MAX_CONCURRENT_REQUESTS_PER_HOST)
+            )
+
+        with semaphore:
+            try:
+                repository.get_page(name)
+            except Exception as e:
+                # Errors are raised again when the repository is actually searched.
+                logger.debug(
+                    "Failed to fetch page of %s from %s: %s", name, repository.name, e
+                )
+
     def search(self, query: str | list[str]) -> list[Package]:
         results: list[Package] = []
         for repo in self.repositories:
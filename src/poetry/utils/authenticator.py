@@ -5,6 +5,7 @@ import functools
 import logging
 import time
 import urllib.parse
+import zlib
 
 from os.path import commonprefix
 from pathlib import Path
@@ -25,6 +26,7 @@ from poetry.config.config import Config
 from poetry.console.exceptions import ConsoleMessage
 from poetry.console.exceptions import PoetryRuntimeError
 from poetry.exceptions import PoetryError
+from poetry.utils import profiler
 from poetry.utils.constants import REQUESTS_TIMEOUT
 from poetry.utils.constants import RETRY_AFTER_HEADER
 from poetry.utils.constants import STATUS_FORCELIST
@@ -97,6 +99,44 @@ class AuthenticatorRepositoryConfig:
         return credential
 
 
+class OfflineCacheControlAdapter(CacheControlAdapter):
+    """
+    A CacheControl adapter that answers requests only from the cache,
+    regardless of whether the cached responses are fresh or not.
+    """
+
+    def send(
+        self, request: requests.PreparedRequest, *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        url = request.url or ""
+        cached_response = None
+        # Partial content is never cached.
+        if request.method in self.cacheable_methods and "Range" not in request.headers:
+            cache_data = self.cache.get(url)
+            if cache_data is not None:
+                try:
+                    cached_response = self.controller.serializer.loads(
+                        request, cache_data
+                    )
+                except zlib.error:
+                    cached_response = None
+
+        if cached_response is None:
+            parsed_url = urllib.parse.urlsplit(url)
+            raise PoetryRuntimeError.create(
+                reason=(
+                    "<error>Poetry is offline and there is no cached response for"
+                    f" <c1>{parsed_url.netloc}{parsed_url.path}</>.</>"
+                ),
+                info=(
+                    "Run the command without <c1>--offline</> (and without"
+                    " <c1>--no-cache</>) once to populate the cache."
+                ),
+            )
+
+        return self.build_response(request, cached_response, from_cache=True)
+
+
 class Authenticator:
     def __init__(
         self,
@@ -108,6 +148,7 @@ class Authenticator:
     ) -> None:
         self._config = config or Config.create()
         self._io = io
+        self._cache_id = cache_id
         self._sessions_for_netloc: dict[str, requests.Session] = {}
         self._credentials: dict[str, HTTPAuthCredential] = {}
         self._certs: dict[str, RepositoryCertificateConfig] = {}
@@ -134,6 +175,15 @@ class Authenticator:
         session = requests.Session()
         session.headers["User-Agent"] = self._user_agent
 
+        if self._config.get("offline"):
+            # Without a cache, every request fails.
+            adapter: CacheControlAdapter = OfflineCacheControlAdapter(
+                cache=self._cache_control
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            return session
+
         if self._cache_control is None:
             return session
 
@@ -255,6 +305,10 @@ class Authenticator:
                     )
                     raise exc
             else:
+                if getattr(resp, "from_cache", False):
+                    profiler.count(f"http.cached[{self._cache_id or '_default'}]")
+                else:
+                    profiler.count(f"http.requests[{self._cache_id or '_default'}]")
                 if resp.status_code not in STATUS_FORCELIST or is_last_attempt:
                     if raise_for_status:
                         resp.raise_for_status()
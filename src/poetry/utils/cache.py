@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import atexit
+import contextlib
 import dataclasses
 import hashlib
 import json
 import logging
+import os
+import re
 import shutil
+import sqlite3
 import threading
 import time
 
@@ -13,6 +18,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Generic
+from typing import Literal
 from typing import TypeVar
 from typing import overload
 
@@ -25,14 +31,22 @@ from poetry.utils.wheel import Wheel
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from collections.abc import Collection
+    from collections.abc import Iterable
 
+    from poetry.core.packages.package import Package
     from poetry.core.packages.utils.link import Link
 
+    from poetry.config.config import Config
     from poetry.utils.env import Env
 
 
 # Used by FileCache for items that do not expire.
 MAX_DATE = 9999999999
+_SHARD_PATTERN = re.compile(r"[0-9a-f]{2}")
+_HASH_PATTERN = re.compile(r"[0-9a-f]{64}")
+# directory of the solver result cache within the repository cache directory
+SOLVER_RESULT_CACHE_DIRECTORY = "_solver"
 T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
@@ -78,10 +92,12 @@ class FileCache(Generic[T]):
 
     :param path: The path that the cache starts at.
     :param hash_type: The hash to use for encoding keys/building directories.
+    :param index: The index to record accesses of items in.
     """
 
     path: Path
     hash_type: str = "sha256"
+    index: CacheIndex | None = dataclasses.field(default=None, compare=False)
 
     def __post_init__(self) -> None:
         if self.hash_type not in _HASHES:
@@ -92,6 +108,20 @@ class FileCache(Generic[T]):
     def get(self, key: str) -> T | None:
         return self._get_payload(key)
 
+    def get_many(self, keys: Iterable[str]) -> dict[str, T]:
+        """
+        Get all items that exist and have not expired in the cache.
+
+        :param keys: The cache keys
+        :returns: The values by key
+        """
+        values = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                values[key] = value
+        return values
+
     def has(self, key: str) -> bool:
         """
         Determine if a file exists and has not expired in the cache.
@@ -113,8 +143,11 @@ class FileCache(Generic[T]):
         )
         path = self._path(key)
         path.parent.mkdir(parents=True, exist_ok=True)
+        data = self._serialize(payload)
         with path.open("wb") as f:
-            f.write(self._serialize(payload))
+            f.write(data)
+        if self.index is not None:
+            self.index.touch(path, len(data))
 
     def forget(self, key: str) -> None:
         """
@@ -168,6 +201,8 @@ class FileCache(Generic[T]):
             self.forget(key)
             return None
         else:
+            if self.index is not None:
+                self.index.touch(path, len(file_content))
             return payload.data
 
     def _path(self, key: str) -> Path:
@@ -188,9 +223,648 @@ class FileCache(Generic[T]):
         return CacheItem(data, expires)
 
 
+class SQLiteCache(Generic[T]):
+    """
+    Alternative to FileCache that stores all items in a single SQLite database
+    instead of one file per item. The database is opened in WAL mode so that
+    several processes can share the cache.
+
+    Items of an existing FileCache in the same directory are migrated
+    (and removed) when the database is created.
+
+    :param path: The path that the cache starts at.
+    :param index: The index to record accesses of items in.
+    """
+
+    FILENAME = "cache.sqlite3"
+    # SQLite limits the number of variables in a statement.
+    BATCH_SIZE = 500
+
+    def __init__(self, path: Path, index: CacheIndex | None = None) -> None:
+        self.path = path
+        self.index = index
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def database(self) -> Path:
+        return self.path / self.FILENAME
+
+    def get(self, key: str) -> T | None:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, T]:
+        """
+        Get all items that exist and have not expired in the cache.
+
+        :param keys: The cache keys
+        :returns: The values by key
+        """
+        keys_by_hash = {self._hash(key): key for key in keys}
+        hashes = list(keys_by_hash)
+        now = round(time.time())
+        rows = []
+        with self._lock:
+            connection = self._connect()
+            for i in range(0, len(hashes), self.BATCH_SIZE):
+                batch = hashes[i : i + self.BATCH_SIZE]
+                rows += connection.execute(
+                    "SELECT key, data FROM entries WHERE expires > ?"
+                    f" AND key IN ({', '.join('?' * len(batch))})",
+                    [now, *batch],
+                ).fetchall()
+
+        values = {}
+        for h, data in rows:
+            try:
+                values[keys_by_hash[h]] = json.loads(data)
+            except json.JSONDecodeError:
+                self._delete([h])
+                logger.warning("Corrupt cache entry was detected and cleaned up.")
+            else:
+                if self.index is not None:
+                    self.index.touch(self.database / h, len(data))
+        return values
+
+    def has(self, key: str) -> bool:
+        """
+        Determine if an item exists and has not expired in the cache.
+        :param key: The cache key
+        :returns: True if the key exists in the cache
+        """
+        return self.get(key) is not None
+
+    def put(self, key: str, value: Any, minutes: int | None = None) -> None:
+        """
+        Store an item in the cache.
+
+        :param key: The cache key
+        :param value: The cache value
+        :param minutes: The lifetime in minutes of the cached value
+        """
+        expires = _expiration(minutes) if minutes is not None else MAX_DATE
+        h = self._hash(key)
+        data = json.dumps(value)
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO entries (key, expires, data)"
+                    " VALUES (?, ?, ?)",
+                    [h, expires, data],
+                )
+        if self.index is not None:
+            self.index.touch(self.database / h, len(data))
+
+    def forget(self, key: str) -> None:
+        """
+        Remove an item from the cache.
+
+        :param key: The cache key
+        """
+        self._delete([self._hash(key)])
+
+    def flush(self) -> None:
+        """
+        Clear the cache.
+        """
+        self.close()
+        shutil.rmtree(self.path)
+
+    def remember(
+        self, key: str, callback: T | Callable[[], T], minutes: int | None = None
+    ) -> T:
+        """
+        Get an item from the cache, or use a default from callback.
+
+        :param key: The cache key
+        :param callback: Callback function providing default value
+        :param minutes: The lifetime in minutes of the cached value
+        """
+        value = self.get(key)
+        if value is None:
+            value = callback() if callable(callback) else callback
+            self.put(key, value, minutes)
+        return value
+
+    def count(self) -> int:
+        """
+        Return the number of items that have not expired.
+        """
+        with self._lock:
+            (count,) = (
+                self._connect()
+                .execute(
+                    "SELECT COUNT(*) FROM entries WHERE expires > ?",
+                    [round(time.time())],
+                )
+                .fetchone()
+            )
+        return int(count)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _delete(self, hashes: list[str]) -> None:
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "DELETE FROM entries WHERE key = ?", [(h,) for h in hashes]
+                )
+
+    def _connect(self) -> sqlite3.Connection:
+        # must be called with the lock held
+        if self._connection is not None:
+            return self._connection
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        # The connection is shared between threads, which is safe
+        # because it is only used with the lock held.
+        connection = sqlite3.connect(self.database, timeout=30, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries"
+                " (key TEXT PRIMARY KEY, expires INTEGER NOT NULL, data TEXT NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires)"
+            )
+            connection.execute(
+                "DELETE FROM entries WHERE expires <= ?", [round(time.time())]
+            )
+        self._migrate(connection)
+        self._connection = connection
+        return connection
+
+    def _migrate(self, connection: sqlite3.Connection) -> None:
+        """
+        Move the items of a FileCache in the same directory into the database.
+
+        Since FileCache only stores the hashes of the keys (which are used
+        as keys in the database as well), its files can be moved as they are.
+        """
+        # FileCache shards its files in directories named after the first
+        # bytes of the hash, which distinguishes them from other caches
+        # in the same directory, e.g. the HTTP cache.
+        shards = [
+            path
+            for path in self.path.iterdir()
+            if path.is_dir() and _SHARD_PATTERN.fullmatch(path.name)
+        ]
+        if not shards:
+            return
+
+        file_cache: FileCache[Any] = FileCache(self.path)
+        rows = []
+        files = []
+        for shard in shards:
+            for file in shard.rglob("*"):
+                if not file.is_file() or not _HASH_PATTERN.fullmatch(file.name):
+                    continue
+                try:
+                    item = file_cache._deserialize(file.read_bytes())
+                except (OSError, ValueError):
+                    # corrupt or removed by a concurrent migration
+                    pass
+                else:
+                    if not item.expired:
+                        rows.append((file.name, item.expires, json.dumps(item.data)))
+                files.append(file)
+
+        with connection:
+            # A concurrent migration might have stored newer items in the meantime.
+            connection.executemany(
+                "INSERT OR IGNORE INTO entries (key, expires, data) VALUES (?, ?, ?)",
+                rows,
+            )
+        for file in files:
+            file.unlink(missing_ok=True)
+        for shard in shards:
+            shutil.rmtree(shard, ignore_errors=True)
+
+        logger.debug("Migrated %d cache entries to %s", len(rows), self.database)
+
+    @staticmethod
+    def _hash(key: str) -> str:
+        return hashlib.sha256(encode(key)).hexdigest()
+
+
+@dataclasses.dataclass(frozen=True)
+class PruneResult:
+    entries: int = 0
+    size: int = 0
+
+
+class CacheIndex:
+    """
+    Records the size and the time of the last access of the entries of the
+    artifact and repository caches so that the least recently used entries
+    can be evicted without walking the caches.
+
+    Accesses are buffered in memory and written in batches.
+
+    :param cache_dir: The cache directory, i.e. the value of "cache-dir".
+    """
+
+    FILENAME = "cache-index.sqlite3"
+    FLUSH_THRESHOLD = 1000
+    # Automatic pruning after commands runs at most once per interval (in seconds).
+    AUTO_PRUNE_INTERVAL = 86400
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+        self._pending: dict[str, tuple[int, int]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def database(self) -> Path:
+        return self.cache_dir / self.FILENAME
+
+    def touch(self, path: Path, size: int) -> None:
+        """
+        Record an access of a cache entry.
+
+        :param path: The path of the entry (items of an SQLiteCache
+            are addressed as "<database>/<hash of the key>").
+        :param size: The size of the entry in bytes
+        """
+        try:
+            relative_path = path.relative_to(self.cache_dir).as_posix()
+        except ValueError:
+            return
+
+        with self._lock:
+            self._pending[relative_path] = (size, round(time.time()))
+            if len(self._pending) < self.FLUSH_THRESHOLD:
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Write the buffered accesses to the index.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        try:
+            with contextlib.closing(self._connect()) as connection, connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO entries (path, size, accessed)"
+                    " VALUES (?, ?, ?)",
+                    [
+                        (path, size, accessed)
+                        for path, (size, accessed) in pending.items()
+                    ],
+                )
+        except (OSError, sqlite3.Error) as e:
+            # The index must never break the actual operation.
+            logger.debug("Failed to update the cache index: %s", e)
+
+    def forget(self, directory: Path) -> None:
+        """
+        Remove all entries in a directory that has been cleared from the index.
+
+        :param directory: The cleared directory
+        """
+        try:
+            prefix = f"{directory.relative_to(self.cache_dir).as_posix()}/"
+        except ValueError:
+            return
+        if prefix == "./":
+            prefix = ""
+
+        with self._lock:
+            self._pending = {
+                path: access
+                for path, access in self._pending.items()
+                if not path.startswith(prefix)
+            }
+        with contextlib.closing(self._connect()) as connection, connection:
+            connection.execute(
+                "DELETE FROM entries WHERE substr(path, 1, ?) = ?",
+                [len(prefix), prefix],
+            )
+
+    def size(self) -> int:
+        """
+        Return the total size of all recorded entries in bytes.
+        """
+        self.flush()
+        with contextlib.closing(self._connect()) as connection:
+            (size,) = connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        return int(size)
+
+    def prune(
+        self,
+        *,
+        max_size: int | None = None,
+        max_age: int | None = None,
+        protected: Collection[str] = (),
+        dry_run: bool = False,
+    ) -> PruneResult:
+        """
+        Evict the least recently used entries until the remaining entries
+        take up at most max_size bytes and none of them has not been used
+        for more than max_age seconds.
+
+        :param max_size: The maximum size of the caches in bytes
+        :param max_age: The maximum time in seconds since the last access
+        :param protected: The file names of entries that must not be evicted
+        :param dry_run: Only determine what would be evicted
+        """
+        self.flush()
+        with contextlib.closing(self._connect()) as connection:
+            # Entries may have been created or deleted while accesses
+            # were not recorded, e.g. because no limits were configured.
+            self._scan(connection)
+
+            (total_size,) = connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            min_accessed = round(time.time()) - max_age if max_age is not None else 0
+
+            evicted: list[tuple[str, int]] = []
+            for path, size, accessed in connection.execute(
+                "SELECT path, size, accessed FROM entries ORDER BY accessed"
+            ):
+                if accessed >= min_accessed and (
+                    max_size is None or total_size <= max_size
+                ):
+                    break
+                if path.rsplit("/", 1)[-1] in protected:
+                    continue
+                evicted.append((path, size))
+                total_size -= size
+
+            result = PruneResult(len(evicted), sum(size for _, size in evicted))
+            if dry_run:
+                return result
+
+            removed = self._evict([path for path, _ in evicted])
+            with connection:
+                connection.executemany(
+                    "DELETE FROM entries WHERE path = ?",
+                    [(path,) for path in removed],
+                )
+                self._set_meta(connection, "pruned", round(time.time()))
+
+        return result
+
+    def last_pruned(self) -> int | None:
+        """
+        Return the time of the last pruning in seconds since epoch.
+        """
+        with contextlib.closing(self._connect()) as connection:
+            return self._get_meta(connection, "pruned")
+
+    def _evict(self, paths: list[str]) -> list[str]:
+        """
+        Delete the given entries and their companion files.
+
+        Returns the paths of all deleted entries.
+        """
+        removed = list(paths)
+        hashes_by_database: defaultdict[Path, list[str]] = defaultdict(list)
+        files = []
+        for path in paths:
+            file = self.cache_dir / path
+            companion = self._companion(file)
+            if companion is not None:
+                files.append(companion)
+                removed.append(companion.relative_to(self.cache_dir).as_posix())
+            if file.parent.name == SQLiteCache.FILENAME:
+                hashes_by_database[file.parent].append(file.name)
+            else:
+                files.append(file)
+
+        for file in files:
+            file.unlink(missing_ok=True)
+            # remove directories that only contained the entry
+            directory = file.parent
+            while (
+                directory != self.cache_dir
+                and directory.is_dir()
+                and not any(directory.iterdir())
+            ):
+                directory.rmdir()
+                directory = directory.parent
+
+        for database, hashes in hashes_by_database.items():
+            if database.exists():
+                cache: SQLiteCache[Any] = SQLiteCache(database.parent)
+                cache._delete(hashes)
+                cache.close()
+
+        return removed
+
+    def _companion(self, file: Path) -> Path | None:
+        """
+        Return the file that belongs to an entry of a cache and
+        has to be deleted together with the entry, if there is one.
+        """
+        # The results of the solver cache refer to separate lock files
+        # that are named after the entry.
+        solver_cache_dir = (
+            self.cache_dir / "cache" / "repositories" / SOLVER_RESULT_CACHE_DIRECTORY
+        )
+        if file.is_relative_to(solver_cache_dir / "entries"):
+            return solver_cache_dir / "locks" / f"{file.name}.lock"
+        return None
+
+    def _scan(self, connection: sqlite3.Connection) -> None:
+        """
+        Record the entries that are not recorded yet, using their
+        modification time as the time of their last access,
+        and forget the recorded entries that do not exist anymore.
+        """
+        rows: dict[str, tuple[int, int]] = {}
+        directories = (
+            (self.cache_dir / "artifacts", True),
+            (self.cache_dir / "cache" / "repositories", False),
+        )
+        for directory, is_artifact_cache in directories:
+            for root, dirs, files in os.walk(directory):
+                # the HTTP cache is managed by CacheControl
+                dirs[:] = [d for d in dirs if d != "_http"]
+                for name in files:
+                    file = Path(root, name)
+                    if name == SQLiteCache.FILENAME:
+                        with contextlib.closing(sqlite3.connect(file)) as database:
+                            accessed = round(file.stat().st_mtime)
+                            for h, size in database.execute(
+                                "SELECT key, LENGTH(data) FROM entries"
+                            ):
+                                path = (file / h).relative_to(self.cache_dir)
+                                rows[path.as_posix()] = (size, accessed)
+                    elif is_artifact_cache or _HASH_PATTERN.fullmatch(
+                        name.removesuffix(".lock")
+                    ):
+                        stat = file.stat()
+                        path = file.relative_to(self.cache_dir)
+                        rows[path.as_posix()] = (stat.st_size, round(stat.st_mtime))
+
+        with connection:
+            for directory, _ in directories:
+                prefix = f"{directory.relative_to(self.cache_dir).as_posix()}/"
+                missing = [
+                    (path,)
+                    for (path,) in connection.execute(
+                        "SELECT path FROM entries WHERE substr(path, 1, ?) = ?",
+                        (len(prefix), prefix),
+                    ).fetchall()
+                    if path not in rows
+                ]
+                connection.executemany("DELETE FROM entries WHERE path = ?", missing)
+            # entries that have been accessed are already recorded
+            connection.executemany(
+                "INSERT OR IGNORE INTO entries (path, size, accessed) VALUES (?, ?, ?)",
+                [(path, size, accessed) for path, (size, accessed) in rows.items()],
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.database, timeout=30)
+        connection.execute("PRAGMA journal_mode=WAL")
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries (path TEXT PRIMARY KEY,"
+                " size INTEGER NOT NULL, accessed INTEGER NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER)"
+            )
+        return connection
+
+    @staticmethod
+    def _get_meta(connection: sqlite3.Connection, key: str) -> int | None:
+        row = connection.execute(
+            "SELECT value FROM meta WHERE key = ?", [key]
+        ).fetchone()
+        return None if row is None else int(row[0])
+
+    @staticmethod
+    def _set_meta(connection: sqlite3.Connection, key: str, value: int) -> None:
+        connection.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", [key, value]
+        )
+
+
+_cache_indexes: dict[Path, CacheIndex] = {}
+_cache_indexes_lock = threading.Lock()
+
+
+@overload
+def get_cache_index(config: Config, *, required: Literal[True]) -> CacheIndex: ...
+
+
+@overload
+def get_cache_index(config: Config, *, required: bool = False) -> CacheIndex | None: ...
+
+
+def get_cache_index(config: Config, *, required: bool = False) -> CacheIndex | None:
+    """
+    Return the index of the configured cache directory, which is shared
+    by all caches in that directory and written when the interpreter exits.
+
+    Accesses only have to be recorded if the caches are pruned automatically.
+    Therefore, there is no index unless cache-max-size or cache-max-age
+    is configured or an index is required, e.g. for pruning explicitly.
+    """
+    if (
+        not required
+        and config.get("cache-max-size") is None
+        and config.get("cache-max-age") is None
+    ):
+        return None
+
+    cache_dir = Path(config.get("cache-dir")).expanduser()
+    with _cache_indexes_lock:
+        index = _cache_indexes.get(cache_dir)
+        if index is None:
+            index = _cache_indexes[cache_dir] = CacheIndex(cache_dir)
+            atexit.register(index.flush)
+        return index
+
+
+def prune_caches(
+    config: Config,
+    locked: Iterable[Package] = (),
+    *,
+    max_size: int | None = None,
+    max_age: int | None = None,
+    dry_run: bool = False,
+) -> PruneResult:
+    """
+    Evict the least recently used entries of the artifact and repository caches.
+
+    :param config: The config that determines the cache directory
+    :param locked: The packages whose cache entries must not be evicted
+    :param max_size: The maximum size of the caches in MiB
+    :param max_age: The maximum number of days since the last access of an entry
+    :param dry_run: Only determine what would be evicted
+    """
+    return get_cache_index(config, required=True).prune(
+        max_size=max_size * 2**20 if max_size is not None else None,
+        max_age=max_age * 86400 if max_age is not None else None,
+        protected=get_locked_cache_entries(locked),
+        dry_run=dry_run,
+    )
+
+
+def get_locked_cache_entries(packages: Iterable[Package]) -> set[str]:
+    """
+    Return the file names of the cache entries (artifacts, release
+    information and metadata files) of the given packages,
+    which must not be evicted.
+    """
+    names = set()
+    for package in packages:
+        names.add(SQLiteCache._hash(f"{package.name}:{package.version}"))
+        for f in package.files:
+            names.add(f["file"])
+            names.add(SQLiteCache._hash(get_metadata_cache_key(f["file"], f["hash"])))
+    return names
+
+
+def get_metadata_cache_key(file: str, file_hash: str) -> str:
+    """
+    Return the key of the metadata file (PEP 658) of a distribution
+    in the release cache.
+
+    :param file: The file name of the distribution
+    :param file_hash: The hash of the distribution as recorded in the lock file
+    """
+    return f"metadata:{file}#{file_hash}"
+
+
+def get_cache(
+    path: Path, backend: str = "files", index: CacheIndex | None = None
+) -> FileCache[Any] | SQLiteCache[Any]:
+    """
+    Create a cache for the given path using the given backend,
+    i.e. the value of the "cache-backend" setting.
+    """
+    if backend == "sqlite":
+        return SQLiteCache(path, index=index)
+    return FileCache(path, index=index)
+
+
 class ArtifactCache:
-    def __init__(self, *, cache_dir: Path) -> None:
+    def __init__(self, *, cache_dir: Path, index: CacheIndex | None = None) -> None:
         self._cache_dir = cache_dir
+        self._index = index
         self._archive_locks: defaultdict[Path, threading.Lock] = defaultdict(
             threading.Lock
         )
@@ -272,6 +946,8 @@ class ArtifactCache:
                         cached_archive.unlink(missing_ok=True)
                         raise
 
+        if cached_archive is not None:
+            self._touch(cached_archive)
         return cached_archive
 
     def get_cached_archive_for_git(
@@ -279,7 +955,15 @@ class ArtifactCache:
     ) -> Path | None:
         cache_dir = self.get_cache_directory_for_git(url, reference, subdirectory)
 
-        return self._get_cached_archive(cache_dir, strict=False, env=env)
+        cached_archive = self._get_cached_archive(cache_dir, strict=False, env=env)
+        if cached_archive is not None:
+            self._touch(cached_archive)
+        return cached_archive
+
+    def _touch(self, archive: Path) -> None:
+        if self._index is not None:
+            with contextlib.suppress(OSError):
+                self._index.touch(archive, archive.stat().st_size)
 
     def _get_cached_archive(
         self,
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import functools
+import threading
+import time
+
+from collections import Counter
+from contextlib import contextmanager
+from contextlib import nullcontext
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import ParamSpec
+from typing import TypeVar
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterator
+    from contextlib import AbstractContextManager
+
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_active: Profiler | None = None
+
+
+class Profiler:
+    """
+    Collects timers and counters of the phases of dependency resolution.
+
+    Timers are inclusive, i.e. the time of a phase contains the time
+    of all phases that have been measured while it was running.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._durations: dict[str, float] = {}
+        self._calls: Counter[str] = Counter()
+        self._counters: Counter[str] = Counter()
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            with self._lock:
+                self._durations[name] = self._durations.get(name, 0.0) + duration
+                self._calls[name] += 1
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += value
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "timers": {
+                    name: {"calls": self._calls[name], "seconds": duration}
+                    for name, duration in sorted(self._durations.items())
+                },
+                "counters": dict(sorted(self._counters.items())),
+            }
+
+    def summary(self) -> list[str]:
+        data = self.as_dict()
+        lines = []
+        if data["timers"]:
+            lines.append("Timers (inclusive):")
+            width = max(len(name) for name in data["timers"])
+            for name, timer in sorted(
+                data["timers"].items(), key=lambda item: -item[1]["seconds"]
+            ):
+                lines.append(
+                    f"  {name:<{width}}  {timer['seconds']:>9.3f}s"
+                    f"  {timer['calls']:>8} calls"
+                )
+        if data["counters"]:
+            lines.append("Counters:")
+            width = max(len(name) for name in data["counters"])
+            for name, value in data["counters"].items():
+                lines.append(f"  {name:<{width}}  {value:>9}")
+        return lines
+
+
+@contextmanager
+def profiling() -> Iterator[Profiler]:
+    """
+    Activate a new profiler for the duration of the context.
+    """
+    global _active
+
+    previous, _active = _active, Profiler()
+    try:
+        yield _active
+    finally:
+        _active = previous
+
+
+def measure(name: str) -> AbstractContextManager[None]:
+    if _active is None:
+        return nullcontext()
+    return _active.measure(name)
+
+
+def count(name: str, value: int = 1) -> None:
+    if _active is not None:
+        _active.count(name, value)
+
+
+def profiled(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Decorator that measures each call of the decorated function
+    if a profiler is active.
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if _active is None:
+                return func(*args, **kwargs)
+            with _active.measure(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
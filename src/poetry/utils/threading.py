@@ -3,7 +3,9 @@ from __future__ import annotations
 import functools
 import threading
 
+from concurrent.futures import Future
 from typing import TYPE_CHECKING
+from typing import Generic
 from typing import TypeVar
 from typing import overload
 from weakref import WeakKeyDictionary
@@ -16,6 +18,7 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 C = TypeVar("C", bound=object)
+K = TypeVar("K")
 
 
 class AtomicCachedProperty(functools.cached_property[T]):
@@ -67,3 +70,52 @@ def atomic_cached_property(func: Callable[[C], T]) -> AtomicCachedProperty[T]:
     :param func: The function to be turned into a thread-safe cached property.
     """
     return AtomicCachedProperty(func)
+
+
+class SingleFlightCache(Generic[K, T]):
+    """
+    A thread-safe memo for a function with a single (hashable) argument.
+
+    Concurrent calls with the same argument share a single computation:
+    the first caller computes the result while all other callers wait for it.
+    Results are cached indefinitely. Exceptions, even a ``KeyboardInterrupt``,
+    are propagated to all callers that waited for the computation, but they
+    are only cached if they are instances of ``cache_exceptions``.
+    """
+
+    def __init__(
+        self,
+        func: Callable[[K], T],
+        cache_exceptions: tuple[type[Exception], ...] = (),
+    ) -> None:
+        functools.update_wrapper(self, func)
+        self._func = func
+        self._cache_exceptions = cache_exceptions
+        self._lock = threading.Lock()
+        self._futures: dict[K, Future[T]] = {}
+
+    def __call__(self, key: K) -> T:
+        with self._lock:
+            future = self._futures.get(key)
+            is_owner = future is None
+            if future is None:
+                future = self._futures[key] = Future()
+
+        if is_owner:
+            try:
+                future.set_result(self._func(key))
+            except BaseException as e:
+                # Even on KeyboardInterrupt or SystemExit, waiting callers
+                # must be released and the computation must not be remembered.
+                if not isinstance(e, self._cache_exceptions):
+                    with self._lock:
+                        del self._futures[key]
+                future.set_exception(e)
+                if not isinstance(e, Exception):
+                    raise
+
+        return future.result()
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._futures.clear()
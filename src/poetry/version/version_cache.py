@@ -0,0 +1,106 @@
+"""
+Interned versions and cached sort keys.
+
+Repository pages contain the same version strings over and over again, e.g.
+one per distribution of a release, and the same versions are sorted and
+compared many times during dependency resolution. The functions of this
+module parse each version string only once, so that equal version strings
+are represented by the same object. Further, they provide a sort key
+consisting only of builtin types, which compares considerably faster
+than versions themselves.
+"""
+
+from __future__ import annotations
+
+import functools
+
+from typing import TYPE_CHECKING
+
+from poetry.core.constraints.version import Version
+
+
+if TYPE_CHECKING:
+    from functools import _CacheInfo
+
+    from poetry.core.version.pep440 import ReleaseTag
+
+
+CACHE_SIZE = 2**16
+
+SortKey = tuple[
+    int,
+    tuple[int, ...],
+    tuple[str, int],
+    tuple[str, int],
+    tuple[str, int],
+    tuple[tuple[int, str], ...],
+]
+
+# Like in poetry-core: a dev release without a pre or post segment sorts
+# before all pre releases, phases are compared lexicographically otherwise.
+_NEG_INF_TAG = ("", 0)
+_INF_TAG = ("z", 0)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def parse(text: str) -> Version:
+    """
+    Return the canonical version for the given version string.
+
+    Raises InvalidVersionError if the string is not a valid version.
+    """
+    return Version.parse(text)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def sort_key(version: Version) -> SortKey:
+    """
+    Return a key that orders versions like the versions themselves.
+    """
+    parts = [
+        version.major,
+        version.minor or 0,
+        version.patch or 0,
+        *version.non_semver_parts,
+    ]
+    while parts and parts[-1] == 0:
+        del parts[-1]
+
+    if version.pre is None and version.post is None and version.dev is not None:
+        pre = _NEG_INF_TAG
+    elif version.pre is None:
+        pre = _INF_TAG
+    else:
+        pre = _tag_key(version.pre)
+    post = _NEG_INF_TAG if version.post is None else _tag_key(version.post)
+    dev = _INF_TAG if version.dev is None else _tag_key(version.dev)
+
+    # Mirror poetry-core, which compares alphanumeric segments of local versions
+    # as if they were zero followed by the segment, and no local segment like "0".
+    local: tuple[tuple[int, str], ...] = ((0, ""),)
+    if version.local is not None:
+        segments = (
+            version.local if isinstance(version.local, tuple) else (version.local,)
+        )
+        local = tuple(
+            (int(segment), "") if str(segment).isnumeric() else (0, str(segment))
+            for segment in segments
+        )
+
+    return version.epoch, tuple(parts), pre, post, dev, local
+
+
+def _tag_key(tag: ReleaseTag) -> tuple[str, int]:
+    return tag.phase, tag.number
+
+
+def cache_info() -> dict[str, _CacheInfo]:
+    """
+    Return the statistics of all caches of this module.
+    """
+    return {"parse": parse.cache_info(), "sort_key": sort_key.cache_info()}
+
+
+def cache_clear() -> None:
+    parse.cache_clear()
+    sort_key.cache_clear()
@@ -8,12 +8,14 @@ import pytest
 from cleo.testers.application_tester import ApplicationTester
 
 from poetry.console.application import Application
+from poetry.utils.cache import SQLiteCache
 
 
 if TYPE_CHECKING:
     from pathlib import Path
 
     from poetry.utils.cache import FileCache
+    from tests.conftest import Config
 
 T = TypeVar("T")
 
@@ -141,3 +143,28 @@ def test_cache_clear_pkg(
         assert caches[1].has("cashy:0.2")
 
     assert caches[0].has("cachy:0.1")
+
+
+def test_cache_clear_sqlite_backend(
+    tester: ApplicationTester, config: Config, repository_dirs: list[Path]
+) -> None:
+    config.merge({"cache-backend": "sqlite"})
+    cache: SQLiteCache[dict[str, str]] = SQLiteCache(repository_dirs[0])
+    cache.put("cachy:0.1", {"name": "cachy", "version": "0.1"})
+    cache.put("cleo:0.2", {"name": "cleo", "version": "0.2"})
+
+    exit_code = tester.execute(
+        f"cache clear {repository_dirs[0].name}:cachy:0.1", inputs="yes"
+    )
+
+    assert exit_code == 0
+    assert not cache.has("cachy:0.1")
+    assert cache.has("cleo:0.2")
+
+    cache.close()
+    exit_code = tester.execute(
+        f"cache clear {repository_dirs[0].name} --all", inputs="yes"
+    )
+
+    assert exit_code == 0
+    assert not repository_dirs[0].exists()
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import time
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from poetry.core.packages.package import Package
+
+from poetry.console.commands.cache.prune import CachePruneCommand
+from poetry.repositories import Repository
+
+
+if TYPE_CHECKING:
+    from cleo.testers.command_tester import CommandTester
+    from pytest_mock import MockerFixture
+
+    from poetry.utils.cache import FileCache
+    from tests.conftest import Config
+    from tests.types import CommandTesterFactory
+
+
+@pytest.fixture
+def tester(command_tester_factory: CommandTesterFactory) -> CommandTester:
+    return command_tester_factory("cache prune")
+
+
+def test_cache_prune_requires_limit(tester: CommandTester) -> None:
+    assert tester.execute() == 1
+
+    assert tester.io.fetch_error() == (
+        "Specify --max-size or --max-age"
+        " or configure cache-max-size or cache-max-age.\n"
+    )
+
+
+@pytest.mark.parametrize(
+    ("args", "message"),
+    [
+        ("--max-size 1G", "Invalid value for --max-size: 1G."),
+        ("--max-age 0", "Invalid value for --max-age: 0."),
+        ("--max-size 1 --max-age 1.5", "Invalid value for --max-age: 1.5."),
+    ],
+)
+def test_cache_prune_rejects_invalid_limits(
+    tester: CommandTester, args: str, message: str
+) -> None:
+    assert tester.execute(args) == 1
+
+    assert tester.io.fetch_error() == f"{message} Expected a positive integer.\n"
+    assert tester.io.fetch_output() == ""
+
+
+def test_cache_prune_dry_run(
+    tester: CommandTester, caches: list[FileCache[dict[str, str]]]
+) -> None:
+    tester.execute("--max-size 1 --max-age 1 --dry-run")
+
+    assert tester.io.fetch_output() == "Would evict 0 entries (0.0 MiB)\n"
+    assert caches[0].has("cachy:0.1")
+
+
+def test_cache_prune_max_age(
+    tester: CommandTester,
+    config: Config,
+    caches: list[FileCache[dict[str, str]]],
+    mocker: MockerFixture,
+) -> None:
+    config.merge({"cache-max-age": 1})
+    mocker.patch("time.time", return_value=time.time() + 2 * 86400)
+
+    tester.execute()
+
+    assert tester.io.fetch_output() == "Evicted 4 entries (0.0 MiB)\n"
+    mocker.stopall()
+    assert not caches[0].has("cachy:0.1")
+    assert not caches[1].has("cashy:0.2")
+
+
+def test_cache_prune_keeps_locked_entries(
+    tester: CommandTester,
+    caches: list[FileCache[dict[str, str]]],
+    mocker: MockerFixture,
+) -> None:
+    assert isinstance(tester.command, CachePruneCommand)
+    locker = tester.command.poetry.locker
+    mocker.patch.object(locker, "is_locked", return_value=True)
+    mocker.patch.object(
+        locker,
+        "locked_repository",
+        return_value=Repository("poetry-locked", [Package("cachy", "0.1")]),
+    )
+
+    mocker.patch("time.time", return_value=time.time() + 2 * 86400)
+    tester.execute("--max-age 1")
+
+    assert tester.io.fetch_output() == "Evicted 2 entries (0.0 MiB)\n"
+    mocker.stopall()
+    assert caches[0].has("cachy:0.1")
+    assert caches[1].has("cachy:0.1")
+    assert not caches[0].has("cleo:0.2")
+    assert not caches[1].has("cashy:0.2")
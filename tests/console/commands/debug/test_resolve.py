@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 from typing import TYPE_CHECKING
 
 import pytest
@@ -9,6 +11,8 @@ from tests.helpers import get_package
 
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from cleo.testers.command_tester import CommandTester
 
     from tests.helpers import TestRepository
@@ -78,3 +82,26 @@ demo     0.1.2
 """
 
     assert tester.io.fetch_output() == expected
+
+
+def test_debug_resolve_profile_option_writes_profile(
+    tester: CommandTester, tmp_path: Path
+) -> None:
+    profile_path = tmp_path / "profile.json"
+    tester.execute(f"cachy --profile {profile_path.as_posix()}")
+
+    profile = json.loads(profile_path.read_text(encoding="utf-8"))
+    assert set(profile["timers"]) >= {
+        "mixology.choose_package_version",
+        "mixology.propagate",
+        "provider.complete_package",
+        "provider.search_for",
+        "solver.calculate_markers",
+    }
+    assert profile["timers"]["provider.complete_package"]["calls"] == 3
+    assert profile["counters"]["mixology.decisions"] == 3
+    assert "mixology.backtracks" not in profile["counters"]
+
+    output = tester.io.fetch_output()
+    assert f"Profile (written to {profile_path.as_posix()}):" in output
+    assert "mixology.decisions" in output
@@ -64,7 +64,10 @@ def test_list_displays_default_value_if_not_set(
     cache_dir = json.dumps(str(config_cache_dir))
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache-backend = "files"
+cache-dir = {cache_dir}
+cache-max-age = null
+cache-max-size = null
 data-dir = {data_dir}
 installer.max-workers = null
 installer.no-binary = null
@@ -72,9 +75,11 @@ installer.only-binary = null
 installer.parallel = true
 installer.re-resolve = false
 keyring.enabled = true
+offline = false
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 requests.max-retries = 0
 solver.lazy-wheel = true
+solver.result-cache = true
 system-git-client = false
 virtualenvs.create = true
 virtualenvs.in-project = null
@@ -99,7 +104,10 @@ def test_list_displays_set_get_setting(
     cache_dir = json.dumps(str(config_cache_dir))
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache-backend = "files"
+cache-dir = {cache_dir}
+cache-max-age = null
+cache-max-size = null
 data-dir = {data_dir}
 installer.max-workers = null
 installer.no-binary = null
@@ -107,9 +115,11 @@ installer.only-binary = null
 installer.parallel = true
 installer.re-resolve = false
 keyring.enabled = true
+offline = false
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 requests.max-retries = 0
 solver.lazy-wheel = true
+solver.result-cache = true
 system-git-client = false
 virtualenvs.create = false
 virtualenvs.in-project = null
@@ -155,7 +165,10 @@ def test_unset_setting(
     cache_dir = json.dumps(str(config_cache_dir))
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache-backend = "files"
+cache-dir = {cache_dir}
+cache-max-age = null
+cache-max-size = null
 data-dir = {data_dir}
 installer.max-workers = null
 installer.no-binary = null
@@ -163,9 +176,11 @@ installer.only-binary = null
 installer.parallel = true
 installer.re-resolve = false
 keyring.enabled = true
+offline = false
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 requests.max-retries = 0
 solver.lazy-wheel = true
+solver.result-cache = true
 system-git-client = false
 virtualenvs.create = true
 virtualenvs.in-project = null
@@ -189,7 +204,10 @@ def test_unset_repo_setting(
     cache_dir = json.dumps(str(config_cache_dir))
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache-backend = "files"
+cache-dir = {cache_dir}
+cache-max-age = null
+cache-max-size = null
 data-dir = {data_dir}
 installer.max-workers = null
 installer.no-binary = null
@@ -197,9 +215,11 @@ installer.only-binary = null
 installer.parallel = true
 installer.re-resolve = false
 keyring.enabled = true
+offline = false
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 requests.max-retries = 0
 solver.lazy-wheel = true
+solver.result-cache = true
 system-git-client = false
 virtualenvs.create = true
 virtualenvs.in-project = null
@@ -324,7 +344,10 @@ def test_list_displays_set_get_local_setting(
     cache_dir = json.dumps(str(config_cache_dir))
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache-backend = "files"
+cache-dir = {cache_dir}
+cache-max-age = null
+cache-max-size = null
 data-dir = {data_dir}
 installer.max-workers = null
 installer.no-binary = null
@@ -332,9 +355,11 @@ installer.only-binary = null
 installer.parallel = true
 installer.re-resolve = false
 keyring.enabled = true
+offline = false
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 requests.max-retries = 0
 solver.lazy-wheel = true
+solver.result-cache = true
 system-git-client = false
 virtualenvs.create = false
 virtualenvs.in-project = null
@@ -367,7 +392,10 @@ def test_list_must_not_display_sources_from_pyproject_toml(
     cache_dir = json.dumps(str(config_cache_dir))
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache-backend = "files"
+cache-dir = {cache_dir}
+cache-max-age = null
+cache-max-size = null
 data-dir = {data_dir}
 installer.max-workers = null
 installer.no-binary = null
@@ -375,10 +403,12 @@ installer.only-binary = null
 installer.parallel = true
 installer.re-resolve = false
 keyring.enabled = true
+offline = false
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 repositories.foo.url = "https://foo.bar/simple/"
 requests.max-retries = 0
 solver.lazy-wheel = true
+solver.result-cache = true
 system-git-client = false
 virtualenvs.create = true
 virtualenvs.in-project = null
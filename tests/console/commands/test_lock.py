@@ -134,6 +134,54 @@ def test_lock_does_not_update_if_not_necessary(
         assert locked_repository.find_packages(package.to_dependency())
 
 
+def test_lock_incremental_keeps_metadata_from_lock_file(
+    command_tester_factory: CommandTesterFactory,
+    poetry_with_old_lockfile: Poetry,
+    repo: TestRepository,
+) -> None:
+    # the package in the repository has no files,
+    # which would result in a refresh without --incremental
+    repo.add_package(get_package("sampleproject", "1.3.1"))
+    repo.add_package(get_package("sampleproject", "2.0.0"))
+
+    locker = Locker(
+        lock=poetry_with_old_lockfile.pyproject.file.path.parent / "poetry.lock",
+        pyproject_data=poetry_with_old_lockfile.locker._pyproject_data,
+    )
+    poetry_with_old_lockfile.set_locker(locker)
+    locked_files = (
+        locker.locked_repository()
+        .package("sampleproject", Version.parse("1.3.1"))
+        .files
+    )
+    assert locked_files
+
+    tester = command_tester_factory("lock", poetry=poetry_with_old_lockfile)
+    tester.execute("--incremental")
+
+    locker = Locker(
+        lock=poetry_with_old_lockfile.pyproject.file.path.parent / "poetry.lock",
+        pyproject_data={},
+    )
+    package = locker.locked_repository().package(
+        "sampleproject", Version.parse("1.3.1")
+    )
+    assert package.files == locked_files
+
+
+def test_lock_incremental_and_regenerate_are_mutually_exclusive(
+    command_tester_factory: CommandTesterFactory,
+    poetry_with_old_lockfile: Poetry,
+) -> None:
+    tester = command_tester_factory("lock", poetry=poetry_with_old_lockfile)
+
+    assert tester.execute("--regenerate --incremental") == 1
+    assert (
+        tester.io.fetch_error()
+        == "You cannot use --regenerate and --incremental together.\n"
+    )
+
+
 @pytest.mark.parametrize("regenerate", [True, False])
 def test_lock_always_updates_path_dependencies(
     command_tester_factory: CommandTesterFactory,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 import shutil
+import time
 
 from typing import TYPE_CHECKING
 from typing import ClassVar
@@ -9,6 +10,10 @@ from typing import cast
 
 import pytest
 
+from cleo.events.console_events import TERMINATE
+from cleo.events.console_terminate_event import ConsoleTerminateEvent
+from cleo.events.event_dispatcher import EventDispatcher
+from cleo.io.null_io import NullIO
 from cleo.testers.application_tester import ApplicationTester
 
 from poetry.console.application import Application
@@ -17,6 +22,9 @@ from poetry.plugins.application_plugin import ApplicationPlugin
 from poetry.plugins.plugin_manager import ProjectPluginCache
 from poetry.repositories.cached_repository import CachedRepository
 from poetry.utils.authenticator import Authenticator
+from poetry.utils.authenticator import OfflineCacheControlAdapter
+from poetry.utils.cache import CacheIndex
+from poetry.utils.cache import PruneResult
 from poetry.utils.env import EnvManager
 from poetry.utils.env import MockEnv
 from tests.helpers import mock_metadata_entry_points
@@ -28,7 +36,9 @@ if TYPE_CHECKING:
     from cleo.io.inputs.argv_input import ArgvInput
     from pytest_mock import MockerFixture
 
+    from tests.conftest import Config
     from tests.helpers import PoetryTestApplication
+    from tests.types import CommandTesterFactory
     from tests.types import FixtureDirGetter
     from tests.types import SetProjectContext
 
@@ -157,6 +167,71 @@ def test_application_verify_source_cache_flag(
             assert repo._disable_cache == disable_cache
 
 
+@pytest.mark.parametrize("offline", [True, False])
+@pytest.mark.parametrize("local_offline", [None, False])
+def test_application_offline_flag(
+    offline: bool, local_offline: bool | None, set_project_context: SetProjectContext
+) -> None:
+    with set_project_context("sample_project") as path:
+        if local_offline is not None:
+            # the option takes precedence over the local configuration
+            path.joinpath("poetry.toml").write_text(
+                f"offline = {str(local_offline).lower()}\n", encoding="utf-8"
+            )
+        app = Application()
+
+        tester = ApplicationTester(app)
+        command = "debug info"
+
+        if offline:
+            command = f"{command} --offline"
+
+        tester.execute(command)
+
+        assert app.poetry.config.get("offline") is offline
+        for repo in app.poetry.pool.repositories:
+            assert isinstance(repo, CachedRepository)
+            session = repo.session.get_session(repo.url)  # type: ignore[attr-defined]
+            adapter = session.get_adapter("https://")
+            assert isinstance(adapter, OfflineCacheControlAdapter) is offline
+
+
+@pytest.mark.parametrize(
+    ("command", "exit_code", "last_pruned_ago", "pruned"),
+    [
+        ("lock", 0, None, True),
+        ("lock", 0, 2 * 86400, True),
+        ("lock", 1, None, False),
+        ("lock", 0, 60, False),
+        ("check", 0, None, False),
+    ],
+)
+def test_application_prunes_caches_after_installer_commands(
+    command_tester_factory: CommandTesterFactory,
+    config: Config,
+    mocker: MockerFixture,
+    command: str,
+    exit_code: int,
+    last_pruned_ago: int | None,
+    pruned: bool,
+) -> None:
+    config.merge({"cache-max-size": 100})
+    last_pruned = time.time() - last_pruned_ago if last_pruned_ago else None
+    mocker.patch.object(CacheIndex, "last_pruned", return_value=last_pruned)
+    prune_caches = mocker.patch(
+        "poetry.utils.cache.prune_caches", return_value=PruneResult()
+    )
+    event = ConsoleTerminateEvent(
+        command_tester_factory(command).command, NullIO(), exit_code
+    )
+
+    Application.prune_caches_for_event(event, TERMINATE, EventDispatcher())
+
+    assert prune_caches.called is pruned
+    if pruned:
+        assert prune_caches.call_args.kwargs == {"max_size": 100, "max_age": None}
+
+
 @pytest.mark.parametrize("disable_cache", [True, False])
 def test_application_verify_cache_flag_at_install(
     mocker: MockerFixture,
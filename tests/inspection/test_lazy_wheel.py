@@ -14,10 +14,15 @@ import responses
 
 from requests import codes
 
+from poetry.inspection.lazy_wheel import HostProfile
+from poetry.inspection.lazy_wheel import HostProfiles
 from poetry.inspection.lazy_wheel import HTTPRangeRequestNotRespectedError
 from poetry.inspection.lazy_wheel import HTTPRangeRequestUnsupportedError
 from poetry.inspection.lazy_wheel import InvalidWheelError
+from poetry.inspection.lazy_wheel import LazyFileOverHTTP
+from poetry.inspection.lazy_wheel import LazyWheelOverHTTP
 from poetry.inspection.lazy_wheel import LazyWheelUnsupportedError
+from poetry.inspection.lazy_wheel import RangeCache
 from poetry.inspection.lazy_wheel import metadata_from_wheel_url
 from tests.helpers import http_setup_redirect
 
@@ -50,6 +55,8 @@ if TYPE_CHECKING:
             expected_requests: int = 3,
             request_callback_wrapper: HttpRequestCallbackWrapper | None = None,
             redirect: bool = True,
+            range_cache: RangeCache | None = None,
+            host_profiles: HostProfiles | None = None,
         ) -> None: ...
 
 
@@ -192,6 +199,8 @@ def assert_metadata_from_wheel_url(
         expected_requests: int = 3,
         request_callback_wrapper: HttpRequestCallbackWrapper | None = None,
         redirect: bool = False,
+        range_cache: RangeCache | None = None,
+        host_profiles: HostProfiles | None = None,
     ) -> None:
         http.reset()
 
@@ -214,7 +223,9 @@ def assert_metadata_from_wheel_url(
         url_prefix = "redirect." if redirect else ""
         url = f"https://{url_prefix}{domain}/poetry_core-1.5.0-py3-none-any.whl"
 
-        metadata = metadata_from_wheel_url("poetry-core", url, requests.Session())
+        metadata = metadata_from_wheel_url(
+            "poetry-core", url, requests.Session(), range_cache, host_profiles
+        )
 
         assert metadata["name"] == "poetry-core"
         assert metadata["version"] == "1.5.0"
@@ -305,6 +316,152 @@ def test_metadata_from_wheel_url_416_missing_content_range(
     )
 
 
+@pytest.mark.parametrize(
+    ("negative_offset_error", "expected_requests"),
+    [
+        (None, 3),
+        (
+            (codes.requested_range_not_satisfiable, b"Requested range not satisfiable"),
+            4,
+        ),
+    ],
+)
+def test_metadata_from_wheel_url_with_range_cache(
+    assert_metadata_from_wheel_url: AssertMetadataFromWheelUrl,
+    negative_offset_error: tuple[int, bytes] | None,
+    expected_requests: int,
+    tmp_path: Path,
+) -> None:
+    range_cache = RangeCache(tmp_path)
+
+    assert_metadata_from_wheel_url(
+        negative_offset_error=negative_offset_error,
+        expected_requests=expected_requests,
+        range_cache=range_cache,
+    )
+
+    # only the request to validate the cached ranges
+    assert_metadata_from_wheel_url(
+        negative_offset_error=negative_offset_error,
+        expected_requests=1,
+        range_cache=range_cache,
+    )
+
+
+def test_metadata_from_wheel_url_with_range_cache_etag_changed(
+    assert_metadata_from_wheel_url: AssertMetadataFromWheelUrl,
+    tmp_path: Path,
+) -> None:
+    etag = '"1"'
+
+    def request_callback_wrapper(
+        request_callback: HttpRequestCallback,
+    ) -> HttpRequestCallback:
+        def _wrapped(request: PreparedRequest) -> HttpResponse:
+            status_code, response_headers, body = request_callback(request)
+            return status_code, {**response_headers, "ETag": etag}, body
+
+        return _wrapped
+
+    range_cache = RangeCache(tmp_path)
+    assert_metadata_from_wheel_url(
+        expected_requests=3,
+        request_callback_wrapper=request_callback_wrapper,
+        range_cache=range_cache,
+    )
+
+    etag = '"2"'
+    assert_metadata_from_wheel_url(
+        expected_requests=3,
+        request_callback_wrapper=request_callback_wrapper,
+        range_cache=range_cache,
+    )
+    assert_metadata_from_wheel_url(
+        expected_requests=1,
+        request_callback_wrapper=request_callback_wrapper,
+        range_cache=range_cache,
+    )
+
+
+@pytest.mark.parametrize(
+    ("negative_offset_error", "expected_requests", "expected_requests_next_run"),
+    [
+        # 1. tail including METADATA
+        (None, 3, 1),
+        # 1. HEAD, 2. tail including METADATA
+        ((codes.not_implemented, b"Unsupported client range"), 5, 2),
+        # transient errors are not remembered:
+        # 1. failed range request, 2. HEAD, 3. tail including METADATA
+        ((codes.service_unavailable, b"Service unavailable"), 5, 3),
+    ],
+)
+def test_metadata_from_wheel_url_with_host_profiles(
+    assert_metadata_from_wheel_url: AssertMetadataFromWheelUrl,
+    monkeypatch: pytest.MonkeyPatch,
+    negative_offset_error: tuple[int, bytes] | None,
+    expected_requests: int,
+    expected_requests_next_run: int,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setattr(LazyWheelOverHTTP, "_domains_without_negative_range", set())
+    host_profiles = HostProfiles(tmp_path)
+
+    assert_metadata_from_wheel_url(
+        negative_offset_error=negative_offset_error,
+        expected_requests=expected_requests,
+        host_profiles=host_profiles,
+    )
+    host_profiles.flush()
+
+    # simulate a new run
+    monkeypatch.setattr(LazyWheelOverHTTP, "_domains_without_negative_range", set())
+    assert_metadata_from_wheel_url(
+        negative_offset_error=negative_offset_error,
+        expected_requests=expected_requests_next_run,
+        host_profiles=HostProfiles(tmp_path),
+    )
+
+
+def test_host_profiles_preserve_updates_of_other_processes(tmp_path: Path) -> None:
+    profiles = HostProfiles(tmp_path)
+    other_profiles = HostProfiles(tmp_path)
+    assert profiles.get("foo.com") == HostProfile()
+    assert other_profiles.get("bar.com") == HostProfile()
+
+    profiles.update("foo.com", range_requests=True, tail_length=20_000)
+    other_profiles.update("bar.com", negative_offsets=False)
+    other_profiles.flush()
+    profiles.flush()
+
+    profiles = HostProfiles(tmp_path)
+    assert profiles.get("foo.com") == HostProfile(
+        range_requests=True, tail_length=20_000
+    )
+    bar_profile = profiles.get("bar.com")
+    assert bar_profile.negative_offsets is False
+    assert bar_profile.checked is not None
+
+
+def test_host_profiles_probe_unsupported_request_types_again(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    now = 1_700_000_000.0
+    mocker.patch("time.time", return_value=now)
+    profiles = HostProfiles(tmp_path)
+    profiles.update("foo.com", range_requests=False, tail_length=20_000)
+    profiles.update("bar.com", range_requests=True)
+    profiles.flush()
+
+    profiles = HostProfiles(tmp_path)
+    assert profiles.get("foo.com") == HostProfile(
+        range_requests=False, tail_length=20_000, checked=now
+    )
+
+    mocker.patch("time.time", return_value=now + HostProfiles.UNSUPPORTED_MAX_AGE + 1)
+    assert profiles.get("foo.com") == HostProfile(tail_length=20_000)
+    assert profiles.get("bar.com") == HostProfile(range_requests=True)
+
+
 def test_metadata_from_wheel_url_with_redirect(
     assert_metadata_from_wheel_url: AssertMetadataFromWheelUrl,
 ) -> None:
@@ -469,3 +626,34 @@ def test_metadata_from_wheel_url_handles_unexpected_errors(
             "https://runtime-error.com/demo_missing_dist_info-0.1.0-py2.py3-none-any.whl",
             requests.Session(),
         )
+
+
+def test_lazy_file_writes_missing_ranges_to_their_own_offsets(
+    http: responses.RequestsMock,
+) -> None:
+    content = bytes(range(256)) * 4
+
+    def handle_request(request: PreparedRequest) -> HttpResponse:
+        if request.method == "HEAD":
+            return build_head_response("bytes", len(content), {})
+        return build_partial_response(
+            request.headers["Range"].split("=")[1], content, {}
+        )
+
+    url = "https://example.com/file"
+    http.add_callback(responses.GET, url, callback=handle_request)
+    http.add_callback(responses.HEAD, url, callback=handle_request)
+
+    with LazyFileOverHTTP(url, requests.Session()) as lazy_file:
+        lazy_file.seek(100)
+        assert lazy_file.read(100) == content[100:200]
+        lazy_file.seek(0)
+        # the missing ranges 0-99 and 200-299 are fetched
+        assert lazy_file.read(300) == content[:300]
+
+    assert [call.request.headers.get("Range") for call in http.calls] == [
+        None,
+        "bytes=100-199",
+        "bytes=0-99",
+        "bytes=200-299",
+    ]
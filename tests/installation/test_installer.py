@@ -25,6 +25,8 @@ from poetry.core.packages.project_package import ProjectPackage
 from poetry.factory import Factory
 from poetry.installation import Installer
 from poetry.packages import Locker as BaseLocker
+from poetry.puzzle.result_cache import SolverResultCache
+from poetry.puzzle.solver import Solver
 from poetry.repositories import Repository
 from poetry.repositories import RepositoryPool
 from poetry.repositories.installed_repository import InstalledRepository
@@ -260,6 +262,26 @@ def test_run_with_dependencies(
     assert locker.written_data == expected
 
 
+def test_run_passes_result_cache_to_solver(
+    installer: Installer,
+    repo: Repository,
+    package: ProjectPackage,
+    config: Config,
+    mocker: MockerFixture,
+) -> None:
+    repo.add_package(get_package("A", "1.0"))
+    package.add_dependency(Factory.create_dependency("A", "~1.0"))
+    create = mocker.spy(SolverResultCache, "create")
+    solver_init = mocker.spy(Solver, "__init__")
+
+    assert installer.run() == 0
+
+    create.assert_called_once_with(config)
+    # The final solve in the target environment is never cached.
+    first_solver_kwargs = solver_init.call_args_list[0].kwargs
+    assert first_solver_kwargs["result_cache"] is create.spy_return
+
+
 @pytest.mark.parametrize("lock_version", ("1.1", "2.1"))
 def test_run_update_after_removing_dependencies(
     installer: Installer,
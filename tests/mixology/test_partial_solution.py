@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from poetry.core.packages.dependency import Dependency
+from poetry.core.packages.package import Package
+
+from poetry.mixology.incompatibility import Incompatibility
+from poetry.mixology.incompatibility_cause import NoVersionsCauseError
+from poetry.mixology.partial_solution import PartialSolution
+from poetry.mixology.set_relation import SetRelation
+from poetry.mixology.term import Term
+
+
+def get_cause(name: str) -> Incompatibility:
+    return Incompatibility([Term(Dependency(name, "*"), True)], NoVersionsCauseError())
+
+
+def test_satisfier_returns_first_assignment_that_satisfies_term() -> None:
+    solution = PartialSolution()
+    solution.derive(Dependency("foo", ">=1.0"), True, get_cause("foo"))
+    solution.derive(Dependency("bar", ">=1.0"), True, get_cause("bar"))
+    solution.derive(Dependency("foo", "<3.0"), True, get_cause("foo"))
+    solution.derive(Dependency("foo", "<2.0"), False, get_cause("foo"))
+    solution.decide(Package("foo", "2.5"))
+
+    assignments = solution._assignments
+    assert solution.satisfier(Term(Dependency("foo", ">=0.5"), True)) is assignments[0]
+    assert solution.satisfier(Term(Dependency("foo", "<4.0"), True)) is assignments[2]
+    assert (
+        solution.satisfier(Term(Dependency("foo", ">=2.0,<3.0"), True))
+        is (assignments[3])
+    )
+    assert solution.satisfier(Term(Dependency("foo", "2.5"), True)) is assignments[4]
+    assert (
+        solution.satisfier(Term(Dependency("foo", "<1.5"), False)) is (assignments[3])
+    )
+
+
+def test_satisfier_after_backtracking() -> None:
+    solution = PartialSolution()
+    solution.derive(Dependency("foo", ">=1.0"), True, get_cause("foo"))
+    solution.decide(Package("bar", "1.0"))
+    solution.derive(Dependency("foo", "<2.0"), True, get_cause("foo"))
+
+    term = Term(Dependency("foo", ">=1.0,<2.0"), True)
+    assert solution.satisfier(term) is solution._assignments[2]
+
+    solution.backtrack(0)
+    solution.derive(Dependency("foo", "<3.0"), True, get_cause("foo"))
+    solution.derive(Dependency("foo", "<2.0"), True, get_cause("foo"))
+
+    assert solution.satisfier(term) is solution._assignments[2]
+    assert solution.relation(term) == SetRelation.SUBSET
+
+
+def test_updated_unsatisfied_returns_changed_dependencies_in_order() -> None:
+    solution = PartialSolution()
+    solution.derive(Dependency("foo", ">=1.0"), True, get_cause("foo"))
+    solution.derive(Dependency("bar", ">=1.0"), True, get_cause("bar"))
+
+    updated = solution.updated_unsatisfied()
+    assert [dependency.name for _, dependency in updated] == ["foo", "bar"]
+    assert solution.updated_unsatisfied() == []
+    (foo_position, foo), (bar_position, bar) = updated
+
+    solution.derive(Dependency("foo", "<2.0"), True, get_cause("foo"))
+    solution.decide(Package("bar", "1.0"))
+
+    [(position, new_foo)] = solution.updated_unsatisfied()
+    assert position == foo_position
+    assert str(new_foo.constraint) == ">=1.0,<2.0"
+    assert not solution.is_unsatisfied(foo_position, foo)
+    assert solution.is_unsatisfied(foo_position, new_foo)
+    assert not solution.is_unsatisfied(bar_position, bar)
+
+    solution.backtrack(0)
+
+    [(position, dependency)] = solution.updated_unsatisfied()
+    assert dependency.name == "bar"
+    assert position > foo_position
+    assert solution.is_unsatisfied(position, dependency)
+    assert solution.unsatisfied == [new_foo, dependency]
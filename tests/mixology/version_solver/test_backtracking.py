@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import random
+
 from typing import TYPE_CHECKING
 
 from poetry.factory import Factory
+from poetry.mixology.set_relation import SetRelation
+from poetry.mixology.version_solver import VersionSolver
 from tests.mixology.helpers import add_to_repo
 from tests.mixology.helpers import check_solver_result
 
 
 if TYPE_CHECKING:
     from poetry.core.packages.project_package import ProjectPackage
+    from pytest_mock import MockerFixture
 
     from poetry.repositories import Repository
     from tests.mixology.version_solver.conftest import Provider
@@ -204,3 +209,73 @@ def test_backtracking_performance_level_2(
         add_to_repo(repo, "c", str(i), deps={"b": f"<={i}"})
 
     check_solver_result(root, provider, {"a": "1", "b": str(bc_max), "c": str(bc_max)})
+
+
+def assert_watched_terms_match_full_rescan(solver: VersionSolver) -> None:
+    watchers = {
+        (name, incompatibility)
+        for name, incompatibilities in solver._watchers.items()
+        for incompatibility in incompatibilities
+    }
+    assert watchers == {
+        (term.dependency.complete_name, incompatibility)
+        for incompatibility, terms in solver._watched_terms.items()
+        for term in terms
+    }
+    assert set(solver._watched_terms) == solver._incompatibilities
+
+    for incompatibility in solver._incompatibilities:
+        if incompatibility in solver._contradicted_incompatibilities:
+            continue
+        relations = [solver.solution.relation(t) for t in incompatibility.terms]
+        if SetRelation.DISJOINT in relations:
+            continue
+        # As long as an incompatibility has undecided terms, it watches them,
+        # i.e. looking at the watched terms gives the same result
+        # as a full rescan of all terms.
+        watched = [
+            solver.solution.relation(t) for t in solver._watched_terms[incompatibility]
+        ]
+        assert watched.count(SetRelation.OVERLAPPING) == min(
+            2, relations.count(SetRelation.OVERLAPPING)
+        ), incompatibility
+
+
+def test_watched_terms_match_full_rescan_after_backjumping(
+    root: ProjectPackage, provider: Provider, repo: Repository, mocker: MockerFixture
+) -> None:
+    # randomly interdependent packages with narrow constraints
+    # so that there are many conflicts
+    rng = random.Random(0)
+    count, versions = 12, 6
+    for i in range(count):
+        for v in range(versions):
+            deps = {}
+            for j in rng.sample(range(i + 1, count), min(2, count - i - 1)):
+                lower = rng.randint(0, versions - 2)
+                deps[f"p{j}"] = f">={lower},<{lower + rng.randint(2, 3)}"
+            add_to_repo(repo, f"p{i}", str(v), deps=deps)
+    for i in range(0, count, 3):
+        root.add_dependency(Factory.create_dependency(f"p{i}", "*"))
+
+    choose_package_version = VersionSolver._choose_package_version
+    checked_states = 0
+
+    def check_and_choose(solver: VersionSolver) -> str | None:
+        nonlocal checked_states
+        assert_watched_terms_match_full_rescan(solver)
+        checked_states += 1
+        return choose_package_version(solver)
+
+    mocker.patch.object(
+        VersionSolver,
+        "_choose_package_version",
+        autospec=True,
+        side_effect=check_and_choose,
+    )
+    backtrack = mocker.spy(VersionSolver, "_resolve_conflict")
+
+    solution = VersionSolver(root, provider).solve()
+
+    assert backtrack.call_count > 10
+    assert checked_states > len(solution.packages)
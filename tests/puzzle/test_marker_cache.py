@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import pytest
+
+from poetry.core.version.markers import MultiMarker
+from poetry.core.version.markers import SingleMarker
+from poetry.core.version.markers import parse_marker
+
+from poetry.puzzle import marker_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> None:
+    marker_cache.cache_clear()
+
+
+def test_intern_returns_first_equal_marker() -> None:
+    marker = SingleMarker("sys_platform", "linux")
+    equal_marker = SingleMarker("sys_platform", "linux")
+    assert equal_marker is not marker
+    assert marker_cache.intern(marker) is marker
+    assert marker_cache.intern(equal_marker) is marker
+
+
+def test_operations_are_memoized() -> None:
+    linux = parse_marker('sys_platform == "linux"')
+    py38 = parse_marker('python_version == "3.8"')
+
+    intersection = marker_cache.intersect(linux, py38)
+    assert intersection == linux.intersect(py38)
+    assert marker_cache.intersect(linux, py38) is intersection
+
+    union = marker_cache.union(linux, py38)
+    assert union == linux.union(py38)
+    assert marker_cache.union(linux, py38) is union
+
+    inverted = marker_cache.invert(linux)
+    assert inverted == parse_marker('sys_platform != "linux"')
+    assert marker_cache.invert(linux) is inverted
+
+    assert not marker_cache.is_empty(intersection)
+    assert marker_cache.is_empty(marker_cache.intersect(linux, inverted))
+
+    info = marker_cache.cache_info()
+    assert info["intersect"].hits == 1
+    assert info["intersect"].misses == 2
+    assert info["union"].hits == 1
+    assert info["invert"].hits == 1
+
+
+def test_results_are_interned() -> None:
+    linux = parse_marker('sys_platform == "linux"')
+    py38 = parse_marker('python_version == "3.8"')
+
+    intersection = marker_cache.intersect(linux, py38)
+    assert marker_cache.intern(MultiMarker(linux, py38)) is intersection
+
+
+@pytest.mark.parametrize(
+    ("environment", "expected"),
+    [
+        ({"extra": {"foo"}}, True),
+        ({"extra": ["foo", "bar"]}, True),
+        ({"extra": set()}, False),
+        ({"sys_platform": "linux"}, True),
+        ({"sys_platform": "win32"}, False),
+    ],
+)
+def test_validate(environment: dict[str, object], expected: bool) -> None:
+    marker = parse_marker('extra == "foo" and sys_platform == "linux"')
+
+    frozen = marker_cache.freeze(environment)
+
+    assert marker_cache.validate(marker, frozen) is expected
+    assert marker_cache.validate(marker, marker_cache.freeze(environment)) is expected
+    assert marker_cache.cache_info()["validate"].hits == 1
+
+
+def test_freeze_interns_equal_environments() -> None:
+    environment = {
+        "extra": {"foo"},
+        "platform_release": "5.10",
+        "sys_platform": "linux",
+    }
+
+    frozen = marker_cache.freeze(environment)
+
+    assert marker_cache.freeze(dict(reversed(environment.items()))) is frozen
+    assert marker_cache.freeze({**environment, "extra": {"bar"}}) is not frozen
+
+
+def test_freeze_keeps_order_of_values() -> None:
+    marker = parse_marker('extra == "foo"')
+
+    frozen = marker_cache.freeze({"extra": ("foo", "bar")})
+
+    assert marker_cache.freeze({"extra": ("bar", "foo")}) is not frozen
+    assert marker_cache.freeze({"extra": ["foo", "bar"]}) is frozen
+    assert frozen._environment == {"extra": ("foo", "bar")}
+    assert marker_cache.validate(marker, frozen)
@@ -23,6 +23,7 @@ from poetry.core.packages.vcs_dependency import VCSDependency
 from poetry.factory import Factory
 from poetry.inspection.info import PackageInfo
 from poetry.packages import DependencyPackage
+from poetry.puzzle import marker_cache
 from poetry.puzzle.provider import IncompatibleConstraintsError
 from poetry.puzzle.provider import Provider
 from poetry.repositories.cached_repository import CachedRepository
@@ -1069,3 +1070,118 @@ def test_source_dependency_is_not_satisfied_by_incompatible_direct_origin(
     dep.source_name = repository.name
 
     assert provider.search_for(dep) == [repo_package]
+
+
+def test_complete_package_uses_prefetched_package(
+    root: ProjectPackage, repository: Repository, mocker: MockerFixture
+) -> None:
+    repository.add_package(Package("foo", "1.0"))
+    pool = RepositoryPool()
+    pool.add_repository(repository)
+    provider = Provider(root, pool, NullIO())
+    pool_package_spy = mocker.spy(pool, "package")
+
+    dependency_package = DependencyPackage(
+        Dependency("foo", ">=1"), Package("foo", "1.0")
+    )
+    with provider.use_metadata_prefetch(max_workers=2):
+        provider.prefetch_packages([dependency_package])
+        provider.complete_package(dependency_package)
+        # prefetching the same package again must not fetch it again
+        provider.prefetch_packages([dependency_package])
+
+    provider.complete_package(dependency_package)
+
+    assert pool_package_spy.call_count == 1
+
+
+def test_prefetch_packages_preloads_release_info(
+    root: ProjectPackage, mocker: MockerFixture
+) -> None:
+    repository = MockCachedRepository("repo")
+    pool = RepositoryPool([repository])
+    provider = Provider(root, pool, NullIO())
+    preload_release_info = mocker.patch.object(repository, "preload_release_info")
+    mocker.patch.object(pool, "package", return_value=Package("foo", "1.0"))
+
+    dependency_packages = [
+        DependencyPackage(Dependency("foo", ">=1"), Package("foo", version))
+        for version in ("1.0", "2.0")
+    ]
+    with provider.use_metadata_prefetch(max_workers=2):
+        provider.prefetch_packages(dependency_packages)
+        # packages that are already scheduled are not preloaded again
+        provider.prefetch_packages(dependency_packages)
+
+    preload_release_info.assert_called_once_with(
+        "foo", [package.package.version for package in dependency_packages]
+    )
+
+
+def test_get_package_from_pool_does_not_remember_failures(
+    provider: Provider, repository: Repository, mocker: MockerFixture
+) -> None:
+    pool_package_spy = mocker.spy(provider.pool, "package")
+    version = Package("foo", "1.0").version
+
+    with pytest.raises(PackageNotFoundError):
+        provider.get_package_from_pool("foo", version)
+
+    repository.add_package(Package("foo", "1.0"))
+
+    assert provider.get_package_from_pool("foo", version).name == "foo"
+    assert pool_package_spy.call_count == 2
+
+
+def test_resolve_overlapping_markers_prunes_exclusive_markers(
+    provider: Provider, root: ProjectPackage
+) -> None:
+    platforms = [f"platform{i}" for i in range(12)]
+    dependencies = [
+        Factory.create_dependency(
+            "foo", {"version": f"{i}", "markers": f'sys_platform == "{platform}"'}
+        )
+        for i, platform in enumerate(platforms)
+    ]
+    marker_cache.cache_clear()
+
+    resolved = provider._resolve_overlapping_markers(root, dependencies, None)
+
+    assert [str(dep.marker) for dep in resolved] == [
+        *(f'sys_platform == "{platform}"' for platform in platforms),
+        " and ".join(f'sys_platform != "{platform}"' for platform in platforms),
+    ]
+    assert [str(dep.constraint) for dep in resolved] == [
+        *(str(i) for i in range(12)),
+        "<empty>",
+    ]
+    # Only a small fraction of the 2^12 combinations is evaluated.
+    intersections = marker_cache.cache_info()["intersect"]
+    assert intersections.hits + intersections.misses < 300
+
+
+def test_clone_keeps_trusted_locked_packages(
+    root: ProjectPackage, pool: RepositoryPool
+) -> None:
+    root.add_dependency(Factory.create_dependency("foo", "*"))
+    provider = Provider(root, pool, NullIO(), locked=[Package("foo", "1.0")])
+    provider.trust_locked(True)
+
+    clone = provider.clone()
+
+    assert clone.is_trusting_locked()
+    clone.trust_locked(False)
+    assert not clone.is_trusting_locked()
+    assert provider.is_trusting_locked()
+
+
+def test_merge_searched(provider: Provider, repository: Repository) -> None:
+    repository.add_package(Package("foo", "1.0"))
+    clone = provider.clone()
+
+    clone.search_for(Factory.create_dependency("foo", "*"))
+    assert provider.searched == set()
+
+    provider.merge_searched(clone)
+
+    assert provider.searched == {("foo", None)}
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import sqlite3
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from cleo.io.null_io import NullIO
+from poetry.core.packages.project_package import ProjectPackage
+
+from poetry.factory import Factory
+from poetry.puzzle.result_cache import SolverResultCache
+from poetry.puzzle.solver import Solver
+from poetry.repositories import RepositoryPool
+from poetry.repositories.link_sources.base import LinkSource
+from poetry.utils.cache import get_cache_index
+
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+    from poetry.config.config import Config
+    from tests.repositories.fixtures.legacy import TestLegacyRepository
+
+
+@pytest.fixture
+def pool(legacy_repository_html: TestLegacyRepository) -> RepositoryPool:
+    legacy_repository_html._disable_cache = False
+    return RepositoryPool([legacy_repository_html])
+
+
+@pytest.fixture
+def root() -> ProjectPackage:
+    package = ProjectPackage("root", "1.0")
+    package.python_versions = "^3.6"
+    package.add_dependency(Factory.create_dependency("isort", "^4.3"))
+    return package
+
+
+def solve(root: ProjectPackage, pool: RepositoryPool, config: Config) -> set[str]:
+    solver = Solver(
+        root,
+        pool,
+        [],
+        [],
+        NullIO(),
+        config=config,
+        result_cache=SolverResultCache.create(config),
+    )
+    return {
+        f"{package.name}=={package.version}"
+        for package in solver.solve().get_solved_packages()
+    }
+
+
+def test_solver_reuses_cached_result(
+    root: ProjectPackage, pool: RepositoryPool, config: Config, mocker: MockerFixture
+) -> None:
+    spy = mocker.spy(Solver, "_solve")
+
+    assert solve(root, pool, config) == {"isort==4.3.4"}
+    assert spy.call_count == 1
+
+    assert solve(root, pool, config) == {"isort==4.3.4"}
+    assert spy.call_count == 1
+
+
+def test_solver_fetches_pages_of_cached_result_concurrently(
+    root: ProjectPackage, pool: RepositoryPool, config: Config, mocker: MockerFixture
+) -> None:
+    assert solve(root, pool, config) == {"isort==4.3.4"}
+    fetch_pages = mocker.spy(RepositoryPool, "fetch_pages")
+    solve_spy = mocker.spy(Solver, "_solve")
+
+    assert solve(root, pool, config) == {"isort==4.3.4"}
+
+    assert solve_spy.call_count == 0
+    assert fetch_pages.call_count == 1
+    (repository,) = pool.repositories
+    assert list(fetch_pages.call_args.args[1]) == [(repository, "isort")]
+
+
+def test_solver_does_not_reuse_result_if_page_changed(
+    root: ProjectPackage, pool: RepositoryPool, config: Config, mocker: MockerFixture
+) -> None:
+    spy = mocker.spy(Solver, "_solve")
+
+    assert solve(root, pool, config) == {"isort==4.3.4"}
+
+    mocker.patch.object(
+        LinkSource, "fingerprint", new_callable=mocker.PropertyMock, return_value="x"
+    )
+    assert solve(root, pool, config) == {"isort==4.3.4"}
+    assert spy.call_count == 2
+
+
+def test_solver_does_not_reuse_result_for_other_inputs(
+    root: ProjectPackage, pool: RepositoryPool, config: Config, mocker: MockerFixture
+) -> None:
+    spy = mocker.spy(Solver, "_solve")
+
+    assert solve(root, pool, config) == {"isort==4.3.4"}
+
+    root.add_dependency(Factory.create_dependency("isort", ">=4.3.4"))
+    assert solve(root, pool, config) == {"isort==4.3.4"}
+    assert spy.call_count == 2
+
+
+def test_solver_result_cache_can_be_disabled(
+    root: ProjectPackage, pool: RepositoryPool, config: Config, mocker: MockerFixture
+) -> None:
+    config.merge({"solver": {"result-cache": False}})
+    spy = mocker.spy(Solver, "_solve")
+
+    solve(root, pool, config)
+    solve(root, pool, config)
+    assert spy.call_count == 2
+
+
+def test_solver_result_cache_evicts_lock_files_with_entries(
+    root: ProjectPackage, pool: RepositoryPool, config: Config
+) -> None:
+    config.merge({"cache-max-age": 30})
+    solve(root, pool, config)
+    index = get_cache_index(config, required=True)
+    locks = config.repository_cache_directory / "_solver" / "locks"
+    lock_files = list(locks.iterdir())
+    assert len(lock_files) == 1
+    index.flush()
+    with sqlite3.connect(index.database) as connection:
+        paths = {path for (path,) in connection.execute("SELECT path FROM entries")}
+    assert lock_files[0].relative_to(index.cache_dir).as_posix() in paths
+
+    index.prune(max_size=0)
+
+    assert not locks.exists() or not any(locks.iterdir())
+    assert index.size() == 0
@@ -26,6 +26,7 @@ from poetry.packages import DependencyPackage
 from poetry.puzzle import Solver
 from poetry.puzzle.exceptions import SolverProblemError
 from poetry.puzzle.provider import IncompatibleConstraintsError
+from poetry.puzzle.provider import Provider
 from poetry.repositories.repository import Repository
 from poetry.repositories.repository_pool import Priority
 from poetry.repositories.repository_pool import RepositoryPool
@@ -42,8 +43,9 @@ if TYPE_CHECKING:
     from poetry.core.packages.project_package import ProjectPackage
     from pytest_mock import MockerFixture
 
+    from poetry.config.config import Config
     from poetry.installation.operations.operation import Operation
-    from poetry.puzzle.provider import Provider
+    from poetry.mixology.version_solver import VersionSolver
     from poetry.puzzle.transaction import Transaction
     from poetry.repositories.legacy_repository import LegacyRepository
     from poetry.repositories.pypi_repository import PyPiRepository
@@ -3212,6 +3214,97 @@ def test_solver_skips_invalid_versions(
     )
 
 
+def test_solver_solves_overrides_concurrently(
+    package: ProjectPackage,
+    io: NullIO,
+    pypi_repository: PyPiRepository,
+    config: Config,
+    mocker: MockerFixture,
+) -> None:
+    package.python_versions = "^3.7"
+    package.add_dependency(
+        Factory.create_dependency(
+            "pytest", {"version": "3.5.0", "markers": 'sys_platform == "win32"'}
+        )
+    )
+    package.add_dependency(
+        Factory.create_dependency(
+            "pytest", {"version": "3.5.1", "markers": 'sys_platform == "linux"'}
+        )
+    )
+    pool = RepositoryPool([pypi_repository])
+    solve_override = mocker.spy(Solver, "_solve_override")
+
+    config.merge({"installer": {"max-workers": 1}})
+    sequential_solver = Solver(package, pool, [], [], io, config=config)
+    sequential = sequential_solver.solve().get_solved_packages()
+    assert solve_override.call_count == 0
+
+    config.merge({"installer": {"max-workers": 4, "parallel": False}})
+    Solver(package, pool, [], [], io, config=config).solve()
+    assert solve_override.call_count == 0
+
+    config.merge({"installer": {"parallel": True}})
+    concurrent_solver = Solver(package, pool, [], [], io, config=config)
+    concurrent = concurrent_solver.solve().get_solved_packages()
+    assert solve_override.call_count == 3
+    assert concurrent_solver.provider.searched == sequential_solver.provider.searched
+
+    assert {
+        (p.name, str(p.version)): info.markers for p, info in concurrent.items()
+    } == {(p.name, str(p.version)): info.markers for p, info in sequential.items()}
+    assert {(p.name, str(p.version)) for p in concurrent} == {
+        ("attrs", "17.4.0"),
+        ("colorama", "0.3.9"),
+        ("more-itertools", "4.1.0"),
+        ("pluggy", "0.6.0"),
+        ("py", "1.5.3"),
+        ("pytest", "3.5.0"),
+        ("pytest", "3.5.1"),
+        ("setuptools", "67.6.1"),
+        ("six", "1.11.0"),
+    }
+
+
+@pytest.mark.parametrize("parallel", [True, False])
+def test_solver_prefetches_metadata_only_if_parallel(
+    package: ProjectPackage,
+    io: NullIO,
+    pypi_repository: PyPiRepository,
+    config: Config,
+    mocker: MockerFixture,
+    parallel: bool,
+) -> None:
+    package.python_versions = "^3.7"
+    package.add_dependency(Factory.create_dependency("pytest", "3.5.0"))
+    pool = RepositoryPool([pypi_repository])
+    use_metadata_prefetch = mocker.spy(Provider, "use_metadata_prefetch")
+
+    config.merge({"installer": {"parallel": parallel}})
+    Solver(package, pool, [], [], io, config=config).solve()
+
+    assert use_metadata_prefetch.call_count == int(parallel)
+
+
+def test_solver_solves_overrides_sequentially_with_in_memory_repository(
+    solver: Solver, repo: Repository, package: ProjectPackage, mocker: MockerFixture
+) -> None:
+    package.add_dependency(
+        Factory.create_dependency("foo", {"version": "^1.0", "python": "^2.7"})
+    )
+    package.add_dependency(
+        Factory.create_dependency("foo", {"version": "^2.0", "python": "^3.7"})
+    )
+    repo.add_package(get_package("foo", "1.5.0"))
+    repo.add_package(get_package("foo", "2.5.0"))
+    solve_override = mocker.spy(Solver, "_solve_override")
+
+    solver.solve()
+
+    assert len(solver._overrides) == 3
+    assert solve_override.call_count == 0
+
+
 def test_multiple_constraints_on_root(
     package: ProjectPackage, solver: Solver, repo: Repository
 ) -> None:
@@ -4541,7 +4634,11 @@ def test_solver_should_not_raise_errors_for_irrelevant_transitive_python_constra
     repo.add_package(importlib_resources)
     repo.add_package(importlib_resources_3_2_1)
 
-    def patched_choose_next(unsatisfied: list[Dependency]) -> Dependency:
+    def patched_choose_next(self: VersionSolver) -> Dependency | None:
+        unsatisfied = self.solution.unsatisfied
+        if not unsatisfied:
+            return None
+
         order = (
             ("root", "virtualenv", "pre-commit", "importlib-resources")
             if virtualenv_before_pre_commit
@@ -4555,6 +4652,7 @@ def test_solver_should_not_raise_errors_for_irrelevant_transitive_python_constra
 
     mocker.patch(
         "poetry.mixology.version_solver.VersionSolver._choose_next",
+        autospec=True,
         side_effect=patched_choose_next,
     )
 
@@ -4603,7 +4701,11 @@ def test_solver_should_not_raise_errors_for_irrelevant_transitive_python_constra
     repo.add_package(numpy_19)
     repo.add_package(numpy_20)
 
-    def patched_choose_next(unsatisfied: list[Dependency]) -> Dependency:
+    def patched_choose_next(self: VersionSolver) -> Dependency | None:
+        unsatisfied = self.solution.unsatisfied
+        if not unsatisfied:
+            return None
+
         order = (
             ("root", "pandas", "numpy")
             if numpy_before_pandas
@@ -4617,6 +4719,7 @@ def test_solver_should_not_raise_errors_for_irrelevant_transitive_python_constra
 
     mocker.patch(
         "poetry.mixology.version_solver.VersionSolver._choose_next",
+        autospec=True,
         side_effect=patched_choose_next,
     )
 
@@ -5245,3 +5348,73 @@ def test_solver_resolves_duplicate_dependencies_with_restricted_extras(
             ]
         ),
     )
+
+
+def test_solver_trusting_locked_uses_metadata_of_unaffected_locked_packages(
+    package: ProjectPackage,
+    pool: RepositoryPool,
+    repo: Repository,
+    io: NullIO,
+) -> None:
+    package.add_dependency(Factory.create_dependency("A", "*"))
+    package.add_dependency(Factory.create_dependency("C", "^2.0"))
+
+    package_a = get_package("A", "1.0")
+    package_a.add_dependency(Factory.create_dependency("B", "*"))
+    package_b = get_package("B", "1.0")
+    package_c1 = get_package("C", "1.0")
+    package_c2 = get_package("C", "2.0")
+    package_c2.add_dependency(Factory.create_dependency("D", "*"))
+    package_d = get_package("D", "1.0")
+    for pkg in (package_a, package_b, package_c1, package_c2, package_d):
+        repo.add_package(pkg)
+
+    # "A" has been locked with different (e.g. outdated) metadata
+    # whereas "C" has to be updated because its constraint has changed.
+    locked_a = get_package("A", "1.0")
+    locked_c = get_package("C", "1.0")
+    locked_c.add_dependency(Factory.create_dependency("E", "*"))
+
+    solver = Solver(package, pool, [], [locked_a, locked_c], io)
+    solver.provider.trust_locked(True)
+    transaction = solver.solve()
+
+    check_solver_result(
+        transaction,
+        [
+            {"job": "install", "package": package_d},
+            {"job": "install", "package": package_a},
+            {"job": "install", "package": package_c2},
+        ],
+    )
+
+
+def test_solver_trusting_locked_falls_back_to_full_resolution(
+    package: ProjectPackage,
+    pool: RepositoryPool,
+    repo: Repository,
+    io: NullIO,
+) -> None:
+    package.add_dependency(Factory.create_dependency("A", "*"))
+
+    package_a = get_package("A", "1.0")
+    package_a.add_dependency(Factory.create_dependency("B", "^1.0"))
+    package_b = get_package("B", "1.0")
+    repo.add_package(package_a)
+    repo.add_package(package_b)
+
+    locked_a = get_package("A", "1.0")
+    locked_a.add_dependency(Factory.create_dependency("B", "^2.0"))
+
+    solver = Solver(package, pool, [], [locked_a], io)
+    solver.provider.trust_locked(True)
+    transaction = solver.solve()
+
+    check_solver_result(
+        transaction,
+        [
+            {"job": "install", "package": package_b},
+            {"job": "install", "package": package_a},
+        ],
+    )
+    assert not solver.provider.is_trusting_locked()
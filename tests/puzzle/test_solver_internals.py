@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import itertools
+import sys
+
 from typing import TYPE_CHECKING
 
 import pytest
@@ -14,6 +17,7 @@ from poetry.core.version.markers import parse_marker
 
 from poetry.factory import Factory
 from poetry.packages.transitive_package_info import TransitivePackageInfo
+from poetry.puzzle import solver as solver_module
 from poetry.puzzle.solver import PackageNode
 from poetry.puzzle.solver import Solver
 from poetry.puzzle.solver import depth_first_search
@@ -25,6 +29,7 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
 
     from poetry.core.packages.project_package import ProjectPackage
+    from pytest_mock import MockerFixture
 
 
 DEV_GROUP = canonicalize_name("dev")
@@ -87,6 +92,22 @@ def test_dfs_depth_with_cycle(package: ProjectPackage) -> None:
     assert depths == {"root": [-1], "a": [0], "b": [1], "c": [1]}
 
 
+def test_dfs_depth_deep_chain(package: ProjectPackage) -> None:
+    length = sys.getrecursionlimit() + 100
+    chain = [Package(f"p{i}", "1") for i in range(length)]
+    package.add_dependency(dep("p0"))
+    for parent, child in itertools.pairwise(chain):
+        parent.add_dependency(dep(child.name))
+
+    result, __ = depth_first_search(PackageNode(package, [package, *chain]))
+
+    assert [nodes[0].package.name for nodes in result] == [
+        "root",
+        *(p.name for p in chain),
+    ]
+    assert result[-1][0].depth == length - 1
+
+
 def test_dfs_depth_with_extra(package: ProjectPackage) -> None:
     a_foo = Package("a", "1", features=["foo"])
     a = Package("a", "1")
@@ -407,6 +428,63 @@ def test_propagate_markers_with_cycle(package: ProjectPackage, solver: Solver) -
     }
 
 
+def test_propagate_markers_with_cycle_recalculates_only_affected_packages(
+    package: ProjectPackage, solver: Solver, mocker: MockerFixture
+) -> None:
+    a = Package("a", "1")
+    b = Package("b", "1")
+    c = Package("c", "1")
+    package.add_dependency(dep("a", 'sys_platform == "win32"'))
+    package.add_dependency(dep("c", 'sys_platform == "linux"'))
+    a.add_dependency(dep("b", 'python_version == "3.8"'))
+    b.add_dependency(dep("a", 'python_version == "3.9"'))
+    spy = mocker.spy(solver_module, "_calculate_transitive_markers")
+
+    packages = [package, a, b, c]
+    result = solver._aggregate_solved_packages(packages)
+
+    assert len(result) == 4
+    assert tm(result[a]) == {"main": 'sys_platform == "win32"'}
+    assert tm(result[b]) == {
+        "main": 'sys_platform == "win32" and python_version == "3.8"'
+    }
+    assert tm(result[c]) == {"main": 'sys_platform == "linux"'}
+    calculated = [call.args[0] for call in spy.call_args_list]
+    assert calculated.count(a) == 2
+    assert calculated.count(b) == 1
+    assert calculated.count(c) == 1
+
+
+def test_propagate_markers_through_cycles_with_deep_chain(
+    package: ProjectPackage, solver: Solver
+) -> None:
+    a = Package("a", "1")
+    b = Package("b", "1")
+    c = Package("c", "1")
+    d = Package("d", "1")
+    x = Package("x", "1")
+    package.add_dependency(dep("a", 'sys_platform == "win32"'))
+    package.add_dependency(dep("x", 'sys_platform == "linux"'))
+    a.add_dependency(dep("b"))
+    b.add_dependency(dep("c"))
+    c.add_dependency(dep("d"))
+    c.add_dependency(dep("a"))
+    d.add_dependency(dep("b"))
+    x.add_dependency(dep("d"))
+
+    packages = [package, a, b, c, d, x]
+    result = solver._aggregate_solved_packages(packages)
+
+    assert len(result) == 6
+    assert [result[p].depth for p in (a, b, c, d, x)] == [0, 1, 2, 3, 0]
+    # The marker of x reaches a via d -> b and c -> a,
+    # i.e. it has to pass two edges to packages with a lower depth.
+    expected = {"main": 'sys_platform == "win32" or sys_platform == "linux"'}
+    for p in (a, b, c, d):
+        assert tm(result[p]) == expected
+    assert tm(result[x]) == {"main": 'sys_platform == "linux"'}
+
+
 def test_merge_override_packages_restricted(package: ProjectPackage) -> None:
     """Markers of dependencies should be intersected with override markers."""
     a = Package("a", "1")
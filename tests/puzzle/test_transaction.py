@@ -19,6 +19,8 @@ from poetry.puzzle.transaction import Transaction
 
 
 if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
     from poetry.installation.operations.operation import Operation
 
 
@@ -358,6 +360,32 @@ def test_calculate_operations_with_markers(
     )
 
 
+def test_calculate_operations_evaluates_each_marker_once(
+    mocker: MockerFixture,
+) -> None:
+    marker = parse_marker("python_version >= '3.9'")
+    validate = mocker.spy(type(marker), "validate")
+    transaction = Transaction(
+        [],
+        {
+            Package(name, "1"): TransitivePackageInfo(
+                0, {MAIN_GROUP}, {MAIN_GROUP: marker}
+            )
+            for name in ("a", "b", "c")
+        },
+        [],
+        None,
+        {"python_version": "3.9"},
+        {MAIN_GROUP},
+    )
+
+    check_operations(
+        transaction.calculate_operations(),
+        [{"job": "install", "package": Package(name, "1")} for name in ("a", "b", "c")],
+    )
+    assert validate.call_count == 1
+
+
 @pytest.mark.parametrize(
     ("python_version", "sys_platform", "groups", "expected"),
     [
@@ -8,7 +8,9 @@ from unittest.mock import PropertyMock
 import pytest
 
 from packaging.utils import canonicalize_name
+from poetry.core.constraints.version import EmptyConstraint
 from poetry.core.constraints.version import Version
+from poetry.core.constraints.version import parse_constraint
 from poetry.core.packages.package import Package
 from poetry.core.packages.utils.link import Link
 
@@ -113,6 +115,111 @@ def test_links_for_version(
     )
 
 
+VERSIONS = [
+    "0.9",
+    "1.0.dev0",
+    "1.0a1",
+    "1.0",
+    "1.0+local",
+    "1.0.post1",
+    "1.1",
+    "1.1+local.2",
+    "1.5rc1",
+    "2.0.dev1",
+    "2.0a1",
+    "2.0",
+    "2.0.post1",
+    "2.1",
+    "3.0b2",
+    "3.0",
+    "10.0",
+]
+
+
+@pytest.mark.parametrize(
+    "constraint",
+    [
+        "*",
+        "<empty>",
+        "1.0",
+        "==1.0+local",
+        "!=1.0",
+        ">1.0",
+        ">=1.0",
+        "<2.0",
+        "<=2.0",
+        ">1.0,<2.0",
+        ">=1.0a1,<=2.0a1",
+        "^1.0",
+        "~2.0",
+        "1.*",
+        "<1.0 || >=2.0,<3.0 || 10.0",
+        ">=3.0b1",
+        ">=11",
+        "<0.1",
+        # bounds with a local version segment
+        "!=1.0+local",
+        "<1.0+local",
+        ">1.0+local",
+        "<=1.1+local.2",
+        ">=1.1+local.2",
+    ],
+)
+def test_find_versions(constraint: str) -> None:
+    name = canonicalize_name("demo")
+    versions = [Version.parse(v) for v in VERSIONS]
+    parsed_constraint = (
+        EmptyConstraint() if constraint == "<empty>" else parse_constraint(constraint)
+    )
+    link_source = LinkSource("https://example.org")
+    link_source._link_cache = defaultdict(
+        lambda: defaultdict(list),
+        {
+            name: defaultdict(
+                list,
+                {
+                    # shuffled to make sure that the order of the page does not matter
+                    version: [Link(f"https://example.org/demo-{version}.tar.gz")]
+                    for version in versions[1::2] + versions[::2]
+                },
+            )
+        },
+    )
+
+    expected = [v for v in versions if parsed_constraint.allows(v)]
+    assert [
+        v for v, _ in link_source.find_versions(name, parsed_constraint)
+    ] == expected
+
+
+def test_find_versions_yanked() -> None:
+    name = canonicalize_name("demo")
+    link_source = LinkSource("https://example.org")
+    link_source._link_cache = defaultdict(
+        lambda: defaultdict(list),
+        {
+            name: defaultdict(
+                list,
+                {
+                    Version.parse("1.0"): [
+                        Link("https://example.org/demo-1.0.tar.gz", yanked="broken")
+                    ],
+                    Version.parse("2.0"): [
+                        Link("https://example.org/demo-2.0.tar.gz", yanked=True),
+                        Link("https://example.org/demo-2.0-py3-none-any.whl"),
+                    ],
+                },
+            )
+        },
+    )
+
+    assert link_source.find_versions(name, parse_constraint("*")) == [
+        (Version.parse("1.0"), "broken"),
+        (Version.parse("2.0"), False),
+    ]
+    assert link_source.yanked(name, Version.parse("3.0")) is True
+
+
 @pytest.mark.parametrize(
     "query, expected",
     [
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
 from typing import Any
 
 import pytest
@@ -12,6 +13,10 @@ from poetry.inspection.info import PackageInfo
 from poetry.repositories.cached_repository import CachedRepository
 
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
 class MockCachedRepository(CachedRepository):
     def _get_release_info(
         self, name: NormalizedName, version: Version
@@ -80,3 +85,19 @@ def test_get_release_info_cache(
     # after clearing the cache entry, updated data is returned
     repo.forget(name, version)
     assert len(repo.get_release_info(name, version).files) == 2
+
+
+def test_preload_release_info(release_info: PackageInfo, mocker: MockerFixture) -> None:
+    repo = MockCachedRepository("mock")
+    name = canonicalize_name("mylib")
+    versions = [Version.parse("1.0"), Version.parse("2.0")]
+    repo._release_cache.put(f"{name}:1.0", release_info.asdict())
+    get_many = mocker.spy(type(repo._release_cache), "get_many")
+    get = mocker.spy(type(repo._release_cache), "get")
+
+    repo.preload_release_info(name, versions)
+
+    assert get_many.call_count == 1
+    get.reset_mock()
+    assert len(repo.get_release_info(name, versions[0]).files) == 2
+    assert get.call_count == 0
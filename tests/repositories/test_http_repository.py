@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import shutil
+import threading
 
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -9,17 +11,21 @@ from typing import Any
 from zipfile import ZipFile
 
 import pytest
+import responses
 
 from packaging.metadata import parse_email
 from poetry.core.packages.utils.link import Link
 
 from poetry.inspection.info import PackageInfoError
 from poetry.inspection.lazy_wheel import HTTPRangeRequestUnsupportedError
+from poetry.inspection.lazy_wheel import LazyWheelUnsupportedError
 from poetry.repositories.http_repository import HTTPRepository
 from poetry.utils.helpers import HTTPRangeRequestSupportedError
 
 
 if TYPE_CHECKING:
+    import requests
+
     from packaging.utils import NormalizedName
     from poetry.core.constraints.version import Version
     from pytest_mock import MockerFixture
@@ -73,7 +79,7 @@ def test_get_info_from_wheel(
 
     if lazy_wheel and supports_range_requests is not False:
         mock_metadata_from_wheel_url.assert_called_once_with(
-            filename, url, repo.session
+            filename, url, repo.session, repo._range_cache, repo._host_profiles
         )
         mock_download.assert_not_called()
         assert repo._supports_range_requests[domain] is True
@@ -177,6 +183,66 @@ def test_get_info_from_wheel_state_sequence(mocker: MockerFixture) -> None:
     assert mock_download.call_count == 4
 
 
+def test_get_info_from_wheel_remembers_range_request_support_across_runs(
+    mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    mock_metadata_from_wheel_url = mocker.patch(
+        "poetry.repositories.http_repository.metadata_from_wheel_url",
+        side_effect=HTTPRangeRequestUnsupportedError,
+    )
+    mock_download = mocker.patch("poetry.repositories.http_repository.download_file")
+
+    link = Link("https://foo.com/poetry_core-1.5.0-py3-none-any.whl")
+    repo = MockRepository()
+
+    with contextlib.suppress(PackageInfoError):
+        repo._get_info_from_wheel(link)
+
+    assert mock_metadata_from_wheel_url.call_count == 1
+    assert mock_download.call_count == 1
+
+    # simulate a new run
+    repo._host_profiles.flush()
+    monkeypatch.setattr("poetry.inspection.lazy_wheel._host_profiles", {})
+    repo = MockRepository()
+
+    with contextlib.suppress(PackageInfoError):
+        repo._get_info_from_wheel(link)
+
+    assert mock_metadata_from_wheel_url.call_count == 1
+    assert mock_download.call_count == 2
+    assert mock_download.call_args[1]["raise_accepts_ranges"] is True
+
+
+def test_get_info_from_wheel_does_not_remember_transient_errors_across_runs(
+    mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    mock_metadata_from_wheel_url = mocker.patch(
+        "poetry.repositories.http_repository.metadata_from_wheel_url",
+        side_effect=LazyWheelUnsupportedError("connection error"),
+    )
+    mock_download = mocker.patch("poetry.repositories.http_repository.download_file")
+
+    link = Link("https://foo.com/poetry_core-1.5.0-py3-none-any.whl")
+    repo = MockRepository()
+
+    with contextlib.suppress(PackageInfoError):
+        repo._get_info_from_wheel(link)
+
+    assert repo._supports_range_requests["foo.com"] is False
+
+    # simulate a new run
+    repo._host_profiles.flush()
+    monkeypatch.setattr("poetry.inspection.lazy_wheel._host_profiles", {})
+    repo = MockRepository()
+
+    with contextlib.suppress(PackageInfoError):
+        repo._get_info_from_wheel(link)
+
+    assert mock_metadata_from_wheel_url.call_count == 2
+    assert mock_download.call_count == 2
+
+
 @pytest.mark.parametrize(
     "mock_hashes",
     [
@@ -243,3 +309,72 @@ def test_calculate_sha256_defaults_to_sha256_on_md5_errors(
         calculated_hash
         == "sha256:e216b70f013c47b82a72540d34347632c5bfe59fd54f5fe5d51f6a68b19aaf84"
     )
+
+
+def test_get_info_from_links_fetches_metadata_of_py2_and_py3_wheels_concurrently(
+    http: responses.RequestsMock,
+) -> None:
+    py2_metadata = (
+        b"Metadata-Version: 2.1\nName: isort\nVersion: 4.3.4\nRequires-Dist: futures\n"
+    )
+    py3_metadata = (
+        b"Metadata-Version: 2.1\nName: isort\nVersion: 4.3.4\nRequires-Dist: attrs\n"
+    )
+    links = [
+        Link(
+            f"https://foo.com/isort-4.3.4-{pyver}-none-any.whl"
+            f"#sha256={hashlib.sha256(pyver.encode()).hexdigest()}",
+            metadata=f"sha256={hashlib.sha256(content).hexdigest()}",
+        )
+        for pyver, content in (("py2", py2_metadata), ("py3", py3_metadata))
+    ]
+
+    # Both requests must be in flight at the same time to pass the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def callback(
+        request: requests.PreparedRequest,
+    ) -> tuple[int, dict[str, str], bytes]:
+        barrier.wait()
+        assert request.url is not None
+        content = py2_metadata if "-py2-" in request.url else py3_metadata
+        return 200, {}, content
+
+    for link in links:
+        assert link.metadata_url is not None
+        http.add_callback(responses.GET, link.metadata_url, callback=callback)
+
+    info = MockRepository()._get_info_from_links(links, ignore_yanked=True)
+
+    assert info.requires_dist == [
+        'attrs ; python_version >= "3"',
+        'futures ; python_version == "2.7"',
+    ]
+    assert len(http.calls) == 2
+
+    # The metadata files are persisted in the release cache.
+    info = MockRepository()._get_info_from_links(links, ignore_yanked=True)
+
+    assert info.requires_dist == [
+        'attrs ; python_version >= "3"',
+        'futures ; python_version == "2.7"',
+    ]
+    assert len(http.calls) == 2
+
+
+def test_get_metadata_file_without_hash_is_not_persisted(
+    http: responses.RequestsMock,
+) -> None:
+    link = Link("https://foo.com/isort-4.3.4-py3-none-any.whl", metadata="true")
+    assert link.metadata_url is not None
+    http.get(link.metadata_url, body=b"Metadata-Version: 2.1\nName: isort\n")
+
+    assert MockRepository()._get_metadata_file(link) == (
+        b"Metadata-Version: 2.1\nName: isort\n"
+    )
+
+    # A metadata file without hash might be replaced at any time.
+    http.replace(responses.GET, link.metadata_url, body=b"Metadata-Version: 2.2\n")
+
+    assert MockRepository()._get_metadata_file(link) == b"Metadata-Version: 2.2\n"
+    assert len(http.calls) == 2
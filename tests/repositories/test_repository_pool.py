@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import threading
+
+from typing import TYPE_CHECKING
+
 import pytest
 
 from poetry.core.constraints.version import Version
@@ -13,6 +17,12 @@ from tests.helpers import get_dependency
 from tests.helpers import get_package
 
 
+if TYPE_CHECKING:
+    from packaging.utils import NormalizedName
+
+    from poetry.repositories.link_sources.base import LinkSource
+
+
 def test_pool() -> None:
     pool = RepositoryPool()
 
@@ -181,6 +191,36 @@ def test_pool_find_packages_only_considers_supplemental_when_needed() -> None:
     assert returned_packages_needs_supplemental == [package2]
 
 
+def test_pool_find_packages_fetches_pages_concurrently() -> None:
+    fetched: list[tuple[str, str, str]] = []
+
+    class FakeLegacyRepository(LegacyRepository):
+        def _get_page(self, name: NormalizedName) -> LinkSource:
+            fetched.append((self.name, name, threading.current_thread().name))
+            raise PackageNotFoundError(f"Package [{name}] not found.")
+
+    repo1 = FakeLegacyRepository("repo1", "https://a.example.org/simple")
+    repo2 = FakeLegacyRepository("repo2", "https://b.example.org/simple")
+    pool = RepositoryPool([repo1]).add_repository(repo2, priority=Priority.SUPPLEMENTAL)
+
+    assert pool.find_packages(get_dependency("foo")) == []
+    assert pool.find_packages(get_dependency("foo", "^1.0")) == []
+
+    assert sorted((repo, name) for repo, name, _ in fetched) == [
+        ("repo1", "foo"),
+        ("repo2", "foo"),
+    ]
+    main_thread = threading.main_thread().name
+    assert all(thread != main_thread for _, _, thread in fetched)
+
+    # The pages of other packages are fetched by the same executor.
+    executor = pool._page_fetcher
+    assert executor is not None
+    assert pool.find_packages(get_dependency("bar")) == []
+    assert pool._page_fetcher is executor
+    assert len(fetched) == 4
+
+
 def test_pool_get_package_in_specified_repository() -> None:
     package = get_package("foo", "1.0.0")
     repo1 = Repository("repo1", [package])
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import base64
+import io
 import logging
 import re
 import uuid
@@ -13,8 +14,11 @@ import pytest
 import requests
 import responses
 
+from cachecontrol.caches import FileCache
+from cachecontrol.serialize import Serializer
 from cleo.io.null_io import NullIO
 from keyring.credentials import SimpleCredential
+from urllib3 import HTTPResponse
 
 from poetry.console.exceptions import PoetryRuntimeError
 from poetry.utils.authenticator import Authenticator
@@ -287,6 +291,50 @@ def test_authenticator_request_raises_exception_when_attempts_exhausted(
     assert sleep.call_count == 5
 
 
+def test_authenticator_offline_answers_from_cache_without_revalidation(
+    config: Config, http: responses.RequestsMock
+) -> None:
+    url = "https://foo.bar/simple/foo/"
+    http.get(url, body="bar")
+    # stale right away, so that it would have to be revalidated online
+    cached_response = HTTPResponse(
+        body=io.BytesIO(b"foo"),
+        headers={"Cache-Control": "max-age=0", "ETag": '"foo"'},
+        status=200,
+        preload_content=False,
+    )
+    FileCache(config.repository_cache_directory / "_default_cache" / "_http").set(
+        url,
+        Serializer().dumps(
+            requests.Request("GET", url).prepare(), cached_response, b"foo"
+        ),
+    )
+    config.merge({"offline": True})
+
+    response = Authenticator(config, NullIO()).request("get", url)
+
+    assert response.text == "foo"
+    assert len(http.calls) == 0
+
+
+def test_authenticator_offline_fails_fast_on_cache_miss(
+    mocker: MockerFixture, config: Config, http: responses.RequestsMock
+) -> None:
+    sleep = mocker.patch("time.sleep")
+    url = "https://foo.bar/simple/foo/"
+    http.get(url, body="foo")
+    config.merge({"offline": True})
+
+    with pytest.raises(PoetryRuntimeError) as e:
+        Authenticator(config, NullIO()).request("get", url)
+
+    assert str(e.value) == (
+        "Poetry is offline and there is no cached response for foo.bar/simple/foo/."
+    )
+    assert len(http.calls) == 0
+    assert sleep.call_count == 0
+
+
 def test_authenticator_request_respects_retry_header(
     mocker: MockerFixture,
     config: Config,
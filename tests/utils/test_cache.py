@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import concurrent.futures
 import shutil
+import sqlite3
+import time
 import traceback
 
 from pathlib import Path
@@ -11,10 +13,17 @@ from typing import TypeVar
 import pytest
 
 from packaging.tags import Tag
+from poetry.core.packages.package import Package
 from poetry.core.packages.utils.link import Link
 
 from poetry.utils.cache import ArtifactCache
+from poetry.utils.cache import CacheIndex
 from poetry.utils.cache import FileCache
+from poetry.utils.cache import PruneResult
+from poetry.utils.cache import SQLiteCache
+from poetry.utils.cache import get_cache
+from poetry.utils.cache import get_cache_index
+from poetry.utils.cache import get_locked_cache_entries
 from poetry.utils.env import MockEnv
 
 
@@ -177,6 +186,288 @@ def test_detect_corrupted_cache_key_file(
     assert poetry_file_cache.get("key1") is None
 
 
+def test_sqlite_cache_get_put_has_forget(repository_cache_dir: Path) -> None:
+    cache: SQLiteCache[Any] = SQLiteCache(repository_cache_dir / "cache")
+    cache.put("key1", "value")
+    cache.put("key2", {"a": ["json-encoded", "value"]})
+
+    assert cache.get("key1") == "value"
+    assert cache.get("key2") == {"a": ["json-encoded", "value"]}
+    assert cache.has("key1")
+    assert not cache.has("key3")
+    assert cache.count() == 2
+
+    cache.forget("key1")
+
+    assert not cache.has("key1")
+    assert cache.has("key2")
+
+
+def test_sqlite_cache_get_many(repository_cache_dir: Path) -> None:
+    cache: SQLiteCache[Any] = SQLiteCache(repository_cache_dir / "cache")
+    items = {f"key{i}": i for i in range(SQLiteCache.BATCH_SIZE + 10)}
+    for key, value in items.items():
+        cache.put(key, value)
+
+    assert cache.get_many([*items, "missing"]) == items
+
+
+def test_sqlite_cache_get_limited_minutes(
+    repository_cache_dir: Path, mocker: MockerFixture
+) -> None:
+    cache: SQLiteCache[Any] = SQLiteCache(repository_cache_dir / "cache")
+
+    start_time = 1111111111
+
+    mocker.patch("time.time", return_value=start_time)
+    cache.put("key1", "value", minutes=5)
+    cache.put("key2", "value")
+
+    assert cache.get("key1") is not None
+
+    mocker.patch("time.time", return_value=start_time + 5 * 60 + 1)
+    assert cache.get("key1") is None
+    assert cache.get("key2") is not None
+
+    # expired items are removed when the cache is opened
+    cache.close()
+    cache.get("key2")
+    with sqlite3.connect(cache.database) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM entries").fetchone() == (1,)
+
+
+def test_sqlite_cache_flush(repository_cache_dir: Path) -> None:
+    cache: SQLiteCache[Any] = SQLiteCache(repository_cache_dir / "cache")
+    cache.put("key1", "value")
+
+    cache.flush()
+
+    assert not cache.path.exists()
+    assert not cache.has("key1")
+
+
+def test_sqlite_cache_is_shared_between_instances(repository_cache_dir: Path) -> None:
+    cache: SQLiteCache[Any] = SQLiteCache(repository_cache_dir / "cache")
+    other_cache: SQLiteCache[Any] = SQLiteCache(repository_cache_dir / "cache")
+    cache.put("key1", "value")
+
+    assert other_cache.get("key1") == "value"
+
+    with sqlite3.connect(cache.database) as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
+
+def test_sqlite_cache_migrates_file_cache(
+    repository_cache_dir: Path, mocker: MockerFixture
+) -> None:
+    path = repository_cache_dir / "cache"
+    file_cache: FileCache[Any] = FileCache(path)
+    file_cache.put("key1", "value1")
+    file_cache.put("key2", {"a": "value2"}, minutes=5)
+    file_cache.put("expired", "value", minutes=-1)
+    # not a FileCache entry, e.g. the HTTP cache
+    (path / "_http").mkdir()
+    (path / "_http" / "entry").write_text("foo", encoding="utf-8")
+
+    cache: SQLiteCache[Any] = SQLiteCache(path)
+
+    assert cache.get_many(["key1", "key2", "expired"]) == {
+        "key1": "value1",
+        "key2": {"a": "value2"},
+    }
+    assert {p.name for p in path.iterdir() if p.is_dir()} == {"_http"}
+    assert (path / "_http" / "entry").exists()
+
+    mocker.patch("time.time", return_value=time.time() + 5 * 60 + 1)
+    assert cache.get("key2") is None
+
+
+def test_sqlite_cache_concurrent_access(repository_cache_dir: Path) -> None:
+    cache: SQLiteCache[Any] = SQLiteCache(repository_cache_dir / "cache")
+
+    def put_and_get(i: int) -> Any:
+        cache.put(f"key{i}", i)
+        return cache.get(f"key{i}")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(put_and_get, range(100)))
+
+    assert results == list(range(100))
+
+
+@pytest.mark.parametrize("backend", ["files", "sqlite"])
+def test_get_cache(repository_cache_dir: Path, backend: str) -> None:
+    cache = get_cache(repository_cache_dir / "cache", backend)
+
+    assert isinstance(cache, SQLiteCache if backend == "sqlite" else FileCache)
+
+
+def test_cache_index_records_accesses(tmp_path: Path, mocker: MockerFixture) -> None:
+    index = CacheIndex(tmp_path)
+    file_cache: FileCache[Any] = FileCache(tmp_path / "cache" / "files", index=index)
+    sqlite_cache: SQLiteCache[Any] = SQLiteCache(tmp_path / "cache" / "db", index=index)
+    artifact_cache = ArtifactCache(cache_dir=tmp_path / "artifacts", index=index)
+
+    def download(url: str, dest: Path) -> None:
+        dest.write_bytes(b"archive")
+
+    mocker.patch("time.time", return_value=1000)
+    file_cache.put("key", "value")
+    sqlite_cache.put("key", "value")
+    link = Link("https://example.org/demo-0.1.0.tar.gz")
+    archive = artifact_cache.get_cached_archive_for_link(
+        link, strict=True, download_func=download
+    )
+
+    mocker.patch("time.time", return_value=2000)
+    assert file_cache.get("key") == "value"
+    assert sqlite_cache.get("missing") is None
+    index.flush()
+
+    key_hash = "2c70e12b7a0646f92279f427c7b38e7334d8e5389cff167a1dc30e73f826b683"
+    with sqlite3.connect(index.database) as connection:
+        entries = connection.execute(
+            "SELECT path, size, accessed FROM entries ORDER BY path"
+        ).fetchall()
+    assert entries == [
+        (archive.relative_to(tmp_path).as_posix(), 7, 1000),
+        (f"cache/db/{SQLiteCache.FILENAME}/{key_hash}", len('"value"'), 1000),
+        (file_cache._path("key").relative_to(tmp_path).as_posix(), 17, 2000),
+    ]
+    assert index.size() == 7 + 7 + 17
+
+
+def test_cache_index_prune(tmp_path: Path, mocker: MockerFixture) -> None:
+    index = CacheIndex(tmp_path)
+    cache: FileCache[Any] = FileCache(tmp_path / "cache" / "repositories", index=index)
+    sqlite_cache: SQLiteCache[Any] = SQLiteCache(
+        tmp_path / "cache" / "repositories" / "db", index=index
+    )
+    for i in range(5):
+        mocker.patch("time.time", return_value=1000 + i)
+        cache.put(f"key{i}", "value")
+    mocker.patch("time.time", return_value=2000)
+    sqlite_cache.put("key", "value")
+    assert cache.get("key0") == "value"
+    # 17 bytes per file entry, 7 bytes for the database entry
+    assert index.size() == 5 * 17 + 7
+
+    result = index.prune(
+        max_size=3 * 17 + 7, protected={SQLiteCache._hash("key1")}, dry_run=True
+    )
+    assert result == PruneResult(2, 2 * 17)
+    assert all(cache._path(f"key{i}").exists() for i in range(5))
+
+    result = index.prune(max_size=3 * 17 + 7, protected={SQLiteCache._hash("key1")})
+
+    assert result == PruneResult(2, 2 * 17)
+    # (checked without using the cache, which would record accesses)
+    exists = [cache._path(f"key{i}").exists() for i in range(5)]
+    assert exists == [True, True, False, False, True]
+    assert not cache._path("key2").parent.exists()
+    assert index.last_pruned() == 2000
+
+    mocker.patch("time.time", return_value=2000 + 10)
+    result = index.prune(max_age=5, protected={SQLiteCache._hash("key1")})
+
+    assert result == PruneResult(3, 2 * 17 + 7)
+    exists = [cache._path(f"key{i}").exists() for i in range(5)]
+    assert exists == [False, True, False, False, False]
+    assert not sqlite_cache.has("key")
+
+
+def test_cache_index_prune_records_existing_entries(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    cache: FileCache[Any] = FileCache(tmp_path / "cache" / "repositories" / "files")
+    cache.put("key", "value")
+    sqlite_cache: SQLiteCache[Any] = SQLiteCache(
+        tmp_path / "cache" / "repositories" / "db"
+    )
+    sqlite_cache.put("key", "value")
+    sqlite_cache.close()
+    (tmp_path / "artifacts" / "ab").mkdir(parents=True)
+    (tmp_path / "artifacts" / "ab" / "demo-0.1.0.tar.gz").write_bytes(b"archive")
+    http_cache = tmp_path / "cache" / "repositories" / "files" / "_http"
+    http_cache.mkdir()
+    (http_cache / ("0" * 64)).write_bytes(b"response")
+    solver_cache_dir = tmp_path / "cache" / "repositories" / "_solver"
+    solver_cache: FileCache[Any] = FileCache(solver_cache_dir / "entries")
+    solver_cache.put("result", "value")
+    lock_file = solver_cache_dir / "locks" / f"{SQLiteCache._hash('result')}.lock"
+    lock_file.parent.mkdir()
+    lock_file.write_bytes(b"lock")
+
+    index = CacheIndex(tmp_path)
+    mocker.patch("time.time", return_value=time.time() + 86400)
+    result = index.prune(max_age=3600, protected={"demo-0.1.0.tar.gz"})
+
+    # the lock file of the solver cache is recorded as a separate entry
+    assert result == PruneResult(4, 17 + 7 + 17 + 4)
+    assert not solver_cache.has("result")
+    assert not lock_file.exists()
+    assert index.size() == len(b"archive")
+    assert not cache.has("key")
+    assert not sqlite_cache.has("key")
+    assert (tmp_path / "artifacts" / "ab" / "demo-0.1.0.tar.gz").exists()
+    assert (http_cache / ("0" * 64)).exists()
+
+
+def test_cache_index_prune_records_entries_created_after_previous_prune(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    # without configured limits, caches do not record their accesses
+    cache: FileCache[Any] = FileCache(tmp_path / "cache" / "repositories" / "files")
+    cache.put("key1", "value")
+    index = CacheIndex(tmp_path)
+
+    assert index.prune(max_age=3600) == PruneResult(0, 0)
+    assert index.size() == 17
+
+    cache.put("key2", "value")
+    cache.forget("key1")
+    mocker.patch("time.time", return_value=time.time() + 86400)
+    result = index.prune(max_age=3600)
+
+    assert result == PruneResult(1, 17)
+    assert not cache.has("key2")
+    assert index.size() == 0
+
+
+def test_cache_index_forget(tmp_path: Path) -> None:
+    index = CacheIndex(tmp_path)
+    cache: FileCache[Any] = FileCache(tmp_path / "cache" / "foo", index=index)
+    other_cache: FileCache[Any] = FileCache(tmp_path / "cache" / "foobar", index=index)
+    cache.put("key", "value")
+    index.flush()
+    other_cache.put("key", "value")
+
+    index.forget(tmp_path / "cache" / "foo")
+
+    assert index.size() == 17
+
+
+def test_get_cache_index_only_if_caches_are_limited(config: Config) -> None:
+    assert get_cache_index(config) is None
+    index = get_cache_index(config, required=True)
+    assert not index.database.exists()
+
+    config.merge({"cache-max-size": 1024})
+
+    assert get_cache_index(config) is index
+
+
+def test_get_locked_cache_entries() -> None:
+    package = Package("demo", "0.1.0")
+    package.files = [{"file": "demo-0.1.0.tar.gz", "hash": "sha256:abc"}]
+
+    assert get_locked_cache_entries([package]) == {
+        "demo-0.1.0.tar.gz",
+        SQLiteCache._hash("demo:0.1.0"),
+        SQLiteCache._hash("metadata:demo-0.1.0.tar.gz#sha256:abc"),
+    }
+
+
 def test_get_cache_directory_for_link(tmp_path: Path) -> None:
     cache = ArtifactCache(cache_dir=tmp_path)
     directory = cache.get_cache_directory_for_link(
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from poetry.utils import profiler
+
+
+@profiler.profiled("test.func")
+def func(value: int) -> int:
+    profiler.count("test.counter", value)
+    return value
+
+
+def test_profiler_is_inactive_by_default() -> None:
+    assert func(2) == 2
+
+
+def test_profiling_collects_timers_and_counters() -> None:
+    with profiler.profiling() as profile:
+        func(1)
+        func(2)
+        with profiler.measure("test.block"):
+            pass
+
+    assert func(3) == 3
+
+    data = profile.as_dict()
+    assert list(data["timers"]) == ["test.block", "test.func"]
+    assert data["timers"]["test.func"]["calls"] == 2
+    assert data["timers"]["test.func"]["seconds"] >= 0
+    assert data["counters"] == {"test.counter": 3}
+
+    summary = profile.summary()
+    assert summary[0] == "Timers (inclusive):"
+    assert "Counters:" in summary
+    assert summary[-1].split() == ["test.counter", "3"]
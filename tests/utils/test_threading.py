@@ -4,6 +4,7 @@ import functools
 import logging
 import os
 import sys
+import threading
 import time
 
 from concurrent.futures import wait
@@ -13,6 +14,7 @@ from typing import TYPE_CHECKING
 import pytest
 
 from poetry.utils.threading import AtomicCachedProperty
+from poetry.utils.threading import SingleFlightCache
 from poetry.utils.threading import atomic_cached_property
 
 
@@ -143,3 +145,76 @@ def test_threading_atomic_cached_property_different_instances(
 
     assert instance1.__getattribute__(property_name) == EXPECTED_VALUE + 10
     assert instance2.__getattribute__(property_name) == EXPECTED_VALUE + 20
+
+
+def test_single_flight_cache_shares_computation() -> None:
+    calls = []
+
+    def compute(key: str) -> str:
+        calls.append(key)
+        time.sleep(0.05)
+        return key.upper()
+
+    cache = SingleFlightCache(compute)
+    with ThreadPoolExecutor(max_workers=WORKER_COUNT) as executor:
+        futures = [executor.submit(cache, "a") for _ in range(WORKER_COUNT)]
+
+    assert {future.result() for future in futures} == {"A"}
+    assert cache("b") == "B"
+    assert calls == ["a", "b"]
+
+
+@pytest.mark.parametrize(
+    ("exception", "expected_calls"), [(KeyError, 1), (ValueError, 2)]
+)
+def test_single_flight_cache_exceptions(
+    exception: type[Exception], expected_calls: int
+) -> None:
+    calls = []
+
+    def compute(key: str) -> str:
+        calls.append(key)
+        raise exception(key)
+
+    cache = SingleFlightCache(compute, cache_exceptions=(KeyError,))
+    for _ in range(2):
+        with pytest.raises(exception):
+            cache("a")
+
+    assert len(calls) == expected_calls
+
+
+def test_single_flight_cache_releases_waiting_callers_on_base_exception() -> None:
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def compute(key: str) -> str:
+        calls.append(key)
+        if len(calls) == 1:
+            started.set()
+            release.wait(5)
+            raise KeyboardInterrupt
+        return key.upper()
+
+    cache = SingleFlightCache(compute)
+    interrupted = []
+
+    def owner() -> None:
+        try:
+            cache("a")
+        except KeyboardInterrupt:
+            interrupted.append(True)
+
+    owner_thread = threading.Thread(target=owner)
+    owner_thread.start()
+    assert started.wait(5)
+    # the future that all other callers of the computation wait for
+    future = cache._futures["a"]
+    release.set()
+    owner_thread.join(5)
+
+    assert interrupted == [True]
+    assert isinstance(future.exception(timeout=0), KeyboardInterrupt)
+    # The interrupted computation is not remembered.
+    assert cache("a") == "A"
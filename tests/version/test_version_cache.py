@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+from poetry.core.constraints.version import Version
+from poetry.core.version.exceptions import InvalidVersionError
+
+from poetry.version import version_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> None:
+    version_cache.cache_clear()
+
+
+VERSIONS = [
+    f"{release}{suffix}{local}"
+    for release in ["0", "1", "1.0", "1.0.0", "1.0.1", "1.2", "2!1.0", "1.0.0.0.1"]
+    for suffix in ["", "a1", "b2", "rc1", "dev1", ".post1", ".post1.dev2", "a1.dev3"]
+    for local in ["", "+abc", "+1", "+abc.2", "+1.abc", "+1.0", "+0"]
+]
+
+
+def test_parse_returns_same_object_for_same_string() -> None:
+    version = version_cache.parse("1.2.3")
+
+    assert version == Version.parse("1.2.3")
+    assert version_cache.parse("1.2.3") is version
+    assert version_cache.cache_info()["parse"].hits == 1
+
+
+def test_parse_raises_for_invalid_version() -> None:
+    with pytest.raises(InvalidVersionError):
+        version_cache.parse("not-a-version")
+
+
+def test_sort_key_orders_like_versions() -> None:
+    versions = [Version.parse(text) for text in VERSIONS]
+
+    for a, b in itertools.product(versions, versions):
+        key_a = version_cache.sort_key(a)
+        key_b = version_cache.sort_key(b)
+        assert (key_a < key_b) == (a < b), (a, b)
+        assert (key_a == key_b) == (a == b), (a, b)
+
+
+def test_sort_key_is_cached() -> None:
+    version = Version.parse("1.2.3rc1")
+
+    assert version_cache.sort_key(version) is version_cache.sort_key(version)
+    assert version_cache.cache_info()["sort_key"].hits == 1